@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the generation of sun and satellite angles."""
+from __future__ import annotations
+
+import datetime as dt
+
+
+class GeoAngleBenchmarks:
+    """Benchmark computing angles for a geostationary full disk area."""
+
+    timeout = 600
+    params = [None, 8, 16, 32]
+    param_names = ["stride"]
+
+    def setup(self, stride):
+        """Create a full disk data array without computing anything."""
+        import dask.array as da
+        import xarray as xr
+        from pyresample.geometry import AreaDefinition
+
+        area = AreaDefinition(
+            "fd", "", "",
+            {"proj": "geos", "lon_0": 0.0, "h": 35785831.0, "a": 6378169.0, "b": 6356583.8},
+            5568, 5568,
+            (-5570248.5, -5567248.1, 5567248.1, 5570248.5),
+        )
+        self.data_arr = xr.DataArray(
+            da.zeros(area.shape, chunks=1024), dims=("y", "x"),
+            attrs={
+                "area": area,
+                "start_time": dt.datetime(2023, 6, 1, 10, 0, 0),
+                "orbital_parameters": {
+                    "satellite_nominal_longitude": 0.0,
+                    "satellite_nominal_latitude": 0.0,
+                    "satellite_nominal_altitude": 35785831.0,
+                },
+            })
+
+    def time_get_angles(self, stride):
+        """Compute all sun and satellite angles."""
+        import dask.array as da
+
+        import satpy
+        from satpy.modifiers.angles import clear_angle_cache, get_angles
+
+        clear_angle_cache()
+        with satpy.config.set(angle_computation_stride=stride):
+            da.compute(*[angle.data for angle in get_angles(self.data_arr)])
+
+    def track_max_sunz_error(self, stride):
+        """Get the largest difference to the exact solar zenith angles in degrees."""
+        import numpy as np
+
+        import satpy
+        from satpy.modifiers.angles import clear_angle_cache, get_angles
+
+        clear_angle_cache()
+        exact = get_angles(self.data_arr)[3].values
+        clear_angle_cache()
+        with satpy.config.set(angle_computation_stride=stride):
+            sunz = get_angles(self.data_arr)[3].values
+        return float(np.nanmax(np.abs(sunz - exact)))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmark the NumPy and numba implementations of the CREFL correction."""
+from __future__ import annotations
+
+
+class CREFLBenchmarks:
+    """Benchmark correcting one chunk of data with CREFL."""
+
+    timeout = 600
+    params = [["viirs", "modis", "abi"], ["numpy", "numba"]]
+    param_names = ["sensor", "implementation"]
+
+    def setup(self, sensor, implementation):
+        """Create random reflectances and angles for a 2048x2048 chunk and compile the numba kernels."""
+        import numpy as np
+
+        from satpy.modifiers import _crefl_utils
+
+        rng = np.random.default_rng(42)
+        shape = (2048, 2048)
+        solar_zenith = rng.uniform(0., 85., shape)
+        sensor_zenith = rng.uniform(0., 70., shape)
+        self.refl = rng.uniform(0., 1.2, shape)
+        self.mus = np.cos(np.deg2rad(solar_zenith))
+        self.muv = np.cos(np.deg2rad(sensor_zenith))
+        self.phi = rng.uniform(-180., 180., shape)
+        self.zeniths = (solar_zenith, sensor_zenith)
+        self.sensor = sensor
+        coeffs_cls = {"viirs": _crefl_utils._VIIRSCoefficients,
+                      "modis": _crefl_utils._MODISCoefficients,
+                      "abi": _crefl_utils._ABICoefficients}[sensor]
+        self.coeffs = [lut[0] for lut in coeffs_cls.LUTS]
+        if implementation == "numba":
+            from satpy.modifiers import _crefl_numba
+            self.run_crefl, self.run_crefl_abi = _crefl_numba.run_crefl, _crefl_numba.run_crefl_abi
+            # compile before timing
+            self._run(slice(0, 2))
+        else:
+            self.run_crefl, self.run_crefl_abi = _crefl_utils._run_crefl, _crefl_utils._run_crefl_abi
+
+    def _run(self, rows=slice(None)):
+        refl, mus, muv, phi = (arr[rows] for arr in (self.refl, self.mus, self.muv, self.phi))
+        if self.sensor == "abi":
+            solar_zenith, sensor_zenith = (arr[rows] for arr in self.zeniths)
+            return self.run_crefl_abi(refl, mus, muv, phi, solar_zenith, sensor_zenith, 0., *self.coeffs)
+        return self.run_crefl(refl, mus, muv, phi, 0., self.sensor, *self.coeffs)
+
+    def time_crefl_chunk(self, sensor, implementation):
+        """Correct the reflectances of the chunk."""
+        self._run()
+
+    def peakmem_crefl_chunk(self, sensor, implementation):
+        """Get the peak memory of correcting the reflectances of the chunk."""
+        self._run()
@@ -120,3 +120,18 @@ class VIIRSSDRCompositeBenchmarks(VIIRSSDRBenchmarkBase):
         """Save a composite to disk as geotiff."""
         lscn = self.load_and_native_resample(name)
         lscn.save_dataset(name, filename="test.tif", tiled=True)
+
+
+class VIIRSSDRResampleBenchmarks(VIIRSSDRBenchmarkBase):
+    """Benchmark the task graphs of resampling VIIRS SDR data."""
+
+    params = ["I01", "M03"]
+    param_names = ["name"]
+
+    def track_ewa_rechunk_tasks(self, name):
+        """Count the rechunk tasks needed to EWA resample one channel."""
+        scn = self.load(name)
+        area = scn[name].attrs["area"].compute_optimal_bb_area()
+        lscn = scn.resample(area, resampler="ewa")
+        graph = lscn[name].data.__dask_graph__()
+        return sum(1 for key in graph.keys() if "rechunk" in str(key))
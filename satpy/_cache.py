@@ -0,0 +1,346 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2021-2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Caching of function results to on-disk zarr arrays.
+
+The cache files are managed by :mod:`satpy.cache_manager`.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import os
+import shutil
+import warnings
+from contextlib import ExitStack
+from functools import update_wrapper
+from glob import glob
+from typing import Any, Callable, Optional, Union
+
+import dask
+import xarray as xr
+import zarr
+from dask import array as da
+from pyresample.geometry import AreaDefinition, StackedAreaDefinition, SwathDefinition
+
+import satpy
+from satpy.cache_manager import atomic_cache_path, cache_lock, enforce_cache_limits, touch_cache_entry
+from satpy.utils import PerformanceWarning
+
+DEFAULT_UNCACHE_TYPES = (SwathDefinition, xr.DataArray, da.Array)
+HASHABLE_GEOMETRIES = (AreaDefinition, StackedAreaDefinition)
+# Attribute of the first zarr file of a cached function holding the number of results
+_N_RESULTS_ATTR = "satpy_cache_n_results"
+
+
+class ZarrCacheHelper:
+    """Helper for caching function results to on-disk zarr arrays.
+
+    It is recommended to use this class through the :func:`cache_to_zarr_if`
+    decorator rather than using it directly.
+
+    Cache entries are written atomically and count towards the size and age
+    limits of :mod:`satpy.cache_manager` (see the ``cache_max_size`` and
+    ``cache_max_age`` settings). Caching is based on
+    arguments passed to the decorated function but will only be performed
+    if the arguments are of a certain type (see ``uncacheable_arg_types``).
+    The cache value to use is purely based on the hash value of all of the
+    provided arguments along with the "cache version" (see below).
+
+    Note that the zarr format requires regular chunking of data. That is,
+    chunks must be all the same size per dimension except for the last chunk.
+    To work around this limitation, this class will determine a good regular
+    chunking based on the existing chunking scheme, rechunk the input
+    arguments, and then rechunk the results before returning them to the user.
+    This rechunking is only done if caching is enabled.
+
+    Args:
+        func: Function that will be called to generate the value to cache.
+        cache_config_key: Name of the boolean ``satpy.config`` parameter to
+            use to determine if caching should be done.
+        uncacheable_arg_types: Types that if present in the passed arguments
+            should trigger caching to *not* happen. By default this includes
+            ``SwathDefinition``, ``xr.DataArray``, and ``dask.array.Array`` objects.
+        sanitize_args_func: Optional function to call to sanitize provided
+            arguments before they are considered for caching. This can be used
+            to make arguments more "cacheable" by replacing them with similar
+            values that will result in more cache hits. Note that the sanitized
+            arguments are only passed to the underlying function if caching
+            will be performed, otherwise the original arguments are passed.
+        cache_version: Version number used to distinguish one version of a
+            decorated function from future versions.
+
+    Notes:
+        * Caching only supports dask array values.
+
+        * This helper allows for an additional ``cache_dir`` parameter to
+          override the use of the ``satpy.config`` ``cache_dir`` parameter.
+
+    Examples:
+        To use through the :func:`cache_to_zarr_if` decorator::
+
+            @cache_to_zarr_if("cache_my_stuff")
+            def generate_my_stuff(area_def: AreaDefinition, some_factor: int) -> da.Array:
+                # Generate
+                return my_dask_arr
+
+        To use the decorated function::
+
+            with satpy.config.set(cache_my_stuff=True):
+                my_stuff = generate_my_stuff(area_def, 5)
+
+    """
+
+    def __init__(self,
+                 func: Callable,
+                 cache_config_key: str,
+                 uncacheable_arg_types=DEFAULT_UNCACHE_TYPES,
+                 sanitize_args_func: Optional[Callable] = None,
+                 cache_version: int = 1,
+                 ):
+        """Hold on to provided arguments for future use."""
+        self._func = func
+        self._cache_config_key = cache_config_key
+        self._uncacheable_arg_types = uncacheable_arg_types
+        self._sanitize_args_func = sanitize_args_func
+        self._cache_version = cache_version
+
+    def cache_clear(self, cache_dir: Optional[str] = None):
+        """Remove all on-disk files associated with this function.
+
+        Intended to mimic the :func:`functools.cache` behavior.
+        """
+        cache_dir = self._get_cache_dir_from_config(cache_dir)
+        zarr_pattern = self._zarr_pattern("*", cache_version="*").format("*")
+        for zarr_dir in glob(os.path.join(cache_dir, zarr_pattern)):
+            shutil.rmtree(zarr_dir, ignore_errors=True)
+        for lock_file in glob(os.path.join(cache_dir, f".{zarr_pattern}.lock")):
+            os.remove(lock_file)
+
+    def _zarr_pattern(self, arg_hash, cache_version: Union[None, int, str] = None) -> str:
+        if cache_version is None:
+            cache_version = self._cache_version
+        return f"{self._func.__name__}_v{cache_version}" + "_{}_" + f"{arg_hash}.zarr"
+
+    def __call__(self, *args, cache_dir: Optional[str] = None) -> Any:
+        """Call the decorated function."""
+        should_cache: bool = satpy.config.get(self._cache_config_key, False)
+        if not should_cache:
+            return self._func(*args)
+
+        try:
+            return self._cache_and_read(args, cache_dir)
+        except TypeError as err:
+            warnings.warn("Cannot cache function because of unhashable argument: " + str(err), stacklevel=2)
+            return self._func(*args)
+
+    def _cache_and_read(self, args, cache_dir):
+        sanitized_args = self._sanitize_args_func(*args) if self._sanitize_args_func is not None else args
+
+        zarr_file_pattern = self._get_zarr_file_pattern(sanitized_args, cache_dir)
+
+        zarr_paths = _get_complete_cached_paths(zarr_file_pattern)
+        if zarr_paths is None:
+            # only one process computes the results, the others wait and read them from the cache
+            with cache_lock(zarr_file_pattern.format(0)):
+                zarr_paths = _get_complete_cached_paths(zarr_file_pattern)
+                if zarr_paths is None:
+                    self._compute_and_cache(args, sanitized_args, zarr_file_pattern)
+                    zarr_paths = _get_complete_cached_paths(zarr_file_pattern)
+
+        # if we did any caching, let's load from the zarr files, so that future calls have the same name
+        if not zarr_paths:
+            raise RuntimeError("Data was cached to disk but no files were found")
+
+        new_chunks = _get_output_chunks_from_func_arguments(args)
+        res = []
+        for zarr_path in zarr_paths:
+            touch_cache_entry(zarr_path)
+            res.append(da.from_zarr(zarr_path, chunks=new_chunks))
+        return tuple(res)
+
+    def _compute_and_cache(self, args, sanitized_args, zarr_file_pattern):
+        # use sanitized arguments
+        self._warn_if_irregular_input_chunks(args, sanitized_args)
+        res_to_cache = self._func(*(sanitized_args))
+        # remove what is left of an incomplete group, it would prevent publishing the new results
+        for zarr_path in glob(zarr_file_pattern.format("*")):
+            shutil.rmtree(zarr_path, ignore_errors=True)
+        self._cache_results(res_to_cache, zarr_file_pattern)
+        zarr_paths = [zarr_file_pattern.format(idx) for idx in range(len(res_to_cache))]
+        enforce_cache_limits(os.path.dirname(zarr_file_pattern), keep=zarr_paths)
+
+    def _get_zarr_file_pattern(self, sanitized_args, cache_dir):
+        arg_hash = _hash_args(*sanitized_args, unhashable_types=self._uncacheable_arg_types)
+        zarr_filename = self._zarr_pattern(arg_hash)
+        cache_dir = self._get_cache_dir_from_config(cache_dir)
+        return os.path.join(cache_dir, zarr_filename)
+
+    @staticmethod
+    def _get_cache_dir_from_config(cache_dir: Optional[str]) -> str:
+        cache_dir = cache_dir or satpy.config.get("cache_dir")
+        if cache_dir is None:
+            raise RuntimeError("Can't use zarr caching. No 'cache_dir' configured.")
+        return cache_dir
+
+    @staticmethod
+    def _warn_if_irregular_input_chunks(args, modified_args):
+        arg_chunks = _get_output_chunks_from_func_arguments(args)
+        new_chunks = _get_output_chunks_from_func_arguments(modified_args)
+        if _chunks_are_irregular(arg_chunks):
+            warnings.warn(
+                "Calling cached function with irregular dask chunks. The data "
+                "has been rechunked for caching, but this is not optimal for "
+                "future calculations. "
+                f"Original chunks: {arg_chunks}; New chunks: {new_chunks}",
+                PerformanceWarning,
+                stacklevel=3
+            )
+
+    def _cache_results(self, res, zarr_file_pattern):
+        os.makedirs(os.path.dirname(zarr_file_pattern), exist_ok=True)
+        with ExitStack() as stack:
+            new_res = []
+            tmp_zarr_paths = []
+            for idx, sub_res in enumerate(res):
+                if not isinstance(sub_res, da.Array):
+                    raise ValueError("Zarr caching currently only supports dask "
+                                     f"arrays. Got {type(sub_res)}")
+                zarr_path = zarr_file_pattern.format(idx)
+                tmp_zarr_path = stack.enter_context(atomic_cache_path(zarr_path))
+                tmp_zarr_paths.append(tmp_zarr_path)
+                # See https://github.com/dask/dask/issues/8380
+                with dask.config.set({"optimization.fuse.active": False}):
+                    new_sub_res = sub_res.to_zarr(tmp_zarr_path, compute=False)
+                new_res.append(new_sub_res)
+            # actually compute the storage to zarr
+            da.compute(new_res)
+            # the first result is published last, so all results are complete once it exists
+            first_zarr = zarr.open_array(tmp_zarr_paths[0], mode="r+")
+            first_zarr.attrs[_N_RESULTS_ATTR] = len(new_res)
+
+
+def _get_complete_cached_paths(zarr_file_pattern):
+    """Get the paths of all cached results, or ``None`` if they are missing or incomplete."""
+    zarr_paths = sorted(glob(zarr_file_pattern.format("*")))
+    if not zarr_paths:
+        return None
+    try:
+        n_results = zarr.open_array(zarr_file_pattern.format(0), mode="r").attrs.get(_N_RESULTS_ATTR)
+    except (ValueError, OSError, KeyError):
+        n_results = None
+    if n_results != len(zarr_paths):
+        return None
+    return zarr_paths
+
+
+def _get_output_chunks_from_func_arguments(args):
+    """Determine what the desired output chunks are.
+
+    It is assumed a tuple of tuples of integers is defining chunk sizes. If
+    a tuple like this is not found then arguments are checked for array-like
+    objects with a ``.chunks`` attribute.
+
+    """
+    chunked_args = [arg for arg in args if hasattr(arg, "chunks")]
+    tuple_args = [arg for arg in args if _is_chunk_tuple(arg)]
+    if not tuple_args and not chunked_args:
+        raise RuntimeError("Cannot determine desired output chunksize for cached function.")
+    new_chunks = tuple_args[-1] if tuple_args else chunked_args[0].chunks
+    return new_chunks
+
+
+def cache_to_zarr_if(
+        cache_config_key: str,
+        uncacheable_arg_types=DEFAULT_UNCACHE_TYPES,
+        sanitize_args_func: Optional[Callable] = None,
+) -> Callable:
+    """Decorate a function and cache the results as a zarr array on disk.
+
+    This only happens if the ``satpy.config`` boolean value for the provided
+    key is ``True`` as well as some other conditions. See
+    :class:`ZarrCacheHelper` for more information. Most importantly, this
+    decorator does not limit how many items can be cached and does not clear
+    out old entries. It is up to the user to manage the size of the cache.
+
+    """
+
+    def _decorator(func: Callable) -> Callable:
+        zarr_cacher = ZarrCacheHelper(func,
+                                      cache_config_key,
+                                      uncacheable_arg_types,
+                                      sanitize_args_func)
+        wrapper = update_wrapper(zarr_cacher, func)
+        return wrapper
+
+    return _decorator
+
+
+def _hash_args(*args, unhashable_types=DEFAULT_UNCACHE_TYPES):
+    import json
+    hashable_args = []
+    for arg in args:
+        if isinstance(arg, unhashable_types):
+            raise TypeError(f"Unhashable type ({type(arg)}).")
+        if isinstance(arg, HASHABLE_GEOMETRIES):
+            arg = hash(arg)
+        elif isinstance(arg, dt.datetime):
+            arg = arg.isoformat(" ")
+        hashable_args.append(arg)
+    arg_hash = hashlib.sha1()  # nosec
+    arg_hash.update(json.dumps(tuple(hashable_args)).encode("utf8"))
+    return arg_hash.hexdigest()
+
+
+def _sanitize_args_with_chunks(*args):
+    new_args = []
+    for arg in args:
+        if _is_chunk_tuple(arg) and _chunks_are_irregular(arg):
+            new_chunks = _regular_chunks_from_irregular_chunks(arg)
+            new_args.append(new_chunks)
+        else:
+            new_args.append(arg)
+    return new_args
+
+
+def _is_chunk_tuple(some_obj: Any) -> bool:
+    if not isinstance(some_obj, tuple):
+        return False
+    if not all(isinstance(sub_obj, tuple) for sub_obj in some_obj):
+        return False
+    sub_elements = [sub_obj_elem for sub_obj in some_obj for sub_obj_elem in sub_obj]
+    return all(isinstance(sub_obj_elem, int) for sub_obj_elem in sub_elements)
+
+
+def _regular_chunks_from_irregular_chunks(
+        old_chunks: tuple[tuple[int, ...], ...]
+) -> tuple[tuple[int, ...], ...]:
+    shape = tuple(sum(dim_chunks) for dim_chunks in old_chunks)
+    new_dim_chunks = tuple(max(dim_chunks) for dim_chunks in old_chunks)
+    return da.core.normalize_chunks(new_dim_chunks, shape=shape)
+
+
+def _chunks_are_irregular(chunks_tuple: tuple) -> bool:
+    """Determine if an array is irregularly chunked.
+
+    Zarr does not support saving data in irregular chunks. Regular chunking
+    is when all chunks are the same size (except for the last one).
+
+    """
+    if any(len(set(chunks[:-1])) > 1 for chunks in chunks_tuple):
+        return True
+    return any(chunks[-1] > chunks[0] for chunks in chunks_tuple)
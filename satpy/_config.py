@@ -43,16 +43,27 @@ PACKAGE_CONFIG_PATH = os.path.join(BASE_PATH, "etc")
 _satpy_dirs = AppDirs(appname="satpy", appauthor="pytroll")
 _CONFIG_DEFAULTS = {
     "tmp_dir": tempfile.gettempdir(),
+    "angle_computation_stride": None,
+    "angle_dtype": "float64",
+    "angle_interpolation_tolerance": 0.05,
+    "angle_memory_cache_size": 32,
     "cache_dir": _satpy_dirs.user_cache_dir,
+    "cache_max_size": None,
+    "cache_max_age": None,
+    "cache_cos_sza": False,
+    "cache_crefl_elevation": False,
     "cache_lonlats": False,
     "cache_sensor_angles": False,
     "config_path": [],
     "data_dir": _satpy_dirs.user_data_dir,
     "demo_data_dir": ".",
     "download_aux": True,
+    "resampler_cache_size": 0,
     "sensor_angles_position_preference": "actual",
     "readers": {
         "clip_negative_radiances": False,
+        "cache_interpolated_navigation": False,
+        "cache_grib_index": False,
     },
 }
 
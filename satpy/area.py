@@ -15,8 +15,16 @@
 # You should have received a copy of the GNU General Public License along with
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Utility functions for area definitions."""
+from collections import OrderedDict
+
 from ._config import config_search_paths, get_config_path
 
+AREA_SLICES_CACHE_SIZE = 128
+# (source area, area to cover, shape_divisible_by) -> slices or _NO_AREA_SLICES
+_area_slices_cache: "OrderedDict[tuple, object]" = OrderedDict()
+# cached when the slices can't be determined, a new error is raised on every hit
+_NO_AREA_SLICES = object()
+
 
 def get_area_file():
     """Find area file(s) to use.
@@ -41,3 +49,57 @@ def get_area_def(area_name):
     except ImportError:
         from pyresample.utils import parse_area_file
     return parse_area_file(get_area_file(), area_name)[0]
+
+
+def get_area_slices(source_area, area_to_cover, shape_divisible_by=None):
+    """Get the slices of *source_area* covering *area_to_cover*, reusing earlier results.
+
+    This calls :meth:`pyresample.geometry.AreaDefinition.get_area_slices` and
+    keeps the results of the last :data:`AREA_SLICES_CACHE_SIZE` calls in
+    memory. Area definitions are looked up by their projection, extent and
+    shape, so matching areas of different Scenes share the results. Other
+    geometries, like swaths, are not cached as comparing them could require
+    their longitudes and latitudes.
+
+    Returns:
+        Tuple of the x and y slices.
+
+    Raises:
+        NotImplementedError: If the slices can't be determined, for example
+            because the areas don't overlap.
+
+    """
+    from pyresample.geometry import AreaDefinition
+
+    if not isinstance(source_area, AreaDefinition) or not isinstance(area_to_cover, AreaDefinition):
+        return _get_area_slices(source_area, area_to_cover, shape_divisible_by)
+    key = (source_area, area_to_cover, shape_divisible_by)
+    try:
+        result = _area_slices_cache[key]
+    except KeyError:
+        try:
+            result = _get_area_slices(source_area, area_to_cover, shape_divisible_by)
+        except NotImplementedError:
+            _add_area_slices(key, _NO_AREA_SLICES)
+            raise
+        _add_area_slices(key, result)
+        return result
+    _area_slices_cache.move_to_end(key)
+    if result is _NO_AREA_SLICES:
+        raise NotImplementedError("Source area does not cover the area to cover.")
+    return result
+
+
+def _add_area_slices(key, result):
+    _area_slices_cache[key] = result
+    while len(_area_slices_cache) > AREA_SLICES_CACHE_SIZE:
+        _area_slices_cache.popitem(last=False)
+
+
+def _get_area_slices(source_area, area_to_cover, shape_divisible_by):
+    if shape_divisible_by is None:
+        return source_area.get_area_slices(area_to_cover)
+    try:
+        return source_area.get_area_slices(area_to_cover, shape_divisible_by=shape_divisible_by)
+    except TypeError:
+        return source_area.get_area_slices(area_to_cover)
@@ -0,0 +1,435 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Management of the on-disk cache in Satpy's ``cache_dir``.
+
+The zarr arrays stored at the top level of a cache directory (resampling
+look-up tables, cached angles, lon/lats and interpolated navigation) are the
+managed cache entries. Every time an entry is used its modification time is
+updated, so that entries can be evicted in least recently used order once the
+cache grows larger than ``cache_max_size`` or entries get older than
+``cache_max_age``. See :ref:`config_cache_max_size_setting` for more
+information. Functions cached with several results store them as
+``<name>_<index>_<hash>.zarr``; these files form one entry and are always
+evicted together.
+
+New entries are written to a temporary path next to their final location and
+renamed when complete, so other processes never read partially written
+entries. Writers also hold an inter-process file lock per entry while they
+compute it (see :func:`cache_lock`), so when several processes need the same
+missing entry only the first one computes it and the others load it from disk
+once it is published. Existing entries are read without taking the lock (see
+:func:`cache_lock_if_missing`).
+
+The cache can be inspected and pruned from the command line with the
+``satpy_cache`` script.
+
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+from contextlib import contextmanager, nullcontext, suppress
+from fnmatch import fnmatch
+from typing import NamedTuple
+
+import satpy
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+LOG = logging.getLogger(__name__)
+
+MANAGED_PATTERNS = ("*.zarr",)
+_TMP_MARKER = ".tmp-"
+_LOCK_SUFFIX = ".lock"
+# temporary entries and lock files are removed when they are older than this
+STALE_TMP_AGE = 24 * 3600
+# several results of one cached function, see satpy._cache.ZarrCacheHelper
+_GROUP_MEMBER_REGEX = re.compile(r"^(?P<name>.+)_\d+_(?P<hash>[0-9a-f]+\.zarr)$")
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+class CacheEntry(NamedTuple):
+    """Entry of the on-disk cache.
+
+    ``paths`` holds all files of the entry, ``path`` is the first of them.
+    """
+
+    path: str
+    size: int
+    last_access: float
+    paths: tuple[str, ...]
+
+
+def list_cache_entries(cache_dir=None):
+    """Get the managed entries of a cache directory.
+
+    Args:
+        cache_dir: Cache directory to inspect. Defaults to the ``cache_dir``
+            of ``satpy.config``.
+
+    Returns:
+        List of :class:`CacheEntry` sorted from least to most recently used.
+
+    """
+    cache_dir = _get_cache_dir(cache_dir)
+    groups = {}
+    for path in sorted(_scan_cache_dir(cache_dir)):
+        name = os.path.basename(path)
+        if name.startswith(".") or not any(fnmatch(name, pattern) for pattern in MANAGED_PATTERNS):
+            continue
+        try:
+            member = (path, _get_size(path), os.stat(path).st_mtime)
+        except FileNotFoundError:
+            # removed by another process in the meantime
+            continue
+        groups.setdefault(_get_group_key(name), []).append(member)
+    entries = [CacheEntry(members[0][0],
+                          sum(size for _, size, _ in members),
+                          max(last_access for _, _, last_access in members),
+                          tuple(path for path, _, _ in members))
+               for members in groups.values()]
+    return sorted(entries, key=lambda entry: entry.last_access)
+
+
+def _get_group_key(name):
+    match = _GROUP_MEMBER_REGEX.match(name)
+    if match is None:
+        return name
+    return match["name"], match["hash"]
+
+
+def _get_cache_dir(cache_dir):
+    cache_dir = cache_dir or satpy.config.get("cache_dir")
+    if cache_dir is None:
+        raise RuntimeError("No 'cache_dir' configured.")
+    return cache_dir
+
+
+def _scan_cache_dir(cache_dir):
+    try:
+        with os.scandir(cache_dir) as dir_entries:
+            return [dir_entry.path for dir_entry in dir_entries]
+    except FileNotFoundError:
+        return []
+
+
+def _get_size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    size = 0
+    for root, _, files in os.walk(path):
+        for filename in files:
+            try:
+                size += os.path.getsize(os.path.join(root, filename))
+            except FileNotFoundError:
+                continue
+    return size
+
+
+def touch_cache_entry(path):
+    """Mark a cache entry as used now."""
+    try:
+        os.utime(path)
+    except OSError as err:
+        LOG.debug("Could not update access time of %s: %s", path, err)
+
+
+@contextmanager
+def atomic_cache_path(path):
+    """Get a temporary path to write a cache entry to and publish it when done.
+
+    The entry is written to a hidden temporary path in the same directory and
+    renamed to *path* when the ``with`` block finishes without errors. If
+    another process published the same entry in the meantime, the new copy is
+    discarded. On errors the temporary entry is removed.
+
+    Args:
+        path: Final path of the cache entry.
+
+    Yields:
+        Temporary path to write the entry to.
+
+    """
+    dirname, basename = os.path.split(path)
+    os.makedirs(dirname or ".", exist_ok=True)
+    tmp_path = os.path.join(dirname, f".{basename}{_TMP_MARKER}{uuid.uuid4().hex}")
+    try:
+        yield tmp_path
+        _publish(tmp_path, path)
+    finally:
+        _remove(tmp_path)
+
+
+@contextmanager
+def cache_lock(path):
+    """Hold an exclusive inter-process lock for creating the cache entry *path*.
+
+    The lock is a hidden file next to the entry. Processes and threads asking
+    for the lock of the same entry wait until the current holder releases it.
+    Callers should check if the entry exists after acquiring the lock, as
+    another process may have created it while they were waiting.
+
+    Args:
+        path: Path of the cache entry to lock.
+
+    """
+    dirname, basename = os.path.split(path)
+    os.makedirs(dirname or ".", exist_ok=True)
+    lock_path = os.path.join(dirname, f".{basename}{_LOCK_SUFFIX}")
+    with open(lock_path, "a") as lock_file:
+        _lock_file(lock_file)
+        try:
+            yield
+        finally:
+            _unlock_file(lock_file)
+
+
+def cache_lock_if_missing(path):
+    """Get the lock of the cache entry *path* if the entry doesn't exist yet.
+
+    Existing entries are read without waiting for the lock. As with
+    :func:`cache_lock`, callers should check if the entry exists after
+    acquiring the lock.
+
+    """
+    if os.path.exists(path):
+        return nullcontext()
+    return cache_lock(path)
+
+
+def _lock_file(lock_file):
+    LOG.debug("Acquiring cache lock %s", lock_file.name)
+    if os.name == "nt":
+        lock_file.seek(0)
+        while True:
+            try:
+                # LK_LOCK gives up with an error after trying for 10 seconds
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+
+def _try_lock_file(lock_file):
+    """Acquire the lock without waiting, return False if another holder has it."""
+    try:
+        if os.name == "nt":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock_file(lock_file):
+    if os.name == "nt":
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _publish(tmp_path, path):
+    if not os.path.exists(tmp_path):
+        LOG.debug("Nothing was written for cache entry %s", path)
+        return
+    try:
+        os.rename(tmp_path, path)
+    except OSError:
+        if not os.path.exists(path):
+            raise
+        LOG.debug("Cache entry %s was already created by another process", path)
+        return
+    touch_cache_entry(path)
+
+
+def _remove(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def prune_cache(cache_dir=None, max_size=None, max_age=None, dry_run=False, keep=()):
+    """Remove cache entries to keep the cache within size and age limits.
+
+    Entries not used for more than *max_age* seconds are removed first. Then
+    the least recently used entries are removed until the total size of the
+    remaining entries is at most *max_size*. Temporary entries left behind by
+    interrupted writes and old lock files nobody holds are removed as well.
+
+    Args:
+        cache_dir: Cache directory to prune. Defaults to the ``cache_dir`` of
+            ``satpy.config``.
+        max_size: Maximum total size of the cache entries in bytes, or a
+            string like ``"10G"``. ``None`` means no size limit.
+        max_age: Maximum time in seconds since an entry was last used.
+            ``None`` means no age limit.
+        dry_run: Only return the entries that would be removed.
+        keep: Paths of cache entries that must not be removed, for example
+            the entry that was just written. Their size still counts towards
+            *max_size*.
+
+    Returns:
+        List of the removed :class:`CacheEntry` objects.
+
+    """
+    cache_dir = _get_cache_dir(cache_dir)
+    now = time.time()
+    entries = list_cache_entries(cache_dir)
+    keep = {os.path.abspath(path) for path in keep}
+    removable = [entry for entry in entries if keep.isdisjoint(map(os.path.abspath, entry.paths))]
+    to_remove = []
+    if max_age is not None:
+        to_remove = [entry for entry in removable if now - entry.last_access > float(max_age)]
+        removable = [entry for entry in removable if entry not in to_remove]
+    if max_size is not None:
+        max_size = parse_size(max_size)
+        total_size = sum(entry.size for entry in entries if entry not in to_remove)
+        for entry in removable:
+            if total_size <= max_size:
+                break
+            to_remove.append(entry)
+            total_size -= entry.size
+
+    if not dry_run:
+        for entry in to_remove:
+            LOG.debug("Removing cache entry %s", entry.path)
+            # the first file marks a group as complete, so it goes first
+            for path in entry.paths:
+                _remove(path)
+        _remove_stale_tmp_entries(cache_dir, now)
+    return to_remove
+
+
+def _remove_stale_tmp_entries(cache_dir, now):
+    for path in _scan_cache_dir(cache_dir):
+        name = os.path.basename(path)
+        if _TMP_MARKER not in name and not name.endswith(_LOCK_SUFFIX):
+            continue
+        try:
+            if now - os.stat(path).st_mtime <= STALE_TMP_AGE:
+                continue
+        except FileNotFoundError:
+            continue
+        if name.endswith(_LOCK_SUFFIX):
+            _remove_unused_lock_file(path)
+        else:
+            _remove(path)
+
+
+def _remove_unused_lock_file(path):
+    """Remove a lock file unless a process holds the lock, and so may have others waiting for it."""
+    with open(path, "a") as lock_file:
+        if not _try_lock_file(lock_file):
+            LOG.debug("Keeping lock file %s in use", path)
+            return
+        try:
+            if os.name != "nt":
+                # processes only wait for held locks, so nobody is waiting for this one
+                _remove(path)
+        finally:
+            _unlock_file(lock_file)
+    if os.name == "nt":
+        # open files can't be removed on Windows
+        with suppress(OSError):
+            os.remove(path)
+
+
+def enforce_cache_limits(cache_dir=None, keep=()):
+    """Prune a cache directory with the ``cache_max_size`` and ``cache_max_age`` settings.
+
+    Nothing is removed if neither setting is configured. The entries in
+    *keep* are never removed, see :func:`prune_cache`.
+
+    """
+    max_size = satpy.config.get("cache_max_size", None)
+    max_age = satpy.config.get("cache_max_age", None)
+    if max_size is None and max_age is None:
+        return []
+    return prune_cache(cache_dir, max_size=max_size, max_age=max_age, keep=keep)
+
+
+def parse_size(size):
+    """Convert a size like ``1024``, ``"500M"`` or ``"10GB"`` to a number of bytes."""
+    if isinstance(size, (int, float)):
+        return int(size)
+    size = size.strip().upper().removesuffix("B").removesuffix("I")
+    unit = size[-1:] if size[-1:] in _SIZE_UNITS else ""
+    return int(float(size[:len(size) - len(unit)]) * _SIZE_UNITS[unit])
+
+
+def _format_size(size):
+    for unit in ("", "K", "M", "G"):
+        if size < 1024:
+            return f"{size:.1f}{unit}B" if unit else f"{size}B"
+        size /= 1024
+    return f"{size:.1f}TB"
+
+
+def cache_cmd(argv=None):
+    """Inspect or prune the on-disk cache from the console script 'satpy_cache'."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Inspect or prune the Satpy on-disk cache.")
+    parser.add_argument("--cache-dir",
+                        help="Cache directory to manage. Defaults to the "
+                             "'cache_dir' configured for Satpy.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List cache entries from least to most recently used.")
+    prune_parser = subparsers.add_parser("prune", help="Remove cache entries exceeding the limits.")
+    prune_parser.add_argument("--max-size",
+                              help="Maximum total size of the cache (ex. 500M, 10G). "
+                                   "Defaults to the 'cache_max_size' setting.")
+    prune_parser.add_argument("--max-age", type=float,
+                              help="Maximum time in seconds since an entry was last "
+                                   "used. Defaults to the 'cache_max_age' setting.")
+    prune_parser.add_argument("--dry-run", action="store_true",
+                              help="Only print the entries that would be removed.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == "list":
+        entries = list_cache_entries(args.cache_dir)
+        for entry in entries:
+            last_access = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry.last_access))
+            LOG.info("%s  %9s  %s", last_access, _format_size(entry.size), entry.path)
+        LOG.info("%d entries, %s in total", len(entries), _format_size(sum(entry.size for entry in entries)))
+        return
+
+    max_size = args.max_size if args.max_size is not None else satpy.config.get("cache_max_size", None)
+    max_age = args.max_age if args.max_age is not None else satpy.config.get("cache_max_age", None)
+    removed = prune_cache(args.cache_dir, max_size=max_size, max_age=max_age, dry_run=args.dry_run)
+    action = "Would remove" if args.dry_run else "Removed"
+    for entry in removed:
+        LOG.info("%s %s (%s)", action, entry.path, _format_size(entry.size))
+    LOG.info("%s %d entries, %s in total", action, len(removed), _format_size(sum(entry.size for entry in removed)))
@@ -17,12 +17,21 @@
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Classes related to the CREFL (corrected reflectance) modifier."""
 
+import hashlib
+import json
 import logging
+import os
 import warnings
+from functools import lru_cache
 
+import dask.array as da
 import numpy as np
+from pyresample.geometry import AreaDefinition
 
+import satpy
+from satpy._cache import _sanitize_args_with_chunks, cache_to_zarr_if
 from satpy.aux_download import DataDownloadMixin, retrieve
+from satpy.cache_manager import atomic_cache_path, cache_lock
 from satpy.modifiers import ModifierBase
 from satpy.modifiers.angles import get_angles
 
@@ -86,24 +95,22 @@ class ReflectanceCorrector(ModifierBase, DataDownloadMixin):
 
     def _call_crefl(self, refl_data, angles):
         from satpy.modifiers._crefl_utils import run_crefl
-        avg_elevation = self._get_average_elevation()
+        height = self._get_height(refl_data)
         results = run_crefl(refl_data,
                             *angles,
-                            avg_elevation=avg_elevation,
+                            height=height,
                             )
         return results
 
-    def _get_average_elevation(self):
+    def _get_height(self, refl_data):
+        """Get the surface height of every pixel, None if there is no DEM."""
         if self.dem_cache_key is None:
-            return
-
-        LOG.debug("Loading CREFL averaged elevation information from: %s",
-                  self.dem_cache_key)
+            return None
         local_filename = retrieve(self.dem_cache_key)
-        avg_elevation = self._read_var_from_hdf4_file(local_filename, self.dem_sds).astype(np.float64)
-        if isinstance(avg_elevation, np.ma.MaskedArray):
-            avg_elevation = avg_elevation.filled(np.nan)
-        return avg_elevation
+        area = refl_data.attrs["area"]
+        if isinstance(area, AreaDefinition):
+            return _get_area_height(area, refl_data.chunks, local_filename, self.dem_sds)[0]
+        return _get_height_from_dem(area, refl_data.chunks, local_filename, self.dem_sds)[0]
 
     @staticmethod
     def _read_var_from_hdf4_file(local_filename, var_name):
@@ -151,3 +158,64 @@ class ReflectanceCorrector(ModifierBase, DataDownloadMixin):
         raise ValueError("Not sure how to handle provided dependencies. "
                          "Either all 4 angles must be provided or none of "
                          "of them.")
+
+
+@lru_cache(maxsize=2)
+def _load_average_elevation(local_filename, var_name):
+    """Load the average elevation of a DEM file once per process.
+
+    On first use the elevation is converted to an uncompressed ``.npy`` file
+    in ``cache_dir``, which is memory-mapped instead of reading the HDF4 file
+    again in every process. If that's not possible the elevation is kept in
+    memory.
+
+    """
+    npy_filename = _get_dem_cache_filename(local_filename, var_name)
+    try:
+        if not os.path.exists(npy_filename):
+            with cache_lock(npy_filename):
+                if not os.path.exists(npy_filename):
+                    _convert_dem_to_npy(local_filename, var_name, npy_filename)
+        return np.load(npy_filename, mmap_mode="r")
+    except OSError as err:
+        LOG.debug("Could not cache the elevation in %s: %s", npy_filename, err)
+        return _read_average_elevation(local_filename, var_name)
+
+
+def _get_dem_cache_filename(local_filename, var_name):
+    file_stat = os.stat(local_filename)
+    dem_id = [os.path.abspath(local_filename), var_name, file_stat.st_size, file_stat.st_mtime]
+    dem_hash = hashlib.sha1(json.dumps(dem_id).encode("utf8")).hexdigest()  # nosec
+    return os.path.join(satpy.config.get("cache_dir"), f"crefl_dem_{dem_hash}.npy")
+
+
+def _convert_dem_to_npy(local_filename, var_name, npy_filename):
+    avg_elevation = _read_average_elevation(local_filename, var_name)
+    LOG.debug("Saving CREFL averaged elevation to %s", npy_filename)
+    with atomic_cache_path(npy_filename) as tmp_filename, open(tmp_filename, "wb") as npy_file:
+        np.save(npy_file, avg_elevation)
+
+
+def _read_average_elevation(local_filename, var_name):
+    LOG.debug("Loading CREFL averaged elevation information from: %s", local_filename)
+    # the elevation is stored as integers in metres, float32 represents them exactly
+    avg_elevation = ReflectanceCorrector._read_var_from_hdf4_file(local_filename, var_name).astype(np.float32)
+    if isinstance(avg_elevation, np.ma.MaskedArray):
+        avg_elevation = avg_elevation.filled(np.nan)
+    return avg_elevation
+
+
+def _get_height_from_dem(area, chunks, local_filename, var_name):
+    """Get the surface height in metres of every pixel of *area* from a DEM file."""
+    from satpy.modifiers._crefl_utils import _space_mask_height
+    avg_elevation = _load_average_elevation(local_filename, var_name)
+    lon, lat = area.get_lonlats(chunks=chunks)
+    height = da.map_blocks(_space_mask_height, lon, lat, avg_elevation,
+                           chunks=lon.chunks, dtype=avg_elevation.dtype)
+    return (height,)
+
+
+@cache_to_zarr_if("cache_crefl_elevation", sanitize_args_func=_sanitize_args_with_chunks)
+def _get_area_height(area, chunks, local_filename, var_name):
+    """Get the surface height of an area, cached on disk when ``cache_crefl_elevation`` is enabled."""
+    return _get_height_from_dem(area, chunks, local_filename, var_name)
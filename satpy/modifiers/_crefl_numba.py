@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Numba implementation of the CREFL correction.
+
+The functions in this module compute the same correction as the NumPy
+implementation in :mod:`satpy.modifiers._crefl_utils`, but pixel by pixel in
+a single pass over a chunk of data, without allocating any full size
+temporary arrays. They are used automatically when numba is installed.
+
+"""
+
+import numba
+import numpy as np
+
+from satpy.modifiers._crefl_utils import (
+    MAXAIRMASS,
+    REFLMAX,
+    REFLMIN,
+    SCALEHEIGHT,
+    TAUSTEP4SPHALB,
+    TAUSTEP4SPHALB_ABI,
+    UH2O_MODIS,
+    UH2O_VIIRS,
+    UO3_MODIS,
+    UO3_VIIRS,
+    _G_calc,
+    _spherical_albedo_table,
+)
+
+_A_O3_ABI = (268.45, 0.5, 115.42, -3.2922)
+_A_H2O_ABI = (0.0311, 0.1, 92.471, -1.3814)
+_A_O2_ABI = (0.4567, 0.007, 96.4884, -1.6970)
+
+_XFD = 0.958725775
+_XBETA2 = 0.5
+_AS0 = (0.33243832, 0.16285370, -0.30924818, -0.10324388, 0.11493334,
+        -6.777104e-02, 1.577425e-03, -1.240906e-02, 3.241678e-02, -3.503695e-02)
+_AS1 = (0.19666292, -5.439061e-02)
+_AS2 = (0.14545937, -2.910845e-02)
+
+_G_calc_pixel = numba.njit(_G_calc)
+
+
+def run_crefl(refl, mus, muv, phi, height, sensor_name, *coeffs):
+    """Run the VIIRS or MODIS CREFL correction on one chunk of data.
+
+    Takes the same arguments as :func:`satpy.modifiers._crefl_utils._run_crefl`.
+
+    """
+    is_viirs = sensor_name.lower() == "viirs"
+    ah2o, bh2o, ao3, tau = (float(coeff) for coeff in coeffs)
+    out = np.empty(refl.shape, dtype=refl.dtype)
+    _crefl_viirs_modis(out, refl, mus, muv, phi, np.broadcast_to(height, refl.shape),
+                       is_viirs, ah2o, bh2o, ao3, tau, _spherical_albedo_table(TAUSTEP4SPHALB))
+    return out
+
+
+def run_crefl_abi(refl, mus, muv, phi, solar_zenith, sensor_zenith, height, *coeffs):
+    """Run the ABI CREFL correction on one chunk of data.
+
+    Takes the same arguments as :func:`satpy.modifiers._crefl_utils._run_crefl_abi`.
+
+    """
+    ah2o, ao2, ao3, tau = (float(coeff) for coeff in coeffs)
+    out = np.empty(refl.shape, dtype=refl.dtype)
+    _crefl_abi(out, refl, mus, muv, phi, solar_zenith, sensor_zenith, np.broadcast_to(height, refl.shape),
+               ah2o, ao2, ao3, tau, _spherical_albedo_table(TAUSTEP4SPHALB_ABI))
+    return out
+
+
+@numba.njit
+def _crefl_viirs_modis(out, refl, mus, muv, phi, height, is_viirs, ah2o, bh2o, ao3, tau, sphalb0):
+    for row in range(refl.shape[0]):
+        for col in range(refl.shape[1]):
+            pix_mus = mus[row, col]
+            pix_muv = muv[row, col]
+            air_mass = 1.0 / pix_mus + 1 / pix_muv
+            if air_mass > MAXAIRMASS:
+                air_mass = -1.0
+            if is_viirs:
+                t_o3 = 1.0 if ao3 == 0 else np.exp(-air_mass * UO3_VIIRS * ao3)
+                t_h2o = 1.0 if bh2o == 0 else np.exp(-(ah2o * ((air_mass * UH2O_VIIRS) ** bh2o)))
+            else:
+                t_o3 = 1.0 if ao3 == 0 else np.exp(-air_mass * UO3_MODIS * ao3)
+                t_h2o = 1.0 if bh2o == 0 else np.exp(-np.exp(ah2o + bh2o * np.log(air_mass * UH2O_MODIS)))
+            out[row, col] = _correct_pixel(refl[row, col], pix_mus, pix_muv, phi[row, col], height[row, col],
+                                           tau, t_o3, t_h2o, TAUSTEP4SPHALB, sphalb0)
+
+
+@numba.njit
+def _crefl_abi(out, refl, mus, muv, phi, solar_zenith, sensor_zenith, height, ah2o, ao2, ao3, tau, sphalb0):
+    for row in range(refl.shape[0]):
+        for col in range(refl.shape[1]):
+            sunz = solar_zenith[row, col]
+            satz = sensor_zenith[row, col]
+            g_o3 = _G_calc_pixel(sunz, _A_O3_ABI) + _G_calc_pixel(satz, _A_O3_ABI)
+            g_h2o = _G_calc_pixel(sunz, _A_H2O_ABI) + _G_calc_pixel(satz, _A_H2O_ABI)
+            g_o2 = _G_calc_pixel(sunz, _A_O2_ABI) + _G_calc_pixel(satz, _A_O2_ABI)
+            t_o2 = np.exp(-g_o2 * ao2)
+            t_o3 = np.exp(-g_o3 * ao3) if ao3 != 0 else 1.0
+            t_h2o = np.exp(-g_h2o * ah2o) if ah2o != 0 else 1.0
+            out[row, col] = _correct_pixel(refl[row, col], mus[row, col], muv[row, col], phi[row, col],
+                                           height[row, col], tau, t_o3 * t_o2, t_h2o, TAUSTEP4SPHALB_ABI, sphalb0)
+
+
+@numba.njit
+def _correct_pixel(refl, mus, muv, phi, height, tau, t_og, t_h2o, taustep, sphalb0):
+    taur = tau * np.exp(-height / SCALEHEIGHT)
+    rhoray, trdown, trup = _chand_pixel(phi, muv, mus, taur)
+    sphalb = sphalb0[int(taur / taustep + 0.5)]
+    ttotrayu = ((2 / 3. + muv) + (2 / 3. - muv) * trup) / (4 / 3. + taur)
+    ttotrayd = ((2 / 3. + mus) + (2 / 3. - mus) * trdown) / (4 / 3. + taur)
+    corr_refl = (refl / t_og - rhoray) / (ttotrayu * ttotrayd * t_h2o)
+    corr_refl /= (1.0 + corr_refl * sphalb)
+    # comparisons are False for NaNs, so they stay NaN like with np.clip
+    if corr_refl < REFLMIN:
+        return REFLMIN
+    if corr_refl > REFLMAX:
+        return REFLMAX
+    return corr_refl
+
+
+@numba.njit
+def _chand_pixel(phi, muv, mus, taur):
+    """Get the molecular path reflectance and transmittances of one pixel, see ``_crefl_utils._chand``."""
+    xph1 = 1.0 + (3.0 * mus * mus - 1.0) * (3.0 * muv * muv - 1.0) * _XFD / 8.0
+    xph2 = -_XFD * _XBETA2 * 1.5 * mus * muv * np.sqrt(1.0 - mus * mus) * np.sqrt(1.0 - muv * muv)
+    xph3 = _XFD * _XBETA2 * 0.375 * (1.0 - mus * mus) * (1.0 - muv * muv)
+
+    fs01 = _AS0[0] + (mus + muv) * _AS0[1] + (mus * muv) * _AS0[2] + (
+        mus * mus + muv * muv) * _AS0[3] + (mus * mus * muv * muv) * _AS0[4]
+    fs02 = _AS0[5] + (mus + muv) * _AS0[6] + (mus * muv) * _AS0[7] + (
+        mus * mus + muv * muv) * _AS0[8] + (mus * mus * muv * muv) * _AS0[9]
+    xlntaur = np.log(taur)
+    fs0 = fs01 + fs02 * xlntaur
+    fs1 = _AS1[0] + xlntaur * _AS1[1]
+    fs2 = _AS2[0] + xlntaur * _AS2[1]
+
+    trdown = np.exp(-taur / mus)
+    trup = np.exp(-taur / muv)
+    xitm1 = (1.0 - trdown * trup) / 4.0 / (mus + muv)
+    xitm2 = (1.0 - trdown) * (1.0 - trup)
+    xitot1 = xph1 * (xitm1 + xitm2 * fs0)
+    xitot2 = xph2 * (xitm1 + xitm2 * fs1)
+    xitot3 = xph3 * (xitm1 + xitm2 * fs2)
+
+    phios = np.deg2rad(phi + 180.0)
+    rhoray = xitot1 + xitot2 * np.cos(phios) * 2.0 + xitot3 * np.cos(2.0 * phios) * 2.0
+    return rhoray, trdown, trup
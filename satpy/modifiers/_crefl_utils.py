@@ -63,6 +63,7 @@ The original CREFL code is similar to what is described in appendix A1 (page
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Optional, Type, Union
 
 import dask.array as da
@@ -268,6 +269,7 @@ def run_crefl(refl,
               solar_azimuth,
               solar_zenith,
               avg_elevation=None,
+              height=None,
               ):
     """Run main crefl algorithm.
 
@@ -280,11 +282,13 @@ def run_crefl(refl,
     :param solar_azimuth: input swath solar azimuth angle array
     :param solar_zenith: input swath solar zenith angle array
     :param avg_elevation: average elevation (usually pre-calculated and stored in CMGDEM.hdf)
+    :param height: surface height of every pixel in metres, used instead of
+        looking it up in ``avg_elevation``
 
     """
     runner_cls = _runner_class_for_sensor(refl.attrs["sensor"])
     runner = runner_cls(refl)
-    corr_refl = runner(sensor_azimuth, sensor_zenith, solar_azimuth, solar_zenith, avg_elevation)
+    corr_refl = runner(sensor_azimuth, sensor_zenith, solar_azimuth, solar_zenith, avg_elevation, height=height)
     return corr_refl
 
 
@@ -301,9 +305,10 @@ class _CREFLRunner:
     def coeffs_cls(self) -> Type[_Coefficients]:
         raise NotImplementedError()
 
-    def __call__(self, sensor_azimuth, sensor_zenith, solar_azimuth, solar_zenith, avg_elevation):
+    def __call__(self, sensor_azimuth, sensor_zenith, solar_azimuth, solar_zenith, avg_elevation, height=None):
         refl = self._refl
-        height = self._height_from_avg_elevation(avg_elevation)
+        if height is None:
+            height = self._height_from_avg_elevation(avg_elevation)
         coeffs_helper = self.coeffs_cls(refl.attrs["wavelength"], refl.attrs["resolution"])
         coeffs = coeffs_helper()
         mus = np.cos(np.deg2rad(solar_zenith))
@@ -332,6 +337,17 @@ class _CREFLRunner:
         return height
 
 
+@lru_cache(maxsize=1)
+def _get_numba_kernels():
+    """Get the module with the numba implementation of CREFL, None if numba isn't available."""
+    try:
+        from satpy.modifiers import _crefl_numba
+    except ImportError:
+        LOG.debug("numba is not available, using the NumPy implementation of CREFL")
+        return None
+    return _crefl_numba
+
+
 class _ABICREFLRunner(_CREFLRunner):
     @property
     def coeffs_cls(self) -> Type[_Coefficients]:
@@ -339,7 +355,9 @@ class _ABICREFLRunner(_CREFLRunner):
 
     def _run_crefl(self, mus, muv, phi, solar_zenith, sensor_zenith, height, coeffs):
         LOG.debug("Using ABI CREFL algorithm")
-        return da.map_blocks(_run_crefl_abi, self._refl.data, mus.data, muv.data, phi.data,
+        numba_kernels = _get_numba_kernels()
+        run_func = _run_crefl_abi if numba_kernels is None else numba_kernels.run_crefl_abi
+        return da.map_blocks(run_func, self._refl.data, mus.data, muv.data, phi.data,
                              solar_zenith.data, sensor_zenith.data, height, *coeffs,
                              meta=np.ndarray((), dtype=self._refl.dtype),
                              chunks=self._refl.chunks, dtype=self._refl.dtype,
@@ -348,7 +366,9 @@ class _ABICREFLRunner(_CREFLRunner):
 
 class _VIIRSMODISCREFLRunner(_CREFLRunner):
     def _run_crefl(self, mus, muv, phi, solar_zenith, sensor_zenith, height, coeffs):
-        return da.map_blocks(_run_crefl, self._refl.data, mus.data, muv.data, phi.data,
+        numba_kernels = _get_numba_kernels()
+        run_func = _run_crefl if numba_kernels is None else numba_kernels.run_crefl
+        return da.map_blocks(run_func, self._refl.data, mus.data, muv.data, phi.data,
                              height, self._refl.attrs.get("sensor"), *coeffs,
                              meta=np.ndarray((), dtype=self._refl.dtype),
                              chunks=self._refl.chunks, dtype=self._refl.dtype,
@@ -453,11 +473,7 @@ class _AtmosphereVariables:
         self._taustep4sphalb = TAUSTEP4SPHALB
 
     def __call__(self):
-        tau_step = np.linspace(
-            self._taustep4sphalb,
-            MAXNUMSPHALBVALUES * self._taustep4sphalb,
-            MAXNUMSPHALBVALUES)
-        sphalb0 = _csalbr(tau_step)
+        sphalb0 = _spherical_albedo_table(self._taustep4sphalb)
         taur = self._tau * np.exp(-self._height / SCALEHEIGHT)
         rhoray, trdown, trup = _chand(self._phi, self._muv, self._mus, taur)
         sphalb = sphalb0[(taur / self._taustep4sphalb + 0.5).astype(np.int32)]
@@ -534,6 +550,13 @@ class _MODISAtmosphereVariables(_VIIRSAtmosphereVariables):
         return np.exp(-np.exp(self._ah2o + self._bh2o * np.log(self._airmass * UH2O_MODIS)))
 
 
+@lru_cache(maxsize=2)
+def _spherical_albedo_table(taustep):
+    """Get the spherical albedo for optical depths in steps of *taustep*."""
+    tau_step = np.linspace(taustep, MAXNUMSPHALBVALUES * taustep, MAXNUMSPHALBVALUES)
+    return _csalbr(tau_step)
+
+
 def _csalbr(tau):
     # Previously 3 functions csalbr fintexp1, fintexp3
     a = [-.57721566, 0.99999193, -0.24991055, 0.05519968, -0.00976004,
@@ -19,25 +19,30 @@
 from __future__ import annotations
 
 import datetime as dt
-import hashlib
-import os
-import shutil
-import warnings
+from collections import OrderedDict
 from functools import update_wrapper
-from glob import glob
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, NamedTuple, Optional, Union
 
-import dask
 import numpy as np
 import xarray as xr
 from dask import array as da
 from pyorbital.astronomy import cos_zen as pyob_cos_zen
 from pyorbital.astronomy import get_alt_az
 from pyorbital.orbital import get_observer_look
+from pyproj import Transformer
 from pyresample.geometry import AreaDefinition, StackedAreaDefinition, SwathDefinition
 
 import satpy
-from satpy.utils import PerformanceWarning, get_satpos, ignore_invalid_float_warnings
+from satpy._cache import (
+    HASHABLE_GEOMETRIES,
+    ZarrCacheHelper,
+    _chunks_are_irregular,
+    _is_chunk_tuple,
+    _regular_chunks_from_irregular_chunks,
+    _sanitize_args_with_chunks,
+    cache_to_zarr_if,  # noqa: F401  (kept importable from here)
+)
+from satpy.utils import get_satpos, ignore_invalid_float_warnings
 
 PRGeometry = Union[SwathDefinition, AreaDefinition, StackedAreaDefinition]
 
@@ -46,229 +51,107 @@ PRGeometry = Union[SwathDefinition, AreaDefinition, StackedAreaDefinition]
 # The difference is on the order of 1e-10 at most as time changes so we force
 # it to a single time for easier caching. It is *only* used if caching.
 STATIC_EARTH_INERTIAL_DATETIME = dt.datetime(2000, 1, 1, 12, 0, 0)
-DEFAULT_UNCACHE_TYPES = (SwathDefinition, xr.DataArray, da.Array)
-HASHABLE_GEOMETRIES = (AreaDefinition, StackedAreaDefinition)
 
 
-class ZarrCacheHelper:
-    """Helper for caching function results to on-disk zarr arrays.
+class AngleCacheInfo(NamedTuple):
+    """Statistics of the in-memory cache of lon/lats and angles."""
 
-    It is recommended to use this class through the :func:`cache_to_zarr_if`
-    decorator rather than using it directly.
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
-    Currently the cache does not perform any limiting or removal of cache
-    content. That is left up to the user to manage. Caching is based on
-    arguments passed to the decorated function but will only be performed
-    if the arguments are of a certain type (see ``uncacheable_arg_types``).
-    The cache value to use is purely based on the hash value of all of the
-    provided arguments along with the "cache version" (see below).
 
-    Note that the zarr format requires regular chunking of data. That is,
-    chunks must be all the same size per dimension except for the last chunk.
-    To work around this limitation, this class will determine a good regular
-    chunking based on the existing chunking scheme, rechunk the input
-    arguments, and then rechunk the results before returning them to the user.
-    This rechunking is only done if caching is enabled.
+class _MemoryCache:
+    """Least recently used in-memory cache of lazy (dask) results."""
 
-    Args:
-        func: Function that will be called to generate the value to cache.
-        cache_config_key: Name of the boolean ``satpy.config`` parameter to
-            use to determine if caching should be done.
-        uncacheable_arg_types: Types that if present in the passed arguments
-            should trigger caching to *not* happen. By default this includes
-            ``SwathDefinition``, ``xr.DataArray``, and ``dask.array.Array`` objects.
-        sanitize_args_func: Optional function to call to sanitize provided
-            arguments before they are considered for caching. This can be used
-            to make arguments more "cacheable" by replacing them with similar
-            values that will result in more cache hits. Note that the sanitized
-            arguments are only passed to the underlying function if caching
-            will be performed, otherwise the original arguments are passed.
-        cache_version: Version number used to distinguish one version of a
-            decorated function from future versions.
-
-    Notes:
-        * Caching only supports dask array values.
-
-        * This helper allows for an additional ``cache_dir`` parameter to
-          override the use of the ``satpy.config`` ``cache_dir`` parameter.
-
-    Examples:
-        To use through the :func:`cache_to_zarr_if` decorator::
-
-            @cache_to_zarr_if("cache_my_stuff")
-            def generate_my_stuff(area_def: AreaDefinition, some_factor: int) -> da.Array:
-                # Generate
-                return my_dask_arr
-
-        To use the decorated function::
-
-            with satpy.config.set(cache_my_stuff=True):
-                my_stuff = generate_my_stuff(area_def, 5)
-
-    """
+    def __init__(self):
+        self._results: OrderedDict[tuple, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
 
-    def __init__(self,
-                 func: Callable,
-                 cache_config_key: str,
-                 uncacheable_arg_types=DEFAULT_UNCACHE_TYPES,
-                 sanitize_args_func: Optional[Callable] = None,
-                 cache_version: int = 1,
-                 ):
-        """Hold on to provided arguments for future use."""
-        self._func = func
-        self._cache_config_key = cache_config_key
-        self._uncacheable_arg_types = uncacheable_arg_types
-        self._sanitize_args_func = sanitize_args_func
-        self._cache_version = cache_version
+    def get(self, key: tuple, func: Callable, *args) -> Any:
+        """Get the result cached for *key* or compute and cache it with ``func(*args)``."""
+        try:
+            result = self._results[key]
+        except KeyError:
+            self.misses += 1
+            result = func(*args)
+            self._results[key] = result
+            self._release_least_recently_used()
+        else:
+            self.hits += 1
+            self._results.move_to_end(key)
+        return result
 
-    def cache_clear(self, cache_dir: Optional[str] = None):
-        """Remove all on-disk files associated with this function.
-
-        Intended to mimic the :func:`functools.cache` behavior.
-        """
-        cache_dir = self._get_cache_dir_from_config(cache_dir)
-        zarr_pattern = self._zarr_pattern("*", cache_version="*").format("*")
-        for zarr_dir in glob(os.path.join(cache_dir, zarr_pattern)):
-            shutil.rmtree(zarr_dir, ignore_errors=True)
-
-    def _zarr_pattern(self, arg_hash, cache_version: Union[None, int, str] = None) -> str:
-        if cache_version is None:
-            cache_version = self._cache_version
-        return f"{self._func.__name__}_v{cache_version}" + "_{}_" + f"{arg_hash}.zarr"
-
-    def __call__(self, *args, cache_dir: Optional[str] = None) -> Any:
-        """Call the decorated function."""
-        should_cache: bool = satpy.config.get(self._cache_config_key, False)
-        if not should_cache:
-            return self._func(*args)
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._results
 
-        try:
-            return self._cache_and_read(args, cache_dir)
-        except TypeError as err:
-            warnings.warn("Cannot cache function because of unhashable argument: " + str(err), stacklevel=2)
-            return self._func(*args)
-
-    def _cache_and_read(self, args, cache_dir):
-        sanitized_args = self._sanitize_args_func(*args) if self._sanitize_args_func is not None else args
-
-        zarr_file_pattern = self._get_zarr_file_pattern(sanitized_args, cache_dir)
-        zarr_paths = glob(zarr_file_pattern.format("*"))
-
-        if not zarr_paths:
-            # use sanitized arguments
-            self._warn_if_irregular_input_chunks(args, sanitized_args)
-            res_to_cache = self._func(*(sanitized_args))
-            self._cache_results(res_to_cache, zarr_file_pattern)
-
-        # if we did any caching, let's load from the zarr files, so that future calls have the same name
-        # re-calculate the cached paths
-        zarr_paths = sorted(glob(zarr_file_pattern.format("*")))
-        if not zarr_paths:
-            raise RuntimeError("Data was cached to disk but no files were found")
-
-        new_chunks = _get_output_chunks_from_func_arguments(args)
-        res = tuple(da.from_zarr(zarr_path, chunks=new_chunks) for zarr_path in zarr_paths)
-        return res
-
-    def _get_zarr_file_pattern(self, sanitized_args, cache_dir):
-        arg_hash = _hash_args(*sanitized_args, unhashable_types=self._uncacheable_arg_types)
-        zarr_filename = self._zarr_pattern(arg_hash)
-        cache_dir = self._get_cache_dir_from_config(cache_dir)
-        return os.path.join(cache_dir, zarr_filename)
+    def add(self, key: tuple, result: Any):
+        """Add *result* for *key* if there is no result for it yet."""
+        if key not in self._results:
+            self._results[key] = result
+            self._release_least_recently_used()
 
     @staticmethod
-    def _get_cache_dir_from_config(cache_dir: Optional[str]) -> str:
-        cache_dir = cache_dir or satpy.config.get("cache_dir")
-        if cache_dir is None:
-            raise RuntimeError("Can't use zarr caching. No 'cache_dir' configured.")
-        return cache_dir
+    def _get_max_size() -> int:
+        return int(satpy.config.get("angle_memory_cache_size", 32))
 
-    @staticmethod
-    def _warn_if_irregular_input_chunks(args, modified_args):
-        arg_chunks = _get_output_chunks_from_func_arguments(args)
-        new_chunks = _get_output_chunks_from_func_arguments(modified_args)
-        if _chunks_are_irregular(arg_chunks):
-            warnings.warn(
-                "Calling cached function with irregular dask chunks. The data "
-                "has been rechunked for caching, but this is not optimal for "
-                "future calculations. "
-                f"Original chunks: {arg_chunks}; New chunks: {new_chunks}",
-                PerformanceWarning,
-                stacklevel=3
-            )
-
-    def _cache_results(self, res, zarr_file_pattern):
-        os.makedirs(os.path.dirname(zarr_file_pattern), exist_ok=True)
-        new_res = []
-        for idx, sub_res in enumerate(res):
-            if not isinstance(sub_res, da.Array):
-                raise ValueError("Zarr caching currently only supports dask "
-                                 f"arrays. Got {type(sub_res)}")
-            zarr_path = zarr_file_pattern.format(idx)
-            # See https://github.com/dask/dask/issues/8380
-            with dask.config.set({"optimization.fuse.active": False}):
-                new_sub_res = sub_res.to_zarr(zarr_path, compute=False)
-            new_res.append(new_sub_res)
-        # actually compute the storage to zarr
-        da.compute(new_res)
-
-
-def _get_output_chunks_from_func_arguments(args):
-    """Determine what the desired output chunks are.
-
-    It is assumed a tuple of tuples of integers is defining chunk sizes. If
-    a tuple like this is not found then arguments are checked for array-like
-    objects with a ``.chunks`` attribute.
+    def _release_least_recently_used(self):
+        while len(self._results) > self._get_max_size():
+            self._results.popitem(last=False)
 
-    """
-    chunked_args = [arg for arg in args if hasattr(arg, "chunks")]
-    tuple_args = [arg for arg in args if _is_chunk_tuple(arg)]
-    if not tuple_args and not chunked_args:
-        raise RuntimeError("Cannot determine desired output chunksize for cached function.")
-    new_chunks = tuple_args[-1] if tuple_args else chunked_args[0].chunks
-    return new_chunks
-
-
-def cache_to_zarr_if(
-        cache_config_key: str,
-        uncacheable_arg_types=DEFAULT_UNCACHE_TYPES,
-        sanitize_args_func: Optional[Callable] = None,
-) -> Callable:
-    """Decorate a function and cache the results as a zarr array on disk.
-
-    This only happens if the ``satpy.config`` boolean value for the provided
-    key is ``True`` as well as some other conditions. See
-    :class:`ZarrCacheHelper` for more information. Most importantly, this
-    decorator does not limit how many items can be cached and does not clear
-    out old entries. It is up to the user to manage the size of the cache.
+    def info(self) -> AngleCacheInfo:
+        return AngleCacheInfo(self.hits, self.misses, self._get_max_size(), len(self._results))
+
+    def clear(self):
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_angle_memory_cache = _MemoryCache()
+
+
+def get_angle_cache_info() -> AngleCacheInfo:
+    """Get the hit and miss counters of the in-memory lon/lat and angle cache.
+
+    Lon/lats, sun angles, sensor angles and the cosine of the solar zenith
+    angle are generated lazily as dask arrays. The last
+    :ref:`angle_memory_cache_size <config_angle_memory_cache_size_setting>`
+    of them are kept in memory, so that all modifiers of a Scene working on
+    the same area, time and satellite position share the same dask arrays and
+    the angles are only computed once. Start times are compared with a
+    precision of one second. The cache is shared by all Scenes of the process,
+    use :func:`clear_angle_cache` to release the arrays.
+
+    Intended to mimic :meth:`functools.lru_cache` ``cache_info``.
 
     """
+    return _angle_memory_cache.info()
 
-    def _decorator(func: Callable) -> Callable:
-        zarr_cacher = ZarrCacheHelper(func,
-                                      cache_config_key,
-                                      uncacheable_arg_types,
-                                      sanitize_args_func)
-        wrapper = update_wrapper(zarr_cacher, func)
-        return wrapper
 
-    return _decorator
+def clear_angle_cache():
+    """Remove all lon/lats and angles kept in memory and reset the counters."""
+    _angle_memory_cache.clear()
 
 
-def _hash_args(*args, unhashable_types=DEFAULT_UNCACHE_TYPES):
-    import json
-    hashable_args = []
-    for arg in args:
-        if isinstance(arg, unhashable_types):
-            raise TypeError(f"Unhashable type ({type(arg)}).")
-        if isinstance(arg, HASHABLE_GEOMETRIES):
-            arg = hash(arg)
-        elif isinstance(arg, dt.datetime):
-            arg = arg.isoformat(" ")
-        hashable_args.append(arg)
-    arg_hash = hashlib.sha1()  # nosec
-    arg_hash.update(json.dumps(tuple(hashable_args)).encode("utf8"))
-    return arg_hash.hexdigest()
+class _AngleZarrCacheHelper(ZarrCacheHelper):
+    """Zarr cache helper also releasing the lon/lats and angles kept in memory."""
+
+    def cache_clear(self, cache_dir: Optional[str] = None):
+        """Remove all on-disk files associated with this function."""
+        # lazy arrays kept in memory may be reading from the removed files
+        clear_angle_cache()
+        super().cache_clear(cache_dir)
+
+
+def _cache_angles_to_zarr_if(cache_config_key: str, sanitize_args_func: Callable) -> Callable:
+    def _decorator(func: Callable) -> Callable:
+        zarr_cacher = _AngleZarrCacheHelper(func, cache_config_key, sanitize_args_func=sanitize_args_func)
+        return update_wrapper(zarr_cacher, func)
+
+    return _decorator
 
 
 def _sanitize_observer_look_args(*args):
@@ -289,46 +172,6 @@ def _sanitize_observer_look_args(*args):
     return new_args
 
 
-def _sanitize_args_with_chunks(*args):
-    new_args = []
-    for arg in args:
-        if _is_chunk_tuple(arg) and _chunks_are_irregular(arg):
-            new_chunks = _regular_chunks_from_irregular_chunks(arg)
-            new_args.append(new_chunks)
-        else:
-            new_args.append(arg)
-    return new_args
-
-
-def _is_chunk_tuple(some_obj: Any) -> bool:
-    if not isinstance(some_obj, tuple):
-        return False
-    if not all(isinstance(sub_obj, tuple) for sub_obj in some_obj):
-        return False
-    sub_elements = [sub_obj_elem for sub_obj in some_obj for sub_obj_elem in sub_obj]
-    return all(isinstance(sub_obj_elem, int) for sub_obj_elem in sub_elements)
-
-
-def _regular_chunks_from_irregular_chunks(
-        old_chunks: tuple[tuple[int, ...], ...]
-) -> tuple[tuple[int, ...], ...]:
-    shape = tuple(sum(dim_chunks) for dim_chunks in old_chunks)
-    new_dim_chunks = tuple(max(dim_chunks) for dim_chunks in old_chunks)
-    return da.core.normalize_chunks(new_dim_chunks, shape=shape)
-
-
-def _chunks_are_irregular(chunks_tuple: tuple) -> bool:
-    """Determine if an array is irregularly chunked.
-
-    Zarr does not support saving data in irregular chunks. Regular chunking
-    is when all chunks are the same size (except for the last one).
-
-    """
-    if any(len(set(chunks[:-1])) > 1 for chunks in chunks_tuple):
-        return True
-    return any(chunks[-1] > chunks[0] for chunks in chunks_tuple)
-
-
 def _geo_dask_to_data_array(arr: da.Array) -> xr.DataArray:
     return xr.DataArray(arr, dims=("y", "x"))
 
@@ -380,7 +223,11 @@ def get_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray, xr.D
     Note that this function can benefit from the ``satpy.config`` parameters
     :ref:`cache_lonlats <config_cache_lonlats_setting>` and
     :ref:`cache_sensor_angles <config_cache_sensor_angles_setting>`
-    being set to ``True``.
+    being set to ``True``, as well as from computing the angles on a coarse
+    grid with the :ref:`angle_computation_stride <config_angle_computation_stride_setting>`
+    parameter. Independent of these, the generated dask arrays
+    are kept in memory and shared by all callers with the same area, start
+    time, satellite position and chunks, see :func:`get_angle_cache_info`.
 
     Args:
         data_arr: DataArray to get angles for. Information extracted from this
@@ -397,11 +244,50 @@ def get_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray, xr.D
         Solar angles are provided in the [-180, 180] degree range.
 
     """
-    sata, satz = _get_sensor_angles(data_arr)
-    suna, sunz = _get_sun_angles(data_arr)
+    if satpy.config.get("cache_sensor_angles", False):
+        # cached sensor angles don't depend on the exact time and satellite position
+        sata, satz = _get_sensor_angles(data_arr)
+        suna, sunz = _get_sun_angles(data_arr)
+        return sata, satz, suna, sunz
+    return _get_all_angles(data_arr)
+
+
+def _get_all_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray, xr.DataArray, xr.DataArray]:
+    preference = satpy.config.get("sensor_angles_position_preference", "actual")
+    sat_pos = get_satpos(data_arr, preference=preference)
+    area = data_arr.attrs["area"]
+    chunks = _geo_chunks_from_data_arr(data_arr)
+    start_time = _round_start_time(data_arr.attrs["start_time"])
+    interpolation = _get_interpolation_settings(area)
+    dtype = _get_angle_dtype()
+    key = ("angles", area, start_time, sat_pos, chunks, interpolation, dtype)
+    sun_key = _get_sun_angles_key(area, start_time, chunks, interpolation, dtype)
+    if key not in _angle_memory_cache and sun_key in _angle_memory_cache:
+        # the sun angles don't depend on the satellite position, only compute the sensor angles
+        sata, satz = _get_sensor_angles(data_arr)
+        suna, sunz = _get_sun_angles(data_arr)
+        return sata, satz, suna, sunz
+    angles = _memoize_if_hashable(key, _get_all_angles_for_area, area, chunks, start_time, sat_pos, interpolation,
+                                  dtype)
+    if isinstance(area, HASHABLE_GEOMETRIES):
+        # share the sun angles with other satellite positions and get_cos_sza
+        _angle_memory_cache.add(sun_key, angles[2:4])
+        if not satpy.config.get("cache_cos_sza", False):
+            _angle_memory_cache.add(_get_cos_sza_key(area, start_time, chunks, interpolation, dtype), (angles[4],))
+    sata, satz, suna, sunz = (_geo_dask_to_data_array(angle) for angle in angles[:4])
     return sata, satz, suna, sunz
 
 
+def _get_all_angles_for_area(area, chunks, start_time, sat_pos, interpolation, dtype):
+    if interpolation is not None:
+        angles = _get_interpolated_angles(area, chunks, interpolation, dtype, _get_all_angles_ndarray,
+                                          (start_time, *sat_pos, False), num_angles=4, azimuth_indices=(0, 2))
+        return tuple(angles) + (np.cos(np.deg2rad(angles[3])).astype(dtype),)
+    lons, lats = _get_memoized_lonlats(area, chunks, dtype)
+    angles = _map_angle_blocks(_get_all_angles_ndarray, lons, lats, start_time, *sat_pos, num_angles=5)
+    return tuple(angles)
+
+
 def get_satellite_zenith_angle(data_arr: xr.DataArray) -> xr.DataArray:
     """Generate satellite zenith angle for the provided data.
 
@@ -418,50 +304,138 @@ def get_satellite_zenith_angle(data_arr: xr.DataArray) -> xr.DataArray:
 def get_cos_sza(data_arr: xr.DataArray) -> xr.DataArray:
     """Generate the cosine of the solar zenith angle for the provided data.
 
+    The cosine of the solar zenith angle is generated once for every area,
+    start time (to the second) and chunk size and shared by all data arrays
+    on that grid, like the bands corrected by the
+    :class:`~satpy.modifiers.geometry.SunZenithCorrector` or
+    :class:`~satpy.modifiers.geometry.SunZenithReducer` and the
+    :class:`~satpy.composites.fill.DayNightCompositor` weights. It is
+    generated with the ``angle_dtype`` setting and converted to the floating
+    point type of ``data_arr``. With the
+    :ref:`cache_cos_sza <config_cache_cos_sza_setting>` setting, it is also
+    cached on disk for later runs on the same time slot.
+
     Returns:
         DataArray with the same shape as ``data_arr``.
 
     """
+    area = data_arr.attrs["area"]
     chunks = _geo_chunks_from_data_arr(data_arr)
-    lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
-    if lons.dtype != data_arr.dtype and np.issubdtype(data_arr.dtype, np.floating):
-        lons = lons.astype(data_arr.dtype)
-        lats = lats.astype(data_arr.dtype)
-    cos_sza = _get_cos_sza(data_arr.attrs["start_time"], lons, lats)
-    return _geo_dask_to_data_array(cos_sza)
+    angle_dtype = _get_angle_dtype()
+    dtype = data_arr.dtype if np.issubdtype(data_arr.dtype, np.floating) else angle_dtype
+    start_time = _round_start_time(data_arr.attrs["start_time"])
+    interpolation = _get_interpolation_settings(area)
+    key = _get_cos_sza_key(area, start_time, chunks, interpolation, angle_dtype)
+    cos_sza = _memoize_if_hashable(key, _get_cos_sza_for_area, area, chunks, start_time, interpolation,
+                                   angle_dtype.name)[0]
+    return _geo_dask_to_data_array(cos_sza.astype(dtype, copy=False))
+
+
+def _get_cos_sza_key(area, start_time, chunks, interpolation, angle_dtype):
+    return ("cos_sza", area, _round_start_time(start_time), chunks, interpolation, np.dtype(angle_dtype),
+            satpy.config.get("cache_cos_sza", False))
+
+
+@_cache_angles_to_zarr_if("cache_cos_sza", sanitize_args_func=_sanitize_args_with_chunks)
+def _get_cos_sza_for_area(area, chunks, start_time, interpolation, angle_dtype_name):
+    if interpolation is not None:
+        sunz = _get_interpolated_angles(area, chunks, interpolation, angle_dtype_name, _sun_zenith_ndarray,
+                                        (start_time,))
+        return (np.cos(np.deg2rad(sunz[0])).astype(angle_dtype_name),)
+    lons, lats = _get_memoized_lonlats(area, chunks, np.dtype(angle_dtype_name))
+    return (_get_cos_sza(start_time, lons, lats),)
+
+
+def _get_angle_dtype() -> np.dtype:
+    """Get the data type of generated lon/lats and angles from the ``angle_dtype`` setting."""
+    return np.dtype(satpy.config.get("angle_dtype", "float64"))
+
+
+def _memoize_if_hashable(key: tuple, func: Callable, *args) -> Any:
+    """Get the result of ``func(*args)`` from the in-memory cache if the area in *key* can be hashed."""
+    if not isinstance(key[1], HASHABLE_GEOMETRIES):
+        return func(*args)
+    return _angle_memory_cache.get(key, func, *args)
+
 
+def _round_start_time(start_time):
+    if isinstance(start_time, dt.datetime):
+        return start_time.replace(microsecond=0)
+    return start_time
 
-@cache_to_zarr_if("cache_lonlats", sanitize_args_func=_sanitize_args_with_chunks)
-def _get_valid_lonlats(area: PRGeometry, chunks: Union[int, str, tuple] = "auto") -> tuple[da.Array, da.Array]:
+
+def _get_memoized_lonlats(area: PRGeometry,
+                          chunks: Union[int, str, tuple],
+                          dtype: np.dtype) -> tuple[da.Array, da.Array]:
+    key = ("lonlats", area, chunks, dtype, satpy.config.get("cache_lonlats", False))
+    return _memoize_if_hashable(key, _get_valid_lonlats, area, chunks, np.dtype(dtype).name)
+
+
+@_cache_angles_to_zarr_if("cache_lonlats", sanitize_args_func=_sanitize_args_with_chunks)
+def _get_valid_lonlats(area: PRGeometry,
+                       chunks: Union[int, str, tuple] = "auto",
+                       dtype_name: str = "float64") -> tuple[da.Array, da.Array]:
     with ignore_invalid_float_warnings():
-        # NOTE: This defaults to 64-bit floats due to needed precision for X/Y coordinates
+        # NOTE: This defaults to 64-bit floats due to needed precision for X/Y coordinates.
+        # Converting to a smaller type afterwards happens in the same dask tasks.
         lons, lats = area.get_lonlats(chunks=chunks)
-        lons = da.where(lons >= 1e30, np.nan, lons)
-        lats = da.where(lats >= 1e30, np.nan, lats)
+        lons = da.where(lons >= 1e30, np.nan, lons).astype(dtype_name, copy=False)
+        lats = da.where(lats >= 1e30, np.nan, lats).astype(dtype_name, copy=False)
     return lons, lats
 
 
 def _get_sun_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
+    area = data_arr.attrs["area"]
     chunks = _geo_chunks_from_data_arr(data_arr)
-    lons, lats = _get_valid_lonlats(data_arr.attrs["area"], chunks)
-    suna = da.map_blocks(_get_sun_azimuth_ndarray, lons, lats,
-                         data_arr.attrs["start_time"],
-                         dtype=lons.dtype, meta=np.array((), dtype=lons.dtype),
-                         chunks=lons.chunks)
-    cos_sza = _get_cos_sza(data_arr.attrs["start_time"], lons, lats)
-    sunz = np.rad2deg(np.arccos(cos_sza))
+    start_time = _round_start_time(data_arr.attrs["start_time"])
+    interpolation = _get_interpolation_settings(area)
+    dtype = _get_angle_dtype()
+    key = _get_sun_angles_key(area, start_time, chunks, interpolation, dtype)
+    suna, sunz = _memoize_if_hashable(key, _get_sun_angles_for_area, area, chunks, start_time, interpolation, dtype)
     suna = _geo_dask_to_data_array(suna)
     sunz = _geo_dask_to_data_array(sunz)
     return suna, sunz
 
 
-def _get_cos_sza(utc_time, lons, lats):
-    cos_sza = da.map_blocks(_cos_zen_ndarray,
-                            lons, lats, utc_time,
-                            meta=np.array((), dtype=lons.dtype),
-                            dtype=lons.dtype,
-                            chunks=lons.chunks)
-    return cos_sza
+def _get_sun_angles_key(area, start_time, chunks, interpolation, dtype):
+    return ("sun_angles", area, _round_start_time(start_time), chunks, interpolation, dtype)
+
+
+def _get_sun_angles_for_area(area, chunks, start_time, interpolation, dtype):
+    if interpolation is not None:
+        res = _get_interpolated_angles(area, chunks, interpolation, dtype, _sun_angles_ndarray, (start_time,),
+                                       num_angles=2, azimuth_indices=(0,))
+        return res[0], res[1]
+    lons, lats = _get_memoized_lonlats(area, chunks, dtype)
+    suna = _map_angle_blocks(_get_sun_azimuth_ndarray, lons, lats, start_time)
+    sunz = _map_angle_blocks(_sun_zenith_ndarray, lons, lats, start_time)
+    return suna, sunz
+
+
+def _get_cos_sza(utc_time, lons, lats, dtype=None):
+    return _map_angle_blocks(_cos_zen_ndarray, lons, lats, utc_time, dtype=dtype)
+
+
+def _map_angle_blocks(func: Callable, lons: da.Array, lats: da.Array, *args,
+                      dtype=None, num_angles: Optional[int] = None) -> da.Array:
+    """Apply *func* to every block of the lon/lats.
+
+    Angles are computed from 64-bit lon/lats, but are returned with the
+    data type of the lon/lats unless *dtype* is provided. If *num_angles* is
+    provided, *func* returns that many angles stacked along a new first
+    dimension.
+
+    """
+    dtype = np.dtype(dtype or lons.dtype)
+    kwargs = {"chunks": lons.chunks} if num_angles is None else {"new_axis": [0],
+                                                                 "chunks": ((num_angles,),) + lons.chunks}
+    return da.map_blocks(_angles_in_float64, func, lons, lats, *args, out_dtype=dtype,
+                         dtype=dtype, meta=np.array((), dtype=dtype), token=func.__name__.strip("_"), **kwargs)
+
+
+def _angles_in_float64(func, lons, lats, *args, out_dtype):
+    angles = func(lons.astype(np.float64, copy=False), lats.astype(np.float64, copy=False), *args)
+    return angles.astype(out_dtype, copy=False)
 
 
 def _cos_zen_ndarray(lons, lats, utc_time):
@@ -482,15 +456,28 @@ def _get_sun_azimuth_ndarray(lons: np.ndarray, lats: np.ndarray, start_time: dt.
     return suna
 
 
+def _sun_zenith_ndarray(lons: np.ndarray, lats: np.ndarray, start_time: dt.datetime) -> np.ndarray:
+    return np.rad2deg(np.arccos(_cos_zen_ndarray(lons, lats, start_time)))
+
+
+def _sun_angles_ndarray(lons: np.ndarray, lats: np.ndarray, start_time: dt.datetime) -> np.ndarray:
+    return np.stack([_get_sun_azimuth_ndarray(lons, lats, start_time), _sun_zenith_ndarray(lons, lats, start_time)])
+
+
 def _get_sensor_angles(data_arr: xr.DataArray) -> tuple[xr.DataArray, xr.DataArray]:
     preference = satpy.config.get("sensor_angles_position_preference", "actual")
     sat_lon, sat_lat, sat_alt = get_satpos(data_arr, preference=preference)
     area_def = data_arr.attrs["area"]
     chunks = _geo_chunks_from_data_arr(data_arr)
 
-    sata, satz = _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt,
-                                                 data_arr.attrs["start_time"],
-                                                 area_def, chunks)
+    start_time = _round_start_time(data_arr.attrs["start_time"])
+    interpolation = _get_interpolation_settings(area_def)
+    dtype_name = _get_angle_dtype().name
+    key = ("sensor_angles", area_def, start_time, (sat_lon, sat_lat, sat_alt), chunks,
+           interpolation, dtype_name, satpy.config.get("cache_sensor_angles", False))
+    sata, satz = _memoize_if_hashable(key, _get_sensor_angles_from_sat_pos,
+                                      sat_lon, sat_lat, sat_alt, start_time, area_def, chunks, interpolation,
+                                      dtype_name)
     sata = _geo_dask_to_data_array(sata)
     satz = _geo_dask_to_data_array(satz)
     return sata, satz
@@ -510,12 +497,16 @@ def _dim_index_with_default(dims: tuple, dim_name: str, default: int) -> int:
         return default
 
 
-@cache_to_zarr_if("cache_sensor_angles", sanitize_args_func=_sanitize_observer_look_args)
-def _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt, start_time, area_def, chunks):
-    lons, lats = _get_valid_lonlats(area_def, chunks)
-    res = da.map_blocks(_get_sensor_angles_ndarray, lons, lats, start_time, sat_lon, sat_lat, sat_alt,
-                        dtype=lons.dtype, meta=np.array((), dtype=lons.dtype), new_axis=[0],
-                        chunks=(2,) + lons.chunks)
+@_cache_angles_to_zarr_if("cache_sensor_angles", sanitize_args_func=_sanitize_observer_look_args)
+def _get_sensor_angles_from_sat_pos(sat_lon, sat_lat, sat_alt, start_time, area_def, chunks, interpolation=None,
+                                    dtype_name="float64"):
+    if interpolation is not None:
+        res = _get_interpolated_angles(area_def, chunks, interpolation, dtype_name, _get_sensor_angles_ndarray,
+                                       (start_time, sat_lon, sat_lat, sat_alt), num_angles=2, azimuth_indices=(0,))
+        return res[0], res[1]
+    lons, lats = _get_memoized_lonlats(area_def, chunks, np.dtype(dtype_name))
+    res = _map_angle_blocks(_get_sensor_angles_ndarray, lons, lats, start_time, sat_lon, sat_lat, sat_alt,
+                            num_angles=2)
     return res[0], res[1]
 
 
@@ -531,6 +522,202 @@ def _get_sensor_angles_ndarray(lons, lats, start_time, sat_lon, sat_lat, sat_alt
         return np.stack([sata, satz])
 
 
+def _get_all_angles_ndarray(lons: np.ndarray, lats: np.ndarray, start_time: dt.datetime,
+                            sat_lon: float, sat_lat: float, sat_alt: float,
+                            include_cos_sza: bool = True) -> np.ndarray:
+    """Compute the sensor and solar angles of the lon/lats in one task.
+
+    This gives the same results as :func:`_get_sensor_angles_ndarray`,
+    :func:`_get_sun_azimuth_ndarray` and :func:`_cos_zen_ndarray`, but the
+    position of the sun is only computed once, by pyorbital's ``get_alt_az``,
+    for the solar azimuth, the solar zenith angle and its cosine.
+
+    Returns:
+        Satellite azimuth, satellite zenith, solar azimuth and solar zenith
+        angles in degrees and optionally the cosine of the solar zenith angle
+        stacked along the first dimension.
+
+    """
+    sata, satz = _get_sensor_angles_ndarray(lons, lats, start_time, sat_lon, sat_lat, sat_alt)
+    with ignore_invalid_float_warnings():
+        sun_alt, suna = get_alt_az(start_time, lons, lats)
+        # see _get_sun_azimuth_ndarray for the range of the azimuth
+        suna = np.rad2deg(suna) % 360.
+        cos_sza = np.sin(sun_alt)
+        sunz = np.rad2deg(np.arccos(cos_sza))
+    angles = [sata, satz, suna, sunz]
+    if include_cos_sza:
+        angles.append(cos_sza)
+    return np.stack(angles)
+
+
+def _get_interpolation_settings(area: PRGeometry) -> Optional[tuple[int, float]]:
+    """Get the stride and tolerance for computing angles on a coarse grid, ``None`` to compute all pixels."""
+    stride = satpy.config.get("angle_computation_stride", None)
+    if not stride or int(stride) <= 1 or not isinstance(area, AreaDefinition):
+        return None
+    return int(stride), float(satpy.config.get("angle_interpolation_tolerance", 0.05))
+
+
+def _get_interpolated_angles(area: AreaDefinition,
+                             chunks: tuple,
+                             interpolation: tuple[int, float],
+                             dtype: Union[np.dtype, str],
+                             angle_func: Callable,
+                             func_args: tuple,
+                             num_angles: int = 1,
+                             azimuth_indices: tuple[int, ...] = (),
+                             ) -> da.Array:
+    """Compute angles on a coarse grid of every chunk and interpolate them to all pixels.
+
+    The angles are computed by ``angle_func(lons, lats, *func_args)`` every
+    ``stride`` pixels and at the last row and column of every chunk, then
+    interpolated bilinearly. Azimuth angles are interpolated as unit vectors to
+    handle the wrap around at 360 degrees. To stay within ``tolerance``
+    degrees of the exact angles, the angles are also computed in the centre of
+    every coarse grid cell. Cells where the interpolated angles differ more
+    than that from the exact ones, like around the sub-satellite point, are
+    computed exactly. So are cells with some invalid corners, like at the limb
+    of the Earth disk, while cells with only invalid corners are left invalid.
+
+    Returns:
+        Dask array of type *dtype* with the ``num_angles`` angles stacked
+        along the first dimension.
+
+    """
+    chunks = da.core.normalize_chunks(chunks, area.shape, dtype=np.float64)
+    dtype = np.dtype(dtype)
+    return da.map_blocks(_interpolated_angles_block, area, interpolation, angle_func, func_args, azimuth_indices,
+                         out_dtype=dtype, dtype=dtype, meta=np.array((), dtype=dtype),
+                         chunks=((num_angles,),) + chunks)
+
+
+def _interpolated_angles_block(area, interpolation, angle_func, func_args, azimuth_indices, out_dtype,
+                               block_info=None):
+    stride, tolerance = interpolation
+    num_angles = block_info[None]["chunk-shape"][0]
+    (y_start, y_end), (x_start, x_end) = block_info[None]["array-location"][1:]
+    xs, ys = area.get_proj_vectors()
+    xs = xs[x_start:x_end]
+    ys = ys[y_start:y_end]
+    transformer = Transformer.from_crs(area.crs, "EPSG:4326", always_xy=True)
+
+    def _exact_angles(x_idx, y_idx):
+        lons, lats = _lonlats_from_proj_coords(transformer, xs[x_idx], ys[y_idx])
+        angles = np.full((num_angles,) + lons.shape, np.nan)
+        valid = ~np.isnan(lons)
+        angles[:, valid] = angle_func(lons[valid], lats[valid], *func_args)
+        return angles
+
+    rows = _coarse_positions(y_end - y_start, stride)
+    cols = _coarse_positions(x_end - x_start, stride)
+    coarse = _exact_angles(*np.meshgrid(cols, rows))
+    row_cells, row_weights = _interpolation_weights(rows, y_end - y_start)
+    col_cells, col_weights = _interpolation_weights(cols, x_end - x_start)
+    res = _bilinear_interpolation(coarse, (row_cells, row_weights), (col_cells, col_weights), azimuth_indices)
+
+    inexact_cells = _get_inexact_cells(res, coarse, _exact_angles, rows, cols, tolerance, azimuth_indices)
+    y_idx, x_idx = np.nonzero(inexact_cells[row_cells[:, np.newaxis], col_cells])
+    res[:, y_idx, x_idx] = _exact_angles(x_idx, y_idx)
+    return res.astype(out_dtype, copy=False)
+
+
+def _coarse_positions(size: int, stride: int) -> np.ndarray:
+    return np.unique(np.append(np.arange(0, size, stride), size - 1))
+
+
+def _lonlats_from_proj_coords(transformer, xs, ys):
+    with ignore_invalid_float_warnings():
+        lons, lats = transformer.transform(xs, ys)
+        invalid = ~(np.isfinite(lons) & np.isfinite(lats)) | (np.abs(lons) >= 1e30)
+    lons = np.where(invalid, np.nan, lons)
+    lats = np.where(invalid, np.nan, lats)
+    return lons, lats
+
+
+def _cell_corners(positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Get the indices of the first and last coarse position of every grid cell."""
+    first = np.arange(max(positions.size - 1, 1))
+    return first, np.minimum(first + 1, positions.size - 1)
+
+
+def _interpolation_weights(positions: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get the grid cell of every pixel and its relative position between the cell corners."""
+    pixels = np.arange(size)
+    cells = np.clip(np.searchsorted(positions, pixels, side="right") - 1, 0, max(positions.size - 2, 0))
+    first, last = _cell_corners(positions)
+    cell_sizes = np.maximum(positions[last] - positions[first], 1)
+    weights = (pixels - positions[first][cells]) / cell_sizes[cells]
+    return cells, weights
+
+
+def _bilinear_interpolation(coarse, row_weights, col_weights, azimuth_indices):
+    components = _azimuths_to_vectors(coarse, azimuth_indices)
+    for axis, (cells, weights) in ((1, row_weights), (2, col_weights)):
+        first, last = _cell_corners(np.arange(components.shape[axis]))
+        start = np.take(components, first[cells], axis=axis)
+        components = np.take(components, last[cells], axis=axis)
+        components -= start
+        components *= weights[:, np.newaxis] if axis == 1 else weights
+        components += start
+    return _vectors_to_azimuths(components, coarse.shape[0], azimuth_indices)
+
+
+def _azimuths_to_vectors(angles, azimuth_indices):
+    """Add the sine and cosine of the azimuth angles at the end of the stacked angles."""
+    if not azimuth_indices:
+        return angles
+    azimuths = np.deg2rad(angles[list(azimuth_indices)])
+    return np.concatenate([angles, np.sin(azimuths), np.cos(azimuths)])
+
+
+def _vectors_to_azimuths(components, num_angles, azimuth_indices):
+    angles = components[:num_angles]
+    num_azimuths = len(azimuth_indices)
+    for vector_idx, angle_idx in enumerate(azimuth_indices):
+        sines = components[num_angles + vector_idx]
+        cosines = components[num_angles + num_azimuths + vector_idx]
+        azimuths = np.rad2deg(np.arctan2(sines, cosines, out=angles[angle_idx]), out=angles[angle_idx])
+        np.mod(azimuths, 360., out=azimuths)
+    return angles
+
+
+def _get_inexact_cells(res, coarse, exact_angles_func, rows, cols, tolerance, azimuth_indices):
+    """Find the coarse grid cells whose interpolated angles can't be used.
+
+    These are the cells where the interpolated angles in the centre of the
+    cell or in the middle of its first row or column differ more than
+    *tolerance* from the exact angles, the cells with some, but not all,
+    invalid corners and the neighbours of these cells.
+
+    """
+    valid = ~np.isnan(coarse).any(axis=0)
+    first_row, last_row = _cell_corners(rows)
+    first_col, last_col = _cell_corners(cols)
+    num_valid_corners = (valid[first_row][:, first_col].astype(int) + valid[first_row][:, last_col] +
+                         valid[last_row][:, first_col] + valid[last_row][:, last_col])
+
+    mid_rows = (rows[first_row] + rows[last_row]) // 2
+    mid_cols = (cols[first_col] + cols[last_col]) // 2
+    too_large = np.zeros(num_valid_corners.shape, dtype=bool)
+    for check_rows, check_cols in ((mid_rows, mid_cols), (rows[first_row], mid_cols), (mid_rows, cols[first_col])):
+        x_idx, y_idx = np.meshgrid(check_cols, check_rows)
+        diff = np.abs(res[:, y_idx, x_idx] - exact_angles_func(x_idx, y_idx))
+        for angle_idx in azimuth_indices:
+            diff[angle_idx] = np.minimum(diff[angle_idx], 360. - diff[angle_idx])
+        with ignore_invalid_float_warnings():
+            too_large |= ~(diff <= tolerance).all(axis=0)
+    inexact = (num_valid_corners > 0) & ((num_valid_corners < 4) | too_large)
+    return _dilate(inexact) & (num_valid_corners > 0)
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    """Add the neighbours of all cells set in *mask*."""
+    padded = np.pad(mask, 1)
+    height, width = mask.shape
+    return np.any([padded[row:row + height, col:col + width] for row in range(3) for col in range(3)], axis=0)
+
+
 def sunzen_corr_cos(data: da.Array,
                     cos_zen: da.Array,
                     limit: float = 88.,
@@ -545,24 +732,27 @@ def sunzen_corr_cos(data: da.Array,
     past ``limit`` degrees up to ``max_sza`` where the correction becomes
     0. Both ``data`` and ``cos_zen`` should be 2D arrays of the same shape.
 
+    The correction factors only depend on ``cos_zen`` and the limits, so
+    they are computed once for all bands corrected with the same
+    ``cos_zen``, like the one shared by :func:`get_cos_sza`.
+
     """
-    return da.map_blocks(_sunzen_corr_cos_ndarray,
-                         data, cos_zen, limit, max_sza,
-                         meta=np.array((), dtype=data.dtype),
-                         chunks=data.chunks)
+    corr = da.map_blocks(_sunzen_corr_cos_factor_ndarray, cos_zen, limit, max_sza, data.dtype,
+                         meta=np.array((), dtype=data.dtype), dtype=data.dtype)
+    return data * corr
 
 
-def _sunzen_corr_cos_ndarray(data: np.ndarray,
-                             cos_zen: np.ndarray,
-                             limit: float,
-                             max_sza: Optional[float]) -> np.ndarray:
+def _sunzen_corr_cos_factor_ndarray(cos_zen: np.ndarray,
+                                    limit: float,
+                                    max_sza: Optional[float],
+                                    dtype: np.dtype) -> np.ndarray:
     # Convert the zenith angle limit to cosine of zenith angle
     limit_rad = np.deg2rad(limit)
     limit_cos = np.cos(limit_rad)
     max_sza_rad = np.deg2rad(max_sza) if max_sza is not None else max_sza
 
     # Cosine correction
-    corr = (1. / cos_zen).astype(data.dtype, copy=False)
+    corr = (1. / cos_zen).astype(dtype, copy=False)
     if max_sza is not None:
         # gradually fall off for larger zenith angle
         grad_factor = (np.arccos(cos_zen) - limit_rad) / (max_sza_rad - limit_rad)
@@ -577,11 +767,11 @@ def _sunzen_corr_cos_ndarray(data: np.ndarray,
     corr = np.where(
         cos_zen > limit_cos,
         corr,
-        (grad_factor / limit_cos).astype(data.dtype, copy=False)
+        (grad_factor / limit_cos).astype(dtype, copy=False)
     )
     # Force "night" pixels to 0 (where SZA is invalid)
     corr[np.isnan(cos_zen)] = 0
-    return data * corr
+    return corr
 
 
 def sunzen_reduction(data: da.Array,
@@ -589,15 +779,22 @@ def sunzen_reduction(data: da.Array,
                      limit: float = 55.,
                      max_sza: float = 90.,
                      strength: float = 1.5) -> da.Array:
-    """Reduced strength of signal at high sun zenith angles."""
-    return da.map_blocks(_sunzen_reduction_ndarray, data, sunz, limit, max_sza, strength,
-                         meta=np.array((), dtype=data.dtype), chunks=data.chunks)
-
-def _sunzen_reduction_ndarray(data: np.ndarray,
-                              sunz: np.ndarray,
-                              limit: float,
-                              max_sza: float,
-                              strength: float) -> np.ndarray:
+    """Reduced strength of signal at high sun zenith angles.
+
+    Like for :func:`sunzen_corr_cos`, the reduction factors are computed
+    once for all bands reduced with the same ``sunz``.
+
+    """
+    corr = da.map_blocks(_sunzen_reduction_factor_ndarray, sunz, limit, max_sza, strength, data.dtype,
+                         meta=np.array((), dtype=data.dtype), dtype=data.dtype)
+    return data * corr
+
+
+def _sunzen_reduction_factor_ndarray(sunz: np.ndarray,
+                                     limit: float,
+                                     max_sza: float,
+                                     strength: float,
+                                     dtype: np.dtype) -> np.ndarray:
     # compute reduction factor (0.0 - 1.0) between limit and maz_sza
     reduction_factor = (sunz - limit) / (max_sza - limit)
     reduction_factor = reduction_factor.clip(0., 1.)
@@ -613,12 +810,8 @@ def _sunzen_reduction_ndarray(data: np.ndarray,
                 reduction_factor ** strength + (1 - reduction_factor) ** strength)
 
     # compute final correction term, with no reduction for angles < limit
-    corr = np.where(sunz < limit, 1.0, reduction_factor)
+    corr = np.where(sunz < limit, 1.0, reduction_factor).astype(dtype, copy=False)
 
     # force "night" pixels to 0 (where SZA is invalid)
     corr[np.isnan(sunz)] = 0
-
-    # reduce data signal with correction term
-    res = data * corr
-
-    return res
+    return corr
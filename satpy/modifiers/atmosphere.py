@@ -18,6 +18,7 @@
 """Modifiers related to atmospheric corrections or adjustments."""
 
 import logging
+from functools import lru_cache
 
 import dask.array as da
 import numpy as np
@@ -73,7 +74,6 @@ class PSPRayleighReflectance(ModifierBase):
 
         Uses pyspectral.
         """
-        from pyspectral.rayleigh import Rayleigh
         projectables = projectables + (optional_datasets or [])
         if len(projectables) != 6:
             vis, red = self.match_data_arrays(projectables)
@@ -104,9 +104,8 @@ class PSPRayleighReflectance(ModifierBase):
         logger.info("Removing Rayleigh scattering with atmosphere '%s' and "
                     "aerosol type '%s' for '%s'",
                     atmosphere, aerosol_type, vis.attrs["name"])
-        corrector = Rayleigh(vis.attrs["platform_name"], vis.attrs["sensor"],
-                             atmosphere=atmosphere,
-                             aerosol_type=aerosol_type)
+        corrector = _get_rayleigh_corrector(vis.attrs["platform_name"], _hashable_sensor(vis.attrs["sensor"]),
+                                            atmosphere, aerosol_type)
 
         try:
             refl_cor_band = corrector.get_reflectance(sunz, satz, ssadiff,
@@ -131,12 +130,31 @@ class PSPRayleighReflectance(ModifierBase):
         return proj
 
 
-def _call_mapped_correction(satz, band_data, corrector, band_name):
-    # need to convert to masked array
-    orig_dtype = band_data.dtype
-    band_data = np.ma.masked_where(np.isnan(band_data), band_data)
-    res = corrector.get_correction(satz, band_name, band_data)
-    return res.filled(np.nan).astype(orig_dtype, copy=False)
+def _hashable_sensor(sensor):
+    """Get the sensor attribute in a form usable as key of the corrector caches.
+
+    Sensors given as a set of one sensor are passed as the sensor name, several
+    sensors are passed as a sorted tuple.
+
+    """
+    if not isinstance(sensor, (set, frozenset, list)):
+        return sensor
+    sensors = tuple(sorted(sensor))
+    return sensors[0] if len(sensors) == 1 else sensors
+
+
+@lru_cache(maxsize=8)
+def _get_rayleigh_corrector(platform_name, sensor, atmosphere, aerosol_type):
+    """Get the pyspectral Rayleigh corrector, created once per process for every configuration."""
+    from pyspectral.rayleigh import Rayleigh
+    return Rayleigh(platform_name, sensor, atmosphere=atmosphere, aerosol_type=aerosol_type)
+
+
+@lru_cache(maxsize=8)
+def _get_atmospherical_corrector(platform_name, sensor):
+    """Get the pyspectral IR atmospherical corrector, created once per process for every platform and sensor."""
+    from pyspectral.atm_correction_ir import AtmosphericalCorrection
+    return AtmosphericalCorrection(platform_name, sensor)
 
 
 class PSPAtmosphericalCorrection(ModifierBase):
@@ -147,8 +165,6 @@ class PSPAtmosphericalCorrection(ModifierBase):
 
         Uses pyspectral.
         """
-        from pyspectral.atm_correction_ir import AtmosphericalCorrection
-
         band = projectables[0]
 
         if optional_datasets:
@@ -158,13 +174,11 @@ class PSPAtmosphericalCorrection(ModifierBase):
         satz = satz.data  # get dask array underneath
 
         logger.info("Correction for limb cooling")
-        corrector = AtmosphericalCorrection(band.attrs["platform_name"],
-                                            band.attrs["sensor"])
-
-        atm_corr = da.map_blocks(_call_mapped_correction, satz, band.data,
-                                 corrector=corrector,
-                                 band_name=band.attrs["name"],
-                                 meta=np.array((), dtype=band.dtype))
+        corrector = _get_atmospherical_corrector(band.attrs["platform_name"], _hashable_sensor(band.attrs["sensor"]))
+        # with dask arrays the correction is applied per chunk and NaNs stay NaN,
+        # no conversion to masked arrays needed
+        atm_corr = corrector.get_correction(da.asarray(satz), band.attrs["name"], da.asarray(band.data))
+        atm_corr = atm_corr.astype(band.dtype, copy=False)
         proj = xr.DataArray(atm_corr, attrs=band.attrs,
                             dims=band.dims, coords=band.coords)
         self.apply_modifier_info(band, proj)
@@ -40,7 +40,9 @@ import datetime
 import inspect
 import logging
 import warnings
+from collections import OrderedDict
 
+import dask
 import dask.array as da
 import numpy as np
 import xarray as xr
@@ -48,7 +50,7 @@ from pyorbital.orbital import A as EARTH_RADIUS
 from pyorbital.orbital import get_observer_look
 from pyproj import Geod
 from pyresample.bucket import BucketResampler
-from pyresample.geometry import SwathDefinition
+from pyresample.geometry import AreaDefinition, SwathDefinition
 
 from satpy.modifiers import ModifierBase
 from satpy.resample.base import resample_dataset
@@ -56,6 +58,12 @@ from satpy.utils import get_satpos, lonlat2xyz, xyz2lonlat
 
 logger = logging.getLogger(__name__)
 
+PARALLAX_CACHE_SIZE = 8
+# (kind, base area, height dataset, options) -> corrected area or indices, see ParallaxCorrectionModifier
+_corrected_geolocation_cache: "OrderedDict[tuple, object]" = OrderedDict()
+# number of base area rows and columns used to estimate the largest parallax shift
+_SHIFT_ESTIMATE_SAMPLES = 65
+
 
 class MissingHeightError(ValueError):
     """Raised when heights do not overlap with area to be corrected."""
@@ -340,6 +348,59 @@ class ParallaxCorrection:
 
         return self._get_swathdef_from_lon_lat(proj_lon, proj_lat)
 
+    def corrected_indices(self, cth_dataset, max_cloud_top_height=20_000,
+                          cth_resampler="nearest", cth_radius_of_influence=50000,
+                          lonlat_chunks=1024):
+        """Return the parallax corrected geolocation as indices into the base area.
+
+        Like :meth:`corrected_area`, but instead of a
+        :class:`~pyresample.geometry.SwathDefinition`, return for every pixel
+        the row and column of the base area pixel containing its corrected
+        geolocation.  No pixel is shifted further than a cloud at
+        ``max_cloud_top_height`` would be.  Rather than binning the shifted
+        pixels of the whole area with the
+        :class:`~pyresample.bucket.BucketResampler`, each chunk of the base
+        area therefore only bins the pixels within that distance, and the
+        data can be resampled one chunk at a time in the same way.  The
+        ``debug_mode`` diagnostics are not available.
+
+        Args:
+            cth_dataset (xarray.DataArray): Cloud top height in meters, see
+                :meth:`corrected_area`.
+            max_cloud_top_height (numbers.Number, Optional): Largest (cloud
+                top) height in meters to expect.  Defaults to 20000.
+            cth_resampler (str, Optional): Resampler to use when resampling the
+                (cloud top) height to the base area.  Defaults to "nearest".
+            cth_radius_of_influence (numbers.Number, Optional): Radius of influence to use when
+                resampling the (cloud top) height to the base area.  Defaults
+                to 50000.
+            lonlat_chunks (int, Optional): Chunking to use when calculating lon/lats.
+
+        Returns:
+            Tuple of the dask arrays with the rows and columns, -1 where
+            there is no corrected geolocation in the base area, and the
+            largest distance in pixels between a pixel and the source pixel
+            of its corrected geolocation.
+        """
+        if not isinstance(self.base_area, AreaDefinition):
+            raise ValueError("Corrected indices require an AreaDefinition as base area.")
+        (sat_lon, sat_lat, sat_alt_m) = _get_satpos_from_cth(cth_dataset)
+        self._check_overlap(cth_dataset)
+        cth_dataset = self._prepare_cth_dataset(
+                cth_dataset, resampler=cth_resampler,
+                radius_of_influence=cth_radius_of_influence,
+                lonlat_chunks=lonlat_chunks)
+        (base_lon, base_lat) = (da.asarray(lonlat) for lonlat in self.base_area.get_lonlats(chunks=lonlat_chunks))
+        (corrected_lon, corrected_lat) = get_parallax_corrected_lonlats(
+                sat_lon, sat_lat, sat_alt_m,
+                base_lon, base_lat, da.asarray(cth_dataset.data).rechunk(base_lon.chunks))
+        window = _get_max_shift_in_pixels(self.base_area, sat_lon, sat_lat, sat_alt_m, max_cloud_top_height)
+        shifted_indices = _get_base_area_indices(corrected_lon, corrected_lat, self.base_area)
+        diffs = da.stack((corrected_lon - base_lon, corrected_lat - base_lat))
+        inv_diffs = _get_windowed_abs_max(shifted_indices, diffs, window)
+        indices = _get_base_area_indices(base_lon - inv_diffs[0], base_lat - inv_diffs[1], self.base_area)
+        return (indices[0], indices[1], window)
+
     @staticmethod
     def _get_swathdef_from_lon_lat(lon, lat):
         """Return a SwathDefinition from lon/lat.
@@ -496,14 +557,27 @@ class ParallaxCorrectionModifier(ModifierBase):
         Radius of influence to use when resampling the dataset onto the
         swathdefinition describing the parallax-corrected area.  Defaults to
         50000.  This always uses nearest neighbour resampling.
+    performance_mode
+        Instead of inverting the parallax shift with a bucket resampler and
+        resampling the dataset with a KD-tree, both over the whole area, get
+        each chunk of the result from the pixels within the largest possible
+        parallax shift of it, see :meth:`ParallaxCorrection.corrected_indices`.
+        The selected source pixel can differ from the nearest neighbour close
+        to pixel boundaries.  Only used when the dataset to be corrected is on
+        an :class:`~pyresample.geometry.AreaDefinition`.  Defaults to False.
+    max_cloud_top_height
+        Largest (cloud top) height in meters, limiting how far the source
+        pixels are searched in performance mode.  Defaults to 20000.
 
     Alternately, you can use the lower-level API directly with the
     :class:`ParallaxCorrection` class, which may be more efficient if multiple
     datasets need to be corrected.  RGB Composites cannot be modified in this way
     (i.e. you can't replace "VIS006" by "natural_color").  To get a parallax
     corrected RGB composite, create a new composite where each input has the
-    modifier applied.  The parallax calculation should only occur once, because
-    calculations are happening via dask and dask should reuse the calculation.
+    modifier applied.  The parallax corrected geolocation for the last
+    :data:`PARALLAX_CACHE_SIZE` combinations of height dataset, area and
+    options is kept in memory and reused by all datasets corrected with it,
+    unless ``debug_mode`` is set.
     """
 
     def __call__(self, projectables, optional_datasets=None, **info):
@@ -514,22 +588,46 @@ class ParallaxCorrectionModifier(ModifierBase):
         """
         (to_be_corrected, cth) = projectables
         base_area = to_be_corrected.attrs["area"]
-        corrector = self._get_corrector(base_area)
-        plax_corr_area = corrector(
-                cth,
-                cth_resampler=self.attrs.get("cth_resampler", "nearest"),
-                cth_radius_of_influence=self.attrs.get("cth_radius_of_influence", 50_000),
-                lonlat_chunks=self.attrs.get("lonlat_chunks", 1024),
-                )
-        res = resample_dataset(
-                to_be_corrected, plax_corr_area,
-                radius_of_influence=self.attrs.get("dataset_radius_of_influence", 50_000),
-                fill_value=np.nan)
+        if self.attrs.get("performance_mode", False) and isinstance(base_area, AreaDefinition):
+            (rows, cols, window) = self._get_cached("indices", base_area, cth)
+            res = _resample_to_corrected_indices(to_be_corrected, rows, cols, window)
+        else:
+            plax_corr_area = self._get_cached("area", base_area, cth)
+            res = resample_dataset(
+                    to_be_corrected, plax_corr_area,
+                    radius_of_influence=self.attrs.get("dataset_radius_of_influence", 50_000),
+                    fill_value=np.nan)
         res.attrs["area"] = to_be_corrected.attrs["area"]
         self.apply_modifier_info(to_be_corrected, res)
 
         return res
 
+    def _get_cached(self, kind, base_area, cth):
+        """Get the corrected area or indices, reusing those computed for the same heights and options."""
+        kwargs = {
+                "cth_resampler": self.attrs.get("cth_resampler", "nearest"),
+                "cth_radius_of_influence": self.attrs.get("cth_radius_of_influence", 50_000),
+                "lonlat_chunks": self.attrs.get("lonlat_chunks", 1024),
+                }
+        if kind == "indices":
+            kwargs["max_cloud_top_height"] = self.attrs.get("max_cloud_top_height", 20_000)
+        corrector = self._get_corrector(base_area)
+        compute = corrector.corrected_indices if kind == "indices" else corrector
+        if corrector.debug_mode:
+            return compute(cth, **kwargs)
+        key = (kind, base_area, cth.attrs.get("area"), dask.base.tokenize(cth.data),
+               dask.base.tokenize(cth.attrs.get("orbital_parameters")), tuple(sorted(kwargs.items())))
+        try:
+            result = _corrected_geolocation_cache[key]
+            _corrected_geolocation_cache.move_to_end(key)
+            logger.debug("Reusing parallax corrected geolocation")
+        except KeyError:
+            result = compute(cth, **kwargs)
+            _corrected_geolocation_cache[key] = result
+            while len(_corrected_geolocation_cache) > PARALLAX_CACHE_SIZE:
+                _corrected_geolocation_cache.popitem(last=False)
+        return result
+
     def _get_corrector(self, base_area):
         # only pass on those attributes that are arguments by
         # ParallaxCorrection.__init__
@@ -551,3 +649,137 @@ def _get_satpos_from_cth(cth_dataset):
     (sat_lon, sat_lat, sat_alt) = get_satpos(
             cth_dataset, use_tle=True)
     return (sat_lon, sat_lat, sat_alt)
+
+
+def _get_base_area_indices(lons, lats, base_area):
+    """Get the rows and columns of the base area pixels containing the lons and lats, -1 outside of it."""
+    return da.map_blocks(_get_chunk_base_area_indices, lons, lats, base_area=base_area,
+                         new_axis=0, chunks=((2,),) + lons.chunks, dtype=np.int32,
+                         meta=np.array((), dtype=np.int32))
+
+
+def _get_chunk_base_area_indices(lons, lats, base_area):
+    """Get the base area rows and columns of one chunk of lons and lats."""
+    (cols, rows) = base_area.get_array_coordinates_from_lonlat(lons, lats)
+    with np.errstate(invalid="ignore"):
+        rows = np.round(rows)
+        cols = np.round(cols)
+        invalid = ~((rows >= 0) & (rows < base_area.height) & (cols >= 0) & (cols < base_area.width))
+    rows[invalid] = -1
+    cols[invalid] = -1
+    return np.stack((rows, cols)).astype(np.int32)
+
+
+def _get_windowed_abs_max(indices, diffs, window):
+    """Get for every pixel the shifts with the largest absolute value of the pixels shifted into it.
+
+    This gives the same result as
+    :meth:`pyresample.bucket.BucketResampler.get_abs_max`, but gets each
+    chunk from the pixels within ``window`` pixels of it.
+    """
+    depth = {1: min(window, indices.shape[1]), 2: min(window, indices.shape[2])}
+    boundary = {axis: "none" for axis in depth}
+    chunks = _get_window_chunks(indices.chunks[1:], depth.values())
+    indices = da.overlap.overlap(indices.rechunk(((2,),) + chunks), depth=depth, boundary=boundary)
+    diffs = da.overlap.overlap(diffs.rechunk(((2,),) + chunks), depth=depth, boundary=boundary)
+    return da.map_blocks(_get_chunk_abs_max, indices, diffs, chunks=((2,),) + chunks,
+                         dtype=diffs.dtype, meta=np.array((), dtype=diffs.dtype), base_chunks=chunks)
+
+
+def _get_window_chunks(chunks, depths):
+    """Get chunks at least as large as the overlap with the neighbouring chunks."""
+    return tuple(da.overlap.ensure_minimum_chunksize(depth, axis_chunks) if depth else axis_chunks
+                 for (axis_chunks, depth) in zip(chunks, depths))
+
+
+def _get_chunk_abs_max(indices, diffs, base_chunks, block_info=None):
+    """Get the shifts with the largest absolute value shifted into one chunk."""
+    (_, chunk_y, chunk_x) = block_info[0]["chunk-location"]
+    (height, width) = (base_chunks[0][chunk_y], base_chunks[1][chunk_x])
+    rows = indices[0] - sum(base_chunks[0][:chunk_y])
+    cols = indices[1] - sum(base_chunks[1][:chunk_x])
+    inside = (indices[0] >= 0) & (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+    res = np.full((2, height * width), np.nan, dtype=diffs.dtype)
+    for (band_res, band_diffs) in zip(res, diffs):
+        values = band_diffs[inside]
+        valid = ~np.isnan(values)
+        bins = (rows[inside] * width + cols[inside])[valid]
+        values = values[valid]
+        max_ = np.full(height * width, -np.inf, dtype=diffs.dtype)
+        min_ = np.full(height * width, np.inf, dtype=diffs.dtype)
+        np.maximum.at(max_, bins, values)
+        np.minimum.at(min_, bins, values)
+        band_res[:] = np.where(-min_ > max_, min_, max_)
+        band_res[np.isinf(band_res)] = np.nan
+    return res.reshape((2, height, width))
+
+
+def _get_max_shift_in_pixels(base_area, sat_lon, sat_lat, sat_alt, height):
+    """Estimate the largest parallax shift in pixels for heights up to ``height``.
+
+    The shift is calculated on a regular subset of the base area pixels.  A
+    margin accounts for larger shifts in between those and for the inversion
+    of the shift.
+    """
+    rows = np.unique(np.linspace(0, base_area.height - 1, _SHIFT_ESTIMATE_SAMPLES).round())
+    cols = np.unique(np.linspace(0, base_area.width - 1, _SHIFT_ESTIMATE_SAMPLES).round())
+    (cols, rows) = np.meshgrid(cols, rows)
+    (lons, lats) = base_area.get_lonlat_from_array_coordinates(cols, rows)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        (shifted_lons, shifted_lats) = get_parallax_corrected_lonlats(
+                sat_lon, sat_lat, sat_alt, lons, lats, np.full(lons.shape, height, dtype=np.float64))
+        (shifted_cols, shifted_rows) = base_area.get_array_coordinates_from_lonlat(shifted_lons, shifted_lats)
+        shift = np.maximum(np.abs(shifted_cols - cols), np.abs(shifted_rows - rows))
+    shift = shift[np.isfinite(shift)]
+    if shift.size == 0:
+        return 0
+    return int(min(np.ceil(shift.max() * 1.1) + 2, max(base_area.shape)))
+
+
+def _resample_to_corrected_indices(data_arr, rows, cols, window, fill_value=np.nan):
+    """Get the source pixels at the corrected indices, chunk by chunk.
+
+    Each chunk of the result only reads the source pixels within ``window``
+    pixels of the chunk.
+    """
+    src = data_arr.data if isinstance(data_arr.data, da.Array) else da.from_array(
+            data_arr.data, chunks=data_arr.shape[:-2] + rows.chunks)
+    depth = {axis: min(window, src.shape[axis]) for axis in (src.ndim - 2, src.ndim - 1)}
+    src = src.rechunk(dict(zip(depth, _get_window_chunks(src.chunks[-2:], depth.values()))))
+    rows = rows.rechunk(src.chunks[-2:])
+    cols = cols.rechunk(src.chunks[-2:])
+    src_window = da.overlap.overlap(src, depth=depth, boundary={axis: "none" for axis in depth})
+    indices = da.map_blocks(_get_chunk_window_indices, rows, cols, window=window, new_axis=0,
+                            chunks=((2,),) + rows.chunks, dtype=np.int32, meta=np.array((), dtype=np.int32))
+    dtype = np.result_type(src.dtype, np.float32) if np.isnan(fill_value) else src.dtype
+    extra_dims = tuple(f"d{idx}" for idx in range(src.ndim - 2))
+    res = da.blockwise(_sample_window, extra_dims + ("y", "x"),
+                       src_window, extra_dims + ("y", "x"),
+                       indices[0], ("y", "x"),
+                       indices[1], ("y", "x"),
+                       fill_value=fill_value, res_dtype=dtype, align_arrays=False,
+                       adjust_chunks={"y": src.chunks[-2], "x": src.chunks[-1]},
+                       dtype=dtype, meta=np.array((), dtype=dtype))
+    return xr.DataArray(res, dims=data_arr.dims, coords=data_arr.coords, attrs=data_arr.attrs.copy())
+
+
+def _get_chunk_window_indices(rows, cols, window, block_info=None):
+    """Get the indices of one chunk relative to the window of source data around it, -1 outside of it."""
+    ((y_start, y_end), (x_start, x_end)) = block_info[0]["array-location"]
+    (height, width) = block_info[0]["shape"]
+    (win_y0, win_x0) = (max(y_start - window, 0), max(x_start - window, 0))
+    win_rows = rows - win_y0
+    win_cols = cols - win_x0
+    invalid = ((rows < 0) | (win_rows < 0) | (rows >= min(y_end + window, height)) |
+               (win_cols < 0) | (cols >= min(x_end + window, width)))
+    win_rows[invalid] = -1
+    win_cols[invalid] = -1
+    return np.stack((win_rows, win_cols))
+
+
+def _sample_window(src, rows, cols, fill_value, res_dtype):
+    """Get the source pixels for one chunk from the window of source data around it."""
+    res = np.full(src.shape[:-2] + rows.shape, fill_value, dtype=res_dtype)
+    valid = rows >= 0
+    res[..., valid] = src[..., rows[valid], cols[valid]]
+    return res
@@ -17,9 +17,14 @@
 # satpy.  If not, see <http://www.gnu.org/licenses/>.
 """Modifier classes dealing with spectral domain changes or corrections."""
 
+import copy
 import logging
+from functools import lru_cache
 
+import dask.array as da
+import numpy as np
 import xarray as xr
+from dask.base import tokenize
 
 from satpy.modifiers import ModifierBase
 
@@ -123,8 +128,7 @@ class NIRReflectance(ModifierBase):
 
     def _get_reflectance_as_dask(self, da_nir, da_tb11, da_tb13_4, da_sun_zenith, metadata):
         """Calculate 3.x reflectance in % with pyspectral from dask arrays."""
-        reflectance_3x_calculator = self._init_reflectance_calculator(metadata)
-        return reflectance_3x_calculator.reflectance_from_tbs(da_sun_zenith, da_nir, da_tb11, tb_ir_co2=da_tb13_4) * 100
+        return self._map_calculator_blocks(da_nir, da_tb11, da_tb13_4, da_sun_zenith, metadata, emissive=False)
 
     def _init_reflectance_calculator(self, metadata):
         """Initialize the 3.x reflectance derivations."""
@@ -132,10 +136,45 @@ class NIRReflectance(ModifierBase):
             logger.info("Couldn't load pyspectral")
             raise ImportError("No module named pyspectral.near_infrared_reflectance")
 
-        reflectance_3x_calculator = Calculator(metadata["platform_name"], metadata["sensor"], metadata["name"],
-                                               sunz_threshold=self.sun_zenith_threshold,
-                                               masking_limit=self.masking_limit)
-        return reflectance_3x_calculator
+        return _get_reflectance_calculator(metadata["platform_name"], metadata["sensor"], metadata["name"],
+                                           self.sun_zenith_threshold, self.masking_limit)
+
+    def _map_calculator_blocks(self, da_nir, da_tb11, da_tb13_4, da_sun_zenith, metadata, emissive):
+        """Derive the reflectance in % or the emissive part one chunk at a time.
+
+        All inputs are cast to the data type of the NIR band, so that no
+        larger temporary arrays are created for single precision data.
+        """
+        reflectance_3x_calculator = self._init_reflectance_calculator(metadata)
+        dtype = da_nir.dtype
+        inputs = [da.asarray(arr).astype(dtype) for arr in (da_sun_zenith, da_nir, da_tb11, da_tb13_4)
+                  if arr is not None]
+        # name the result from the calculator settings instead of hashing the calculator itself
+        name = "nir-{}-{}".format("emissive" if emissive else "reflectance", tokenize(
+            metadata["platform_name"], metadata["sensor"], metadata["name"], self.sun_zenith_threshold,
+            self.masking_limit, *inputs))
+        return da.map_blocks(_calculate_nir_block, *inputs, calculator=reflectance_3x_calculator,
+                             emissive=emissive, name=name, dtype=dtype, meta=np.array((), dtype=dtype))
+
+
+@lru_cache(maxsize=8)
+def _get_reflectance_calculator(platform_name, sensor, band_name, sunz_threshold, masking_limit):
+    """Get the pyspectral NIR reflectance calculator, created once per process for every configuration.
+
+    Creating a calculator reads the spectral response of the band and the
+    brightness temperature to radiance LUT, and can create the latter.
+    """
+    return Calculator(platform_name, sensor, band_name, sunz_threshold=sunz_threshold, masking_limit=masking_limit)
+
+
+def _calculate_nir_block(sun_zenith, nir, tb11, tb13_4=None, calculator=None, emissive=False):
+    """Derive the reflectance in % or the emissive part of one chunk of data."""
+    # the calculator keeps intermediate results as attributes, so every chunk needs its own
+    calculator = copy.copy(calculator)
+    reflectance = calculator.reflectance_from_tbs(sun_zenith, nir, tb11, tb_ir_co2=tb13_4)
+    if emissive:
+        return np.asarray(calculator.emissive_part_3x(), dtype=nir.dtype)
+    return np.asarray(reflectance * 100, dtype=nir.dtype)
 
 
 class NIREmissivePartFromReflectance(NIRReflectance):
@@ -175,9 +214,7 @@ class NIREmissivePartFromReflectance(NIRReflectance):
 
     def _get_emissivity_as_dask(self, da_nir, da_tb11, da_tb13_4, da_sun_zenith, metadata):
         """Get the emissivity from pyspectral."""
-        reflectance_3x_calculator = self._init_reflectance_calculator(metadata)
         # Use the nir and thermal ir brightness temperatures and derive the reflectance using
         # PySpectral. The reflectance is stored internally in PySpectral and
         # needs to be derived first in order to get the emissive part.
-        reflectance_3x_calculator.reflectance_from_tbs(da_sun_zenith, da_nir, da_tb11, tb_ir_co2=da_tb13_4)
-        return reflectance_3x_calculator.emissive_part_3x()
+        return self._map_calculator_blocks(da_nir, da_tb11, da_tb13_4, da_sun_zenith, metadata, emissive=True)
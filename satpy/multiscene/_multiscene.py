@@ -320,8 +320,34 @@ class MultiScene(object):
         return self._generate_scene_func(self._scenes, "crop", True, *args, **kwargs)
 
     def resample(self, destination=None, **kwargs):
-        """Resample the multiscene."""
-        return self._generate_scene_func(self._scenes, "resample", True, destination=destination, **kwargs)
+        """Resample the multiscene.
+
+        The keyword arguments are the same as for :meth:`Scene.resample <satpy.scene.Scene.resample>`.
+        A :class:`~satpy.resample.plan.ResamplePlan` is created from the
+        first Scene and used for all Scenes with the same areas, so the data
+        reductions and resampling indices are only computed once. Other
+        Scenes are resampled on their own.
+
+        """
+        new_gen = self._resample_scenes(self._scenes, destination, **kwargs)
+        new_gen = new_gen if self.is_generator else list(new_gen)
+        return self.__class__(new_gen)
+
+    @staticmethod
+    def _resample_scenes(gen, destination, datasets=None, generate=True, unload=True, **resample_kwargs):
+        """Resample every Scene, with a plan created from the first Scene where possible."""
+        from satpy.resample.plan import ResamplePlan
+
+        plan = None
+        for scn in gen:
+            if plan is None:
+                plan = ResamplePlan.from_scene(scn, destination, datasets=datasets, **resample_kwargs)
+            if plan.is_compatible(scn, datasets=datasets):
+                yield plan.apply(scn, datasets=datasets, generate=generate, unload=unload)
+            else:
+                log.debug("Scene areas differ from the first Scene, not using its resample plan.")
+                yield scn.resample(destination, datasets=datasets, generate=generate, unload=unload,
+                                   **resample_kwargs)
 
     def blend(
             self,
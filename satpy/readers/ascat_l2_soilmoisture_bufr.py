@@ -36,6 +36,7 @@ except ImportError as e:
         """Missing eccodes-python and/or eccodes C-library installation. Use conda to install eccodes.
            Error: """, e)
 
+from satpy.readers.core.bufr import BufrArrayCache
 from satpy.readers.core.file_handlers import BaseFileHandler
 from satpy.utils import get_legacy_chunk_size
 
@@ -56,6 +57,8 @@ class AscatSoilMoistureBufr(BaseFileHandler):
         self.metadata = {}
         self.metadata["start_time"] = start_time
         self.metadata["end_time"] = end_time
+        self._bufr_arrays = BufrArrayCache(lambda: open(self.filename, "rb"))
+        self._bufr_arrays.add_keys(["numberOfSubsets"])
 
     @property
     def start_time(self):
@@ -101,23 +104,19 @@ class AscatSoilMoistureBufr(BaseFileHandler):
                 date_min, date_max = self.extract_msg_date_extremes(bufr, date_min, date_max)
             return date_min, date_max
 
+    def prepare_datasets(self, dataset_infos):
+        """Register the BUFR keys of the datasets to load for decoding in a single pass."""
+        self._bufr_arrays.add_keys(ds_info["key"] for ds_info in dataset_infos if "key" in ds_info)
+
     def get_bufr_data(self, key):
         """Get BUFR data by key."""
-        attr = np.array([])
-        with open(self.filename, "rb") as fh:
-            while True:
-                # get handle for message
-                bufr = ec.codes_bufr_new_from_file(fh)
-                if bufr is None:
-                    break
-                ec.codes_set(bufr, "unpack", 1)
-                tmp = ec.codes_get_array(bufr, key, float)
-                if len(tmp) == 1:
-                    size = ec.codes_get(bufr, "numberOfSubsets")
-                    tmp = np.resize(tmp, size)
-                attr = np.append(attr, tmp)
-                ec.codes_release(bufr)
-        return attr
+        values = self._bufr_arrays[key]
+        if any(msg_values is None for msg_values in values):
+            raise KeyError(f"Key {key} does not exist in all BUFR messages")
+        sizes = [int(size[0]) for size in self._bufr_arrays["numberOfSubsets"]]
+        values = [np.resize(msg_values, size) if len(msg_values) == 1 else msg_values
+                  for msg_values, size in zip(values, sizes)]
+        return np.concatenate(values) if values else np.array([])
 
     def get_dataset(self, dataset_id, dataset_info):
         """Get dataset using the BUFR key in dataset_info."""
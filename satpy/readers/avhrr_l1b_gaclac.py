@@ -43,12 +43,11 @@ from pygac.lac_klm import LACKLMReader
 from pygac.lac_pod import LACPODReader
 
 from satpy.readers.core.file_handlers import BaseFileHandler
-from satpy.utils import datetime64_to_pydatetime, get_legacy_chunk_size
+from satpy.readers.core.utils import get_scan_aligned_chunks
+from satpy.utils import datetime64_to_pydatetime
 
 logger = logging.getLogger(__name__)
 
-CHUNK_SIZE = get_legacy_chunk_size()
-
 spacecrafts = {7: "NOAA 15", 3: "NOAA 16", 13: "NOAA 18", 15: "NOAA 19"}
 
 AVHRR3_CHANNEL_NAMES = {"1": 0, "2": 1, "3A": 2, "3B": 3, "4": 4, "5": 5}
@@ -193,10 +192,9 @@ class GACLACFile(BaseFileHandler):
                 or self.strip_invalid_coords):
             data, times = self.slice(data=data, times=times)
 
-        # Create data array
-        chunk_cols = data.shape[1]
-        chunk_lines = int((CHUNK_SIZE ** 2) / chunk_cols)
-        res = xr.DataArray(da.from_array(data, chunks=(chunk_lines, chunk_cols)),
+        # Create data array, AVHRR scans one line at a time
+        chunks = get_scan_aligned_chunks(data.shape, 1, data.dtype)
+        res = xr.DataArray(da.from_array(data, chunks=chunks),
                            dims=["y", xdim], attrs=info)
         if xcoords:
             res[xdim] = xcoords
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Utilities for decoding BUFR files with eccodes."""
+
+import numpy as np
+
+try:
+    import eccodes as ec
+except ImportError:
+    raise ImportError(
+        "Missing eccodes-python and/or eccodes C-library installation. Use conda to install eccodes")
+
+
+def decode_bufr_messages(fh, keys):
+    """Unpack the given keys from all BUFR messages of a file in a single pass.
+
+    Every message is unpacked only once and all keys are read from it before moving
+    on to the next message.
+
+    Args:
+        fh: BUFR file opened in binary mode.
+        keys: BUFR keys to extract.
+
+    Returns:
+        Dictionary mapping each key to a list holding one float array per message.
+        Messages in which a key is not defined contribute ``None`` to that list.
+
+    """
+    arrays = {key: [] for key in keys}
+    while True:
+        bufr = ec.codes_bufr_new_from_file(fh)
+        if bufr is None:
+            break
+        ec.codes_set(bufr, "unpack", 1)
+        for key, values in arrays.items():
+            if ec.codes_is_defined(bufr, key):
+                values.append(np.asarray(ec.codes_get_array(bufr, key, float)))
+            else:
+                values.append(None)
+        ec.codes_release(bufr)
+    return arrays
+
+
+class BufrArrayCache:
+    """Per file cache of BUFR key arrays.
+
+    Keys registered with :meth:`add_keys` are decoded together with the first key that
+    is requested, so that a file is read once no matter how many datasets are loaded
+    from it.
+    """
+
+    def __init__(self, opener):
+        """Initialize the cache.
+
+        Args:
+            opener: Callable returning the BUFR file opened in binary mode.
+
+        """
+        self._opener = opener
+        self._keys = set()
+        self._arrays = {}
+
+    def add_keys(self, keys):
+        """Register keys to decode in the next pass over the file."""
+        self._keys.update(keys)
+
+    def __getitem__(self, key):
+        """Get the per message arrays for *key*, reading the file if needed."""
+        if key not in self._arrays:
+            keys = (self._keys | {key}) - self._arrays.keys()
+            with self._opener() as fh:
+                self._arrays.update(decode_bufr_messages(fh, keys))
+        return self._arrays[key]
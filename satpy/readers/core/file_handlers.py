@@ -179,6 +179,21 @@ class BaseFileHandler:
             return True
         return None
 
+    def prepare_datasets(self, dataset_infos):
+        """Prepare loading the datasets described by *dataset_infos* from this file.
+
+        This is called once per ``load`` with the information of all datasets
+        about to be loaded from the file type of this file handler, before
+        :meth:`get_dataset` is called for any of them. File handlers can
+        override it to read the data of all these datasets in a single pass
+        over the file. By default it does nothing.
+
+        Args:
+            dataset_infos (list): Dataset information dictionaries of the
+                datasets to load.
+
+        """
+
     def available_datasets(self, configured_datasets=None):
         """Get information of available datasets in this file.
 
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Utilities for indexing the messages of GRIB files.
+
+A message index is a list of dictionaries, one per GRIB message, holding the
+byte offset and length of the message together with the GRIB keys a reader
+needs to find its datasets. Readers build the index once when a file is opened
+and use it to seek directly to the message of a requested dataset.
+
+When the ``readers.cache_grib_index`` setting is enabled the index is also
+stored as JSON in the ``cache_dir`` and reused the next time the same file is
+opened. See :ref:`config_cache_grib_index_setting` for more information.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+import numpy as np
+
+import satpy
+
+LOG = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+_BLOCK_SIZE = 1024 * 1024
+_END_MARKER = b"7777"
+
+
+def scan_grib_messages(fh):
+    """Find the byte offset and length of every GRIB message in a file.
+
+    Only the indicator section (section 0) of every message is read, the rest
+    of the message is skipped.
+
+    Args:
+        fh: GRIB file opened in binary mode.
+
+    Returns:
+        List of ``(offset, length)`` tuples, one per message.
+
+    Raises:
+        ValueError: If a message length can't be determined from its indicator
+            section, for example for large GRIB edition 1 messages.
+
+    """
+    messages = []
+    offset = 0
+    while True:
+        offset = _find_next_message(fh, offset)
+        if offset is None:
+            return messages
+        fh.seek(offset)
+        length = _message_length(fh.read(16))
+        fh.seek(offset + length - len(_END_MARKER))
+        if fh.read(len(_END_MARKER)) != _END_MARKER:
+            raise ValueError(f"Unexpected end of GRIB message at offset {offset}")
+        messages.append((offset, length))
+        offset += length
+
+
+def _find_next_message(fh, offset):
+    """Get the offset of the next GRIB message starting at or after *offset*."""
+    fh.seek(offset)
+    tail = b""
+    while True:
+        block = fh.read(_BLOCK_SIZE)
+        if not block:
+            return None
+        data = tail + block
+        pos = data.find(b"GRIB")
+        if pos != -1:
+            return offset - len(tail) + pos
+        offset += len(block)
+        tail = data[-3:]
+
+
+def _message_length(indicator):
+    """Get the total message length from the indicator section."""
+    if len(indicator) < 16:
+        raise ValueError("Truncated GRIB indicator section")
+    edition = indicator[7]
+    if edition == 1:
+        length = int.from_bytes(indicator[4:7], "big")
+        if length & 0x800000:
+            raise ValueError("Large GRIB edition 1 messages are not supported")
+        return length
+    if edition in (2, 3):
+        return int.from_bytes(indicator[8:16], "big")
+    raise ValueError(f"Unknown GRIB edition {edition}")
+
+
+def get_grib_message_index(filename, build_index):
+    """Get the message index of a GRIB file.
+
+    If ``readers.cache_grib_index`` is enabled a previously stored index for
+    the same file is loaded from the ``cache_dir``. Otherwise, or if no index
+    was stored yet, the index is built by calling *build_index* and, if
+    enabled, stored for the next time the file is opened.
+
+    Args:
+        filename: Path of the GRIB file.
+        build_index: Callable without arguments returning the list of message
+            dictionaries for *filename*.
+
+    Returns:
+        List of dictionaries, one per GRIB message.
+
+    """
+    if not satpy.config.get("readers.cache_grib_index", False):
+        return build_index()
+    cache_file = _index_cache_filename(filename)
+    try:
+        with open(cache_file, "r") as index_file:
+            LOG.debug("Using cached GRIB message index %s", cache_file)
+            return json.load(index_file)
+    except (OSError, ValueError):
+        pass
+    index = build_index()
+    _save_index(cache_file, index)
+    return index
+
+
+def _index_cache_filename(filename):
+    """Get the cache file name for the index of a GRIB file.
+
+    The name includes a hash of the absolute path, size and modification time
+    of the file so that a modified file gets a new index.
+
+    """
+    stat = os.stat(filename)
+    file_id = f"{os.path.abspath(filename)}:{stat.st_size}:{stat.st_mtime_ns}:v{INDEX_VERSION}"
+    file_hash = hashlib.sha1(file_id.encode(), usedforsecurity=False).hexdigest()
+    basename = os.path.basename(filename)
+    return os.path.join(satpy.config.get("cache_dir"), "grib_index", f"{basename}_{file_hash}.json")
+
+
+def _save_index(cache_file, index):
+    """Save a message index to a JSON file without leaving partial files behind."""
+    cache_dir = os.path.dirname(cache_file)
+    try:
+        content = json.dumps(index, default=_json_default)
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False) as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_file.name, cache_file)
+    except (OSError, TypeError) as err:
+        LOG.warning("Could not store GRIB message index in %s: %s", cache_file, err)
+
+
+def _json_default(value):
+    """Convert numpy scalars to builtin types for JSON serialization."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -104,7 +104,7 @@ class HDF5FileHandler(BaseFileHandler):
             # these datasets are closed and inaccessible when the file is closed, need to reopen
             f_obj = open_file_or_filename(self.filename)
             dset = h5py.File(f_obj, "r")[key]
-            dset_data = from_h5_array(dset)
+            dset_data = from_h5_array(dset, chunks=self._chunks_for_dataset(key, dset))
             attrs = self._attrs_cache.get(key, dset.attrs)
             if dset.ndim == 2:
                 return xr.DataArray(dset_data, dims=["y", "x"], attrs=attrs)
@@ -112,6 +112,15 @@ class HDF5FileHandler(BaseFileHandler):
 
         return val
 
+    def _chunks_for_dataset(self, key, h5dset):
+        """Get the dask chunks to read the dataset *key* with.
+
+        By default ``None`` is returned and the chunks are determined by dask
+        from the on-disk chunks. Subclasses can override this, for example to
+        chunk swath data by whole scans.
+        """
+        return None
+
     def __contains__(self, item):
         """Get item from file content."""
         return item in self.file_content
@@ -124,11 +133,14 @@ class HDF5FileHandler(BaseFileHandler):
             return default
 
 
-def from_h5_array(h5dset):
-    """Create a dask array from an h5py dataset, ensuring uniqueness of the dask array name."""
-    chunk_size = dc.get("array.chunk-size")
+def from_h5_array(h5dset, chunks=None):
+    """Create a dask array from an h5py dataset, ensuring uniqueness of the dask array name.
 
-    chunks = normalize_chunks(chunk_size, dtype=h5dset.dtype, previous_chunks=h5dset.chunks, shape=h5dset.shape)
+    If *chunks* is not provided they are computed from dask's ``array.chunk-size`` and the on-disk chunks.
+    """
+    if chunks is None:
+        chunk_size = dc.get("array.chunk-size")
+        chunks = normalize_chunks(chunk_size, dtype=h5dset.dtype, previous_chunks=h5dset.chunks, shape=h5dset.shape)
     name = h5dset.name + "-" + tokenize(os.fspath(h5dset.file.filename), h5dset.name, chunks)
 
     dset_data = da.from_array(h5dset, chunks=chunks, name=name)
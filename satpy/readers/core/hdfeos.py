@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+import os
 import re
 from ast import literal_eval
 from contextlib import suppress
@@ -35,7 +36,7 @@ from pyhdf.SD import SD
 
 from satpy import DataID
 from satpy.readers.core.file_handlers import BaseFileHandler
-from satpy.utils import normalize_low_res_chunks
+from satpy.readers.core.utils import cache_interpolated_navigation, get_scan_aligned_chunks
 
 logger = logging.getLogger(__name__)
 
@@ -236,13 +237,11 @@ class HDFEOSBaseFileReader(BaseFileHandler):
         scan_length_250m = 40
         var_shape = hdf_dataset.info()[2]
         res_multiplier = self._get_res_multiplier(var_shape)
-        num_nonyx_dims = len(var_shape) - 2
-        return normalize_low_res_chunks(
-            (1,) * num_nonyx_dims + ("auto", -1),
+        return get_scan_aligned_chunks(
             var_shape,
-            (1,) * num_nonyx_dims + (scan_length_250m, var_shape[-1]),
-            (1,) * num_nonyx_dims + (res_multiplier, res_multiplier),
+            scan_length_250m // res_multiplier,
             np.float32,
+            low_res_multiplier=res_multiplier,
         )
 
     @staticmethod
@@ -410,7 +409,8 @@ class HDFEOSGeoReader(HDFEOSBaseFileReader):
     ) -> tuple[xr.DataArray, xr.DataArray]:
         result1 = self._load_ds_by_name(name1)
         result2 = self._load_ds_by_name(name2)
-        return self._interpolate_using_sza(result1, result2, resolution)
+        interp_results = self._interpolate_using_sza(result1, result2, resolution)
+        return self._cache_interpolated_pair(interp_results, name1, name2, resolution)
 
     def _load_interpolated_angle_pair_uncached(
             self,
@@ -421,7 +421,22 @@ class HDFEOSGeoReader(HDFEOSBaseFileReader):
         result1 = self._load_ds_by_name(name1)
         result2 = self._load_ds_by_name(name2) - 90
         interp_result1, interp_result2 = self._interpolate_using_sza(result1, result2, resolution)
-        return interp_result1, interp_result2 + 90
+        interp_results = (interp_result1, interp_result2 + 90)
+        return self._cache_interpolated_pair(interp_results, name1, name2, resolution)
+
+    def _cache_interpolated_pair(
+            self,
+            interp_results: tuple[xr.DataArray, xr.DataArray],
+            name1: str,
+            name2: str,
+            resolution: int
+    ) -> tuple[xr.DataArray, xr.DataArray]:
+        interp_result1, interp_result2 = interp_results
+        granule_id = os.path.basename(str(self.filename))
+        cached_arr1, cached_arr2 = cache_interpolated_navigation(
+            (interp_result1.data, interp_result2.data),
+            granule_id, name1, name2, self.geo_resolution, resolution)
+        return interp_result1.copy(data=cached_arr1), interp_result2.copy(data=cached_arr2)
 
     def _interpolate_using_sza(
             self,
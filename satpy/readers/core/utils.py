@@ -36,7 +36,7 @@ from upath import UPath
 
 from satpy import config
 from satpy.readers.core.remote import FSFile
-from satpy.utils import get_legacy_chunk_size
+from satpy.utils import get_chunk_size_limit, get_legacy_chunk_size
 
 LOGGER = logging.getLogger(__name__)
 CHUNK_SIZE = get_legacy_chunk_size()
@@ -202,6 +202,75 @@ def get_sub_area(area, xslice, yslice):
                           new_area_extent)
 
 
+def get_scan_aligned_chunks(shape, rows_per_scan, dtype=np.float32, low_res_multiplier=1):
+    """Compute dask chunk sizes containing whole scans of swath data.
+
+    The rows dimension (second to last) is chunked in multiples of
+    ``rows_per_scan`` and the columns dimension (last) is never chunked, so
+    operations working on entire scans (bow-tie handling, EWA resampling,
+    geolocation interpolation) do not need to rechunk the data. Any leading
+    dimensions are chunked one element at a time. The number of scans per chunk
+    is the largest one fitting in :func:`satpy.utils.get_chunk_size_limit`, but
+    a chunk always contains at least one scan.
+
+    Args:
+        shape: Shape of the array to compute chunks for.
+        rows_per_scan: Number of rows of the array making up one scan.
+        dtype: Dtype for the final unscaled array, used to compute the size
+            of the chunks in memory.
+        low_res_multiplier: Number of high (fine) resolution pixels that fit
+            in a single pixel of this array. The number of scans per chunk is
+            computed for the high resolution version of the data, so all
+            resolutions of an instrument get the same number of scans in each
+            chunk. See also :func:`satpy.utils.normalize_low_res_chunks`.
+
+    Returns:
+        A tuple where each element is the chunk size for that axis/dimension.
+
+    """
+    num_rows, num_cols = shape[-2:]
+    scan_nbytes = (rows_per_scan * low_res_multiplier * num_cols * low_res_multiplier *
+                   np.dtype(dtype).itemsize)
+    scans_per_chunk = max(1, int(get_chunk_size_limit(dtype) // scan_nbytes))
+    row_chunk = min(num_rows, scans_per_chunk * rows_per_scan)
+    return (1,) * (len(shape) - 2) + (max(row_chunk, 1), num_cols)
+
+
+def cache_interpolated_navigation(arrays, granule_id, *names):
+    """Cache interpolated navigation arrays to on-disk zarr arrays if configured.
+
+    Caching is only performed if the ``readers.cache_interpolated_navigation``
+    configuration option is ``True`` (see :ref:`config_cache_interpolated_navigation_setting`).
+    In this case the arrays are computed and stored in the ``cache_dir`` the
+    first time they are requested for a granule and read from there afterwards.
+
+    Args:
+        arrays: Tuple of interpolated dask arrays to cache.
+        granule_id: String uniquely identifying the granule the arrays belong
+            to, usually the base name of the file.
+        names: Names of the arrays and any other hashable arguments (ex. the
+            resolution) describing the interpolation that was done.
+
+    Returns:
+        A tuple of dask arrays, with the same chunks as the input *arrays*.
+
+    """
+    from satpy._cache import ZarrCacheHelper, _sanitize_args_with_chunks
+    from satpy.utils import PerformanceWarning
+
+    def interpolated_navigation(*args):
+        regular_chunks = args[-1]
+        return tuple(arr.rechunk(regular_chunks) for arr in arrays)
+
+    zarr_cacher = ZarrCacheHelper(interpolated_navigation,
+                                  "readers.cache_interpolated_navigation",
+                                  sanitize_args_func=_sanitize_args_with_chunks)
+    with warnings.catch_warnings():
+        # reader chunks follow the file structure and are often irregular
+        warnings.simplefilter("ignore", category=PerformanceWarning)
+        return zarr_cacher(granule_id, *names, arrays[0].chunks)
+
+
 def unzip_file(filename: str | FSFile, prefix=None):
     """Unzip the local/remote file ending with 'bz2'.
 
@@ -26,6 +26,7 @@ import numpy as np
 import xarray as xr
 
 from satpy.readers.core.hdf5 import HDF5FileHandler
+from satpy.readers.core.utils import get_scan_aligned_chunks
 
 NO_DATE = dt.datetime(1958, 1, 1)
 EPSILON_TIME = dt.timedelta(days=2)
@@ -304,12 +305,20 @@ class JPSS_SDR_FileHandler(HDF5FileHandler):
                 data_chunks.append(variable.isel(y=slice(start_scan,
                                                          start_scan + gscans * scan_size)))
                 start_scan += gscans * scan_size
-            return xr.concat(data_chunks, "y")
+            return self._chunk_by_scans(xr.concat(data_chunks, "y"), scan_size)
         else:
             # This is not tested - Not sure this code is ever going to be used? A. Dybbroe
             # Mon Jan  2 13:31:21 2023
             return self.expand_single_values(variable, scans)
 
+    @staticmethod
+    def _chunk_by_scans(data, scan_size):
+        """Rechunk 2D swath data so that every chunk holds whole scans."""
+        if data.ndim != 2:
+            return data
+        chunks = get_scan_aligned_chunks(data.shape, scan_size, data.dtype)
+        return data.chunk(dict(zip(data.dims, chunks)))
+
     def _get_rows_per_granule(self, dataset_group):
         scan_size = self._scan_size(dataset_group)
         scans_per_gran = self._get_scans_per_granule(dataset_group)
@@ -22,6 +22,8 @@ from __future__ import annotations
 import numpy as np
 from defusedxml.ElementTree import parse
 
+from satpy._compat import cache
+
 VARIABLES: dict[str, str] = {}
 
 TYPEC = {"boolean": ">i1",
@@ -202,5 +204,14 @@ class XMLFormat(object):
         return _apply_scales(array, *self.translator[array.dtype])
 
 
+@cache
+def get_xml_format(filename):
+    """Get the format described in *filename*.
+
+    The format is parsed only once and shared by all callers in the process.
+    """
+    return XMLFormat(filename)
+
+
 if __name__ == "__main__":
     pass
@@ -942,6 +942,7 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
         dsids = [self.get_dataset_key(ds_key) for ds_key in dataset_keys]
         coordinates = self._get_coordinates_for_dataset_keys(dsids)
         all_dsids = list(set().union(*coordinates.values())) + dsids
+        self._prepare_file_handlers([dsid for dsid in all_dsids if dsid not in all_datasets])
         for dsid in all_dsids:
             if dsid in all_datasets:
                 continue
@@ -956,6 +957,18 @@ class FileYAMLReader(GenericYAMLReader, DataDownloadMixin):
 
         return datasets
 
+    def _prepare_file_handlers(self, dsids):
+        """Tell the file handlers which of their datasets are about to be loaded."""
+        infos_by_filetype = {}
+        for dsid in dsids:
+            ds_info = self.all_ids.get(dsid)
+            filetype = None if ds_info is None else self._preferred_filetype(ds_info["file_type"])
+            if filetype is not None:
+                infos_by_filetype.setdefault(filetype, []).append(ds_info)
+        for filetype, ds_infos in infos_by_filetype.items():
+            for fh in self.file_handlers[filetype]:
+                fh.prepare_datasets(ds_infos)
+
     def _get_coordinates_for_dataset_keys(self, dsids):
         """Get all coordinates."""
         coordinates = {}
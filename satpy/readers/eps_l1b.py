@@ -20,23 +20,21 @@
 
 import functools
 import logging
+import os
 
 import dask.array as da
 import numpy as np
 import xarray as xr
-from dask.delayed import delayed
 from pyresample.geometry import SwathDefinition
 
 from satpy._compat import cached_property
 from satpy._config import get_config_path
 from satpy.readers.core.file_handlers import BaseFileHandler
-from satpy.readers.core.xmlformat import XMLFormat
-from satpy.utils import get_legacy_chunk_size
+from satpy.readers.core.utils import get_scan_aligned_chunks
+from satpy.readers.core.xmlformat import get_xml_format
 
 logger = logging.getLogger(__name__)
 
-CHUNK_SIZE = get_legacy_chunk_size()
-
 C1 = 1.191062e-05  # mW/(m2*sr*cm-4)
 C2 = 1.4387863  # K/cm-1
 
@@ -56,70 +54,109 @@ record_class = ["Reserved", "mphr", "sphr",
                 "veadr", "viadr", "mdr"]
 
 
+GRH_DTYPE = np.dtype([("record_class", "|i1"),
+                      ("INSTRUMENT_GROUP", "|i1"),
+                      ("RECORD_SUBCLASS", "|i1"),
+                      ("RECORD_SUBCLASS_VERSION", "|i1"),
+                      ("RECORD_SIZE", ">u4"),
+                      ("RECORD_START_TIME", "S6"),
+                      ("RECORD_STOP_TIME", "S6")])
+
+
+def index_records(fdes, form):
+    """Build an index of the records in an open EPS file.
+
+    Consecutive records of the same class, subclass and size are grouped. The
+    generic record headers (GRH) of such a group are checked through a memory
+    map in windows of doubling size, so the file is not read record by record
+    and the headers are only read up to the first record of another group.
+
+    Returns:
+        List of ``(record class, dtype, offset, count)`` tuples, one per group
+        of records.
+
+    """
+    file_size = os.fstat(fdes.fileno()).st_size
+    index = []
+    offset = 0
+    while offset + GRH_DTYPE.itemsize <= file_size:
+        fdes.seek(offset)
+        grh = np.fromfile(fdes, GRH_DTYPE, 1)[0]
+        rec_class = (record_class[int(grh["record_class"])], int(grh["RECORD_SUBCLASS"]))
+        record_size = int(grh["RECORD_SIZE"])
+        if record_size < GRH_DTYPE.itemsize:
+            raise ValueError(f"Invalid EPS record size {record_size} at offset {offset}")
+        count = _count_similar_records(fdes, offset, grh, file_size)
+        dtype = _record_dtype(form, rec_class, record_size, len(index))
+        if index and index[-1][0] == rec_class and index[-1][1] == dtype:
+            index[-1] = index[-1][:3] + (index[-1][3] + count,)
+        else:
+            index.append((rec_class, dtype, offset, count))
+        offset += record_size * count
+    return index
+
+
+def _count_similar_records(fdes, offset, grh, file_size):
+    """Count the consecutive records starting at *offset* with the same header as *grh*."""
+    record_size = int(grh["RECORD_SIZE"])
+    max_count = (file_size - offset) // record_size
+    names = ("record_class", "RECORD_SUBCLASS", "RECORD_SIZE")
+    strided_grh = np.dtype({"names": list(names),
+                            "formats": [GRH_DTYPE[name] for name in names],
+                            "offsets": [GRH_DTYPE.fields[name][1] for name in names],
+                            "itemsize": record_size})
+    count = 1
+    window = 1
+    while count < max_count:
+        window = min(window, max_count - count)
+        headers = np.memmap(fdes, mode="r", dtype=strided_grh, shape=(window,), offset=offset + count * record_size)
+        similar = ((headers["record_class"] == grh["record_class"]) &
+                   (headers["RECORD_SUBCLASS"] == grh["RECORD_SUBCLASS"]) &
+                   (headers["RECORD_SIZE"] == grh["RECORD_SIZE"]))
+        if not similar.all():
+            return count + int(np.argmin(similar))
+        count += window
+        window *= 2
+    return count
+
+
+def _record_dtype(form, rec_class, record_size, padding_index):
+    """Get the dtype of a record including its GRH and any padding up to *record_size*."""
+    try:
+        the_type = form.dtype(rec_class)
+    except KeyError:
+        the_type = np.dtype([("unknown", "V%d" % (record_size - GRH_DTYPE.itemsize))])
+    the_descr = GRH_DTYPE.descr + the_type.descr
+    the_type = np.dtype(the_descr)
+    if the_type.itemsize < record_size:
+        the_descr += [("unknown%d" % padding_index, "V%d" % (record_size - the_type.itemsize))]
+    return np.dtype(the_descr)
+
+
+def _mdr_chunk_lines(count):
+    """Get the number of scanlines per chunk for the MDR records."""
+    return get_scan_aligned_chunks((count, 2048), 1, np.float64)[0]
+
+
 def read_records(filename):
-    """Read *filename* without scaling it afterwards."""
-    format_fn = get_config_path("eps_avhrrl1b_6.5.xml")
-    form = XMLFormat(format_fn)
-
-    grh_dtype = np.dtype([("record_class", "|i1"),
-                          ("INSTRUMENT_GROUP", "|i1"),
-                          ("RECORD_SUBCLASS", "|i1"),
-                          ("RECORD_SUBCLASS_VERSION", "|i1"),
-                          ("RECORD_SIZE", ">u4"),
-                          ("RECORD_START_TIME", "S6"),
-                          ("RECORD_STOP_TIME", "S6")])
-
-    max_lines = np.floor((CHUNK_SIZE ** 2) / 2048)
-
-    dtypes = []
-    cnt = 0
-    counts = []
-    classes = []
-    prev = None
+    """Read *filename* without scaling it afterwards.
+
+    The scanline records (MDR) are memory mapped and returned as dask arrays
+    chunked by blocks of scanlines, so only the lines that are used are read.
+    """
+    form = get_xml_format(get_config_path("eps_avhrrl1b_6.5.xml"))
+
+    sections = {}
     with open(filename, "rb") as fdes:
-        while True:
-            grh = np.fromfile(fdes, grh_dtype, 1)
-            if grh.size == 0:
-                break
-            rec_class = record_class[int(grh["record_class"].squeeze())]
-            sub_class = grh["RECORD_SUBCLASS"][0]
-
-            expected_size = int(grh["RECORD_SIZE"].squeeze())
-            bare_size = expected_size - grh_dtype.itemsize
-            try:
-                the_type = form.dtype((rec_class, sub_class))
-                # the_descr = grh_dtype.descr + the_type.descr
-            except KeyError:
-                the_type = np.dtype([("unknown", "V%d" % bare_size)])
-            the_descr = grh_dtype.descr + the_type.descr
-            the_type = np.dtype(the_descr)
-            if the_type.itemsize < expected_size:
-                padding = [("unknown%d" % cnt, "V%d" % (expected_size - the_type.itemsize))]
-                cnt += 1
-                the_descr += padding
-            new_dtype = np.dtype(the_descr)
-            key = (rec_class, sub_class)
-            if key == prev:
-                counts[-1] += 1
-            else:
-                dtypes.append(new_dtype)
-                counts.append(1)
-                classes.append(key)
-                prev = key
-            fdes.seek(expected_size - grh_dtype.itemsize, 1)
-
-        sections = {}
-        offset = 0
-        for dtype, count, rec_class in zip(dtypes, counts, classes):
-            fdes.seek(offset)
+        for rec_class, dtype, offset, count in index_records(fdes, form):
             if rec_class == ("mdr", 2):
                 record = da.from_array(np.memmap(fdes, mode="r", dtype=dtype, shape=count, offset=offset),
-                                       chunks=(max_lines,))
+                                       chunks=(_mdr_chunk_lines(count),))
             else:
+                fdes.seek(offset)
                 record = np.fromfile(fdes, dtype=dtype, count=count)
-            offset += dtype.itemsize * count
             if rec_class in sections:
-                logger.debug("Multiple records for ", str(rec_class))
+                logger.debug("Multiple records for %s", str(rec_class))
                 sections[rec_class] = np.hstack((sections[rec_class], record))
             else:
                 sections[rec_class] = record
@@ -212,12 +249,14 @@ class EPSAVHRRFile(BaseFileHandler):
     def _interpolate(self, lons_like, lats_like):
         nav_sample_rate = self["NAV_SAMPLE_RATE"]
         if nav_sample_rate == 20 and self.pixels == 2048:
-            lons_like_1km, lats_like_1km = _interpolate_20km_to_1km(lons_like, lats_like)
-            lons_like_1km = da.from_delayed(lons_like_1km, dtype=lons_like.dtype,
-                                            shape=(self.scanlines, self.pixels))
-            lats_like_1km = da.from_delayed(lats_like_1km, dtype=lats_like.dtype,
-                                            shape=(self.scanlines, self.pixels))
-            return lons_like_1km, lats_like_1km
+            # the interpolation is done line by line, so blocks of scanlines can be interpolated independently
+            lons_like = da.asarray(lons_like).rechunk({1: -1})
+            lats_like = da.asarray(lats_like).rechunk(lons_like.chunks)
+            lonlats_1km = da.map_blocks(_interpolate_20km_to_1km, lons_like, lats_like,
+                                        dtype=lons_like.dtype, new_axis=[0],
+                                        chunks=((2,), lons_like.chunks[0], (self.pixels,)),
+                                        meta=np.array((), dtype=lons_like.dtype))
+            return lonlats_1km[0], lonlats_1km[1]
 
         raise NotImplementedError("Lon/lat and angle expansion not implemented for " +
                                   "sample rate = " + str(nav_sample_rate) +
@@ -399,8 +438,6 @@ class EPSAVHRRFile(BaseFileHandler):
         return self._end_time
 
 
-@delayed(nout=2, pure=True)
 def _interpolate_20km_to_1km(lons, lats):
-    # Note: delayed will cast input dask-arrays to numpy arrays (needed by metop20kmto1km).
     from geotiepoints import metop20kmto1km
-    return metop20kmto1km(lons, lats)
+    return np.stack(metop20kmto1km(lons, lats))
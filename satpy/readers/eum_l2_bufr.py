@@ -34,6 +34,7 @@ import xarray as xr
 
 from satpy.area import get_area_def
 from satpy.readers.core._geos_area import get_geos_area_naming
+from satpy.readers.core.bufr import BufrArrayCache
 from satpy.readers.core.eum import get_service_mode, recarray2dict
 from satpy.readers.core.file_handlers import BaseFileHandler
 from satpy.readers.core.seviri import mpef_product_header
@@ -121,6 +122,7 @@ class EumetsatL2BufrFileHandler(BaseFileHandler):
 
         self.filetype = filetype_info["file_type"]
         self.with_adef = with_area_definition
+        self._bufr_arrays = BufrArrayCache(lambda: open(self.filename, "rb"))
 
     def __del__(self):
         """Delete the instance and environment variable."""
@@ -205,32 +207,18 @@ class EumetsatL2BufrFileHandler(BaseFileHandler):
         fh.close()
         return attrs
 
+    def prepare_datasets(self, dataset_infos):
+        """Register the BUFR keys of the datasets to load for decoding in a single pass."""
+        self._bufr_arrays.add_keys(ds_info["key"] for ds_info in dataset_infos if "key" in ds_info)
+
     def get_array(self, key):
         """Get all data from file for the given BUFR key."""
-        with open(self.filename, "rb") as fh:
-            msgCount = 0
-            while True:
-                bufr = ec.codes_bufr_new_from_file(fh)
-                if bufr is None:
-                    break
-
-                ec.codes_set(bufr, "unpack", 1)
-
-                if not ec.codes_is_defined(bufr, key):
-                    logging.warning(f"Key: {key} does not exist in BUFR file")
-                    return None
-
-                # if is the first message initialise our final array
-                if (msgCount == 0):
-                    arr = da.from_array(ec.codes_get_array(bufr, key, float), chunks=CHUNK_SIZE)
-
-                else:
-                    tmpArr = da.from_array(ec.codes_get_array(bufr, key, float), chunks=CHUNK_SIZE)
-                    arr = da.concatenate((arr, tmpArr))
-
-                msgCount = msgCount+1
-                ec.codes_release(bufr)
+        values = self._bufr_arrays[key]
+        if any(msg_values is None for msg_values in values):
+            logging.warning(f"Key: {key} does not exist in BUFR file")
+            return None
 
+        arr = da.from_array(np.concatenate(values), chunks=CHUNK_SIZE)
         if arr.size == 1:
             arr = arr[0]
 
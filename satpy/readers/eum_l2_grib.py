@@ -33,6 +33,7 @@ from satpy.readers.core._geos_area import get_area_definition, get_geos_area_nam
 from satpy.readers.core.eum import get_service_mode
 from satpy.readers.core.fci import calculate_area_extent as fci_calculate_area_extent
 from satpy.readers.core.file_handlers import BaseFileHandler
+from satpy.readers.core.grib import get_grib_message_index
 from satpy.readers.core.seviri import PLATFORM_DICT as SEVIRI_PLATFORM_DICT
 from satpy.readers.core.seviri import REPEAT_CYCLE_DURATION as SEVIRI_REPEAT_CYCLE_DURATION
 from satpy.readers.core.seviri import REPEAT_CYCLE_DURATION_RSS as SEVIRI_REPEAT_CYCLE_DURATION_RSS
@@ -67,7 +68,8 @@ class EUML2GribFileHandler(BaseFileHandler):
         elif "fci" in self.filetype_info["file_type"]:
             self.sensor = "fci"
             self.PLATFORM_NAME = f"MTG-i{self.filename_info['spacecraft_id']}"
-        pass
+
+        self._fields_by_parameter = None
 
     @property
     def start_time(self):
@@ -110,58 +112,82 @@ class EUML2GribFileHandler(BaseFileHandler):
 
         In a previous version of the reader, the attributes (nrows, ncols, ssp_lon) and projection information
         (pdict and area_dict) were computed while initializing the file handler. Also the code would break out from
-        the While-loop below as soon as the correct parameter_number was found. This has now been revised becasue the
-        reader would sometimes give corrupt information about the number of messages in the file and the dataset
-        dimensions within a given message if the file was only partly read (not looping over all messages) in an earlier
-        instance.
+        the loop over the messages as soon as the correct parameter_number was found. This has been revised because
+        the reader would sometimes give corrupt information about the number of messages in the file and the dataset
+        dimensions within a given message if the file was only partly read (not looping over all messages) in an
+        earlier instance.
+
+        Now all messages are read once to build an index of the byte offset and field position of every parameter
+        number (see :meth:`_get_fields_by_parameter`). The message of a dataset is then read directly from its
+        offset after resetting the multi-field state of the file.
         """
         logger.debug("Reading in file to get dataset with parameter number %d.",
                      dataset_info["parameter_number"])
 
-        xarr = None
-        message_found = False
-        with open(self.filename, "rb") as fh:
-
-            # Iterate over all messages and fetch data when the correct parameter number is found
-            while True:
-                gid = ec.codes_grib_new_from_file(fh)
+        field_info = self._get_fields_by_parameter().get(dataset_info["parameter_number"])
+        if field_info is None:
+            # Could not obtain a valid message ID from the grib file
+            logger.warning("Could not find parameter_number %d in GRIB file, no valid Dataset created",
+                           dataset_info["parameter_number"])
+            return None
 
-                if gid is None:
-                    if not message_found:
-                        # Could not obtain a valid message ID from the grib file
-                        logger.warning("Could not find parameter_number %d in GRIB file, no valid Dataset created",
-                                       dataset_info["parameter_number"])
-                    break
-
-                # Check if the parameter number in the GRIB message corresponds to the required key
-                parameter_number = self._get_from_msg(gid, "parameterNumber")
+        with open(self.filename, "rb") as fh:
+            gid = self._read_field(fh, field_info)
 
-                if parameter_number == dataset_info["parameter_number"]:
+            self._res = dataset_id["resolution"]
+            self._read_attributes(gid)
 
-                    self._res = dataset_id["resolution"]
-                    self._read_attributes(gid)
+            # Read the missing value
+            missing_value = self._get_from_msg(gid, "missingValue")
 
-                    # Read the missing value
-                    missing_value = self._get_from_msg(gid, "missingValue")
+            # Retrieve values and metadata from the GRIB message, masking the values equal to missing_value
+            xarr = self._get_xarray_from_msg(gid)
 
-                    # Retrieve values and metadata from the GRIB message, masking the values equal to missing_value
-                    xarr = self._get_xarray_from_msg(gid)
+            xarr.data = da.where(xarr.data == missing_value, np.nan, xarr.data)
 
-                    xarr.data = da.where(xarr.data == missing_value, np.nan, xarr.data)
+            ec.codes_release(gid)
 
-                    ec.codes_release(gid)
+        # Combine all metadata into the dataset attributes
+        xarr.attrs.update(dataset_info)
+        xarr.attrs.update(self._get_attributes())
 
-                    # Combine all metadata into the dataset attributes and break out of the loop
-                    xarr.attrs.update(dataset_info)
-                    xarr.attrs.update(self._get_attributes())
+        return xarr
 
-                    message_found = True
+    def _get_fields_by_parameter(self):
+        """Get the offset and field position of the last message field holding each parameter number."""
+        if self._fields_by_parameter is None:
+            index = get_grib_message_index(self.filename, self._build_message_index)
+            self._fields_by_parameter = {field_info["parameter_number"]: field_info for field_info in index}
+        return self._fields_by_parameter
 
-                else:
-                    # The parameter number is not the correct one, release gid and skip to next message
-                    ec.codes_release(gid)
+    def _build_message_index(self):
+        """Read the parameter number, message offset and field position of every field in the file."""
+        index = []
+        with open(self.filename, "rb") as fh:
+            ec.codes_grib_multi_support_reset_file(fh)
+            previous_offset = None
+            field = 0
+            while True:
+                gid = ec.codes_grib_new_from_file(fh)
+                if gid is None:
+                    break
+                offset = int(self._get_from_msg(gid, "offset"))
+                field = field + 1 if offset == previous_offset else 0
+                index.append({"parameter_number": self._get_from_msg(gid, "parameterNumber"),
+                              "offset": offset,
+                              "field": field})
+                previous_offset = offset
+                ec.codes_release(gid)
+        return index
 
-        return xarr
+    @staticmethod
+    def _read_field(fh, field_info):
+        """Read a field from the GRIB message at the given offset."""
+        ec.codes_grib_multi_support_reset_file(fh)
+        fh.seek(field_info["offset"])
+        for _ in range(field_info["field"]):
+            ec.codes_release(ec.codes_grib_new_from_file(fh))
+        return ec.codes_grib_new_from_file(fh)
 
     def _read_attributes(self, gid):
         """Read the parameter attributes from the message and create the projection and area dictionaries."""
@@ -22,6 +22,11 @@ Currently this reader depends on the `pygrib` python package. The `eccodes`
 package from ECMWF is preferred, but does not support python 3 at the time
 of writing.
 
+When a file is opened the reader builds an index of all GRIB messages in it
+and later reads the message of a requested dataset directly from its byte
+offset. The index can be stored in the cache directory and reused the next
+time the same file is opened, see :ref:`config_cache_grib_index_setting`.
+
 """
 
 import datetime as dt
@@ -36,6 +41,7 @@ from pyresample import geometry
 
 from satpy.dataset import DataQuery
 from satpy.readers.core.file_handlers import BaseFileHandler
+from satpy.readers.core.grib import get_grib_message_index, scan_grib_messages
 from satpy.utils import get_legacy_chunk_size
 
 LOG = logging.getLogger(__name__)
@@ -55,38 +61,54 @@ class GRIBFileHandler(BaseFileHandler):
         super(GRIBFileHandler, self).__init__(filename, filename_info, filetype_info)
 
         self._msg_datasets = {}
-        self._start_time = None
-        self._end_time = None
         try:
-            with pygrib.open(self.filename) as grib_file:
-                first_msg = grib_file.message(1)
-                last_msg = grib_file.message(grib_file.messages)
-                start_time = self._convert_datetime(
-                    first_msg, "validityDate", "validityTime")
-                end_time = self._convert_datetime(
-                    last_msg, "validityDate", "validityTime")
-                self._start_time = start_time
-                self._end_time = end_time
-                if "keys" not in filetype_info:
-                    self._analyze_messages(grib_file)
-                    self._idx = None
-                else:
-                    self._create_dataset_ids(filetype_info["keys"])
-                    self._idx = pygrib.index(self.filename,
-                                             *filetype_info["keys"].keys())
-        except (RuntimeError, KeyError):
+            self._index = get_grib_message_index(self.filename, self._build_message_index)
+            self._start_time = self._convert_datetime(
+                self._index[0], "validityDate", "validityTime")
+            self._end_time = self._convert_datetime(
+                self._index[-1], "validityDate", "validityTime")
+        except (RuntimeError, KeyError, IndexError, TypeError):
             raise IOError("Unknown GRIB file format: {}".format(self.filename))
+        if "keys" not in filetype_info:
+            self._analyze_messages()
+        else:
+            self._create_dataset_ids(filetype_info["keys"])
+
+    def _build_message_index(self):
+        """Read the keys needed to find datasets from every message of the file.
 
-    def _analyze_messages(self, grib_file):
-        grib_file.seek(0)
-        for idx, msg in enumerate(grib_file):
-            msg_id = DataQuery(name=msg["shortName"],
-                               level=msg["level"],
+        The byte offset and length of each message are added when they can be
+        determined, so that messages can be read without iterating over the
+        file.
+        """
+        index_keys = ["shortName", "level", "validityDate", "validityTime"]
+        index_keys.extend(key for key in self.filetype_info.get("keys", {}) if key not in index_keys)
+        index = []
+        with pygrib.open(self.filename) as grib_file:
+            for msg_num, msg in enumerate(grib_file, start=1):
+                msg_info = {key: msg[key] if msg.valid_key(key) else None for key in index_keys}
+                msg_info["message"] = msg_num
+                index.append(msg_info)
+        try:
+            with open(self.filename, "rb") as grib_file:
+                offsets = scan_grib_messages(grib_file)
+        except (OSError, ValueError) as err:
+            LOG.debug("Could not find GRIB message offsets, messages will be read sequentially: %s", err)
+            return index
+        if len(offsets) == len(index):
+            for msg_info, (offset, length) in zip(index, offsets):
+                msg_info.update(offset=offset, length=length)
+        return index
+
+    def _analyze_messages(self):
+        for msg_info in self._index:
+            msg_id = DataQuery(name=msg_info["shortName"],
+                               level=msg_info["level"],
                                modifiers=tuple())
             ds_info = {
-                "message": idx + 1,
-                "name": msg["shortName"],
-                "level": msg["level"],
+                "message": msg_info["message"],
+                "name": msg_info["shortName"],
+                "level": msg_info["level"],
                 "file_type": self.filetype_info["file_type"],
             }
             self._msg_datasets[msg_id] = ds_info
@@ -138,14 +160,22 @@ class GRIBFileHandler(BaseFileHandler):
             yield True, ds_info
 
     def _get_message(self, ds_info):
+        msg_info = self._find_message_info(ds_info)
+        if "offset" in msg_info:
+            with open(self.filename, "rb") as grib_file:
+                grib_file.seek(msg_info["offset"])
+                return pygrib.fromstring(grib_file.read(msg_info["length"]))
         with pygrib.open(self.filename) as grib_file:
-            if "message" in ds_info:
-                msg_num = ds_info["message"]
-                msg = grib_file.message(msg_num)
-            else:
-                msg_keys = self.filetype_info["keys"].keys()
-                msg = self._idx(**{k: ds_info[k] for k in msg_keys})[0]
-            return msg
+            return grib_file.message(msg_info["message"])
+
+    def _find_message_info(self, ds_info):
+        if "message" in ds_info:
+            return self._index[ds_info["message"] - 1]
+        msg_keys = self.filetype_info["keys"].keys()
+        for msg_info in self._index:
+            if all(msg_info[k] == ds_info[k] for k in msg_keys):
+                return msg_info
+        raise KeyError("No GRIB message found for {}".format({k: ds_info[k] for k in msg_keys}))
 
     @staticmethod
     def _correct_cyl_minmax_xy(proj_params, min_lon, min_lat, max_lon, max_lat):
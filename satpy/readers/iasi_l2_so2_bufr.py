@@ -99,6 +99,7 @@ except ImportError as e:
         """Missing eccodes-python and/or eccodes C-library installation. Use conda to install eccodes.
            Error: """, e)
 
+from satpy.readers.core.bufr import BufrArrayCache
 from satpy.readers.core.file_handlers import BaseFileHandler
 from satpy.utils import get_legacy_chunk_size
 
@@ -122,6 +123,7 @@ class IASIL2SO2BUFR(BaseFileHandler):
         self.metadata["start_time"] = start_time
         self.metadata["end_time"] = end_time
         self.metadata["SpacecraftName"] = data_center_dict[sc_id]
+        self._bufr_arrays = BufrArrayCache(lambda: open(self.filename, "rb"))
 
     @property
     def start_time(self):
@@ -189,36 +191,19 @@ class IASIL2SO2BUFR(BaseFileHandler):
         fh.close()
         return attr
 
+    def prepare_datasets(self, dataset_infos):
+        """Register the BUFR keys of the datasets to load for decoding in a single pass."""
+        self._bufr_arrays.add_keys(ds_info["key"] for ds_info in dataset_infos if "key" in ds_info)
+
     def get_array(self, key):
         """Get all data from file for the given BUFR key."""
-        with open(self.filename, "rb") as fh:
-            msgCount = 0
-            while True:
-
-                bufr = ec.codes_bufr_new_from_file(fh)
-                if bufr is None:
-                    break
-
-                ec.codes_set(bufr, "unpack", 1)
-
-                values = ec.codes_get_array(
-                        bufr, key, float)
-
-                if len(values) == 1:
-                    values = np.repeat(values, 120)
-
-                # if is the first message initialise our final array
-                if (msgCount == 0):
-
-                    arr = da.from_array([values], chunks=CHUNK_SIZE)
-                else:
-                    tmpArr = da.from_array([values], chunks=CHUNK_SIZE)
-
-                    arr = da.concatenate((arr, tmpArr), axis=0)
-
-                msgCount = msgCount+1
-                ec.codes_release(bufr)
+        values = self._bufr_arrays[key]
+        if any(msg_values is None for msg_values in values):
+            raise KeyError(f"Key {key} does not exist in all BUFR messages")
 
+        arr = np.stack([np.repeat(msg_values, 120) if len(msg_values) == 1 else msg_values
+                        for msg_values in values])
+        arr = da.from_array(arr, chunks=CHUNK_SIZE)
         if arr.size == 1:
             arr = arr[0]
 
@@ -33,6 +33,7 @@ import numpy as np
 from pyspectral.blackbody import blackbody_wn_rad2temp as rad2temp
 
 from satpy.readers.core.hdf5 import HDF5FileHandler
+from satpy.readers.core.utils import get_scan_aligned_chunks
 
 N_TOT_IR_CHANS_LL = 6
 PLATFORMS_INSTRUMENTS = {"FY-3A": "mersi-1",
@@ -128,6 +129,13 @@ class MERSIL1B(HDF5FileHandler):
             data = data * slope + intercept
         return data
 
+    def _chunks_for_dataset(self, key, h5dset):
+        """Chunk swath data by whole scans."""
+        rows_per_scan = self.filetype_info.get("rows_per_scan")
+        if rows_per_scan is None or h5dset.ndim < 2:
+            return None
+        return get_scan_aligned_chunks(h5dset.shape, rows_per_scan)
+
     def get_dataset(self, dataset_id, ds_info):
         """Load data variable and metadata and calibrate if needed."""
         file_key = ds_info.get("file_key", dataset_id["name"])
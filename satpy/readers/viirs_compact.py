@@ -31,6 +31,7 @@ For more information on this format, the reader can refer to the
 
 import datetime as dt
 import logging
+import os
 from contextlib import suppress
 
 import dask.array as da
@@ -39,8 +40,8 @@ import numpy as np
 import xarray as xr
 
 from satpy.readers.core.file_handlers import BaseFileHandler
-from satpy.readers.core.utils import np2str
-from satpy.utils import angle2xyz, get_legacy_chunk_size, lonlat2xyz, xyz2angle, xyz2lonlat
+from satpy.readers.core.utils import cache_interpolated_navigation, np2str
+from satpy.utils import angle2xyz, get_chunk_size_limit, get_legacy_chunk_size, lonlat2xyz, xyz2angle, xyz2lonlat
 
 CHUNK_SIZE = get_legacy_chunk_size()
 _channels_dict = {"M01": "M1",
@@ -191,12 +192,12 @@ class VIIRSCompactFileHandler(BaseFileHandler):
                  ("LunarAzimuthAngle", "LunarZenithAngle"),
                  }
         if self.lons is None or self.lats is None:
-            self.lons, self.lats = self.navigate()
+            self.lons, self.lats = self._cache_expanded(self.navigate(), "longitude", "latitude")
         for pair, fkeys in pairs.items():
             if key["name"] in pair:
                 if (self.cache.get(pair[0]) is None
                         or self.cache.get(pair[1]) is None):
-                    angles = self.angles(*fkeys)
+                    angles = self._cache_expanded(self.angles(*fkeys), *fkeys)
                     self.cache[pair[0]], self.cache[pair[1]] = angles
                 if key["name"] == pair[0]:
                     return xr.DataArray(self.cache[pair[0]], name=key["name"],
@@ -282,33 +283,63 @@ class VIIRSCompactFileHandler(BaseFileHandler):
         rads.attrs["units"] = unit
         return rads
 
+    def _cache_expanded(self, arrays, *names):
+        """Cache the expanded arrays on disk if configured to do so."""
+        granule_id = os.path.basename(str(self.filename))
+        return cache_interpolated_navigation(tuple(arrays), granule_id, *names)
+
     def expand_angle_and_nav(self, arrays):
         """Expand angle and navigation datasets."""
         res = []
+        coefs = self.expansion_coefs
         for array in arrays:
-            res.append(da.map_blocks(expand, array[:, :, np.newaxis], self.expansion_coefs,
-                                     scans=self.scans, scan_size=self.scan_size,
-                                     dtype=array.dtype, drop_axis=2, chunks=self.expansion_coefs.chunks[:-1]))
+            array = array.rechunk({0: self._tiepoint_row_chunks(array.shape[0])})
+            res.append(da.map_blocks(expand, array[:, :, np.newaxis], coefs,
+                                     scan_size=self.scan_size,
+                                     dtype=array.dtype, drop_axis=2, chunks=coefs.chunks[:-1]))
         return res
 
     @property
     def expansion_coefs(self):
-        """Compute the expansion coefficients."""
+        """Compute the expansion coefficients.
+
+        The coefficients are chunked in blocks of whole scans so that the
+        expansion of the tie-points runs in parallel over these blocks.
+        """
         if self._expansion_coefs is not None:
             return self._expansion_coefs
-        v_track = (np.arange(self.scans * self.scan_size) % self.scan_size + self.track_offset) / self.scan_size
         self.tpz_sizes = self.tpz_sizes.persist()
         self.nb_tiepoint_zones = self.nb_tiepoint_zones.persist()
         col_chunks = (self.tpz_sizes * self.nb_tiepoint_zones).compute()
-        self._expansion_coefs = da.map_blocks(get_coefs, self.c_align, self.c_exp, self.tpz_sizes,
-                                              self.nb_tiepoint_zones,
-                                              v_track=v_track, scans=self.scans, scan_size=self.scan_size,
+        block_scans = self._scans_per_block(col_chunks.sum())
+        row_chunks = tuple(nscans * self.scan_size for nscans in block_scans)
+        block_scans = da.from_array(np.array(block_scans), chunks=1)
+        self._expansion_coefs = da.map_blocks(get_coefs, self.c_align[np.newaxis], self.c_exp[np.newaxis],
+                                              self.tpz_sizes[np.newaxis], self.nb_tiepoint_zones[np.newaxis],
+                                              block_scans[:, np.newaxis],
+                                              track_offset=self.track_offset, scan_size=self.scan_size,
                                               scan_offset=self.scan_offset,
-                                              dtype=np.float64, new_axis=[0, 2],
-                                              chunks=(self.scans * self.scan_size, tuple(col_chunks), 4))
+                                              dtype=np.float64, new_axis=[2],
+                                              chunks=(row_chunks, tuple(col_chunks), 4))
 
         return self._expansion_coefs
 
+    def _scans_per_block(self, num_columns):
+        """Split the scans in blocks fitting the configured chunk size."""
+        scan_nbytes = self.scan_size * num_columns * 4 * np.dtype(np.float64).itemsize
+        max_scans = max(1, int(get_chunk_size_limit(np.float64) // scan_nbytes))
+        full_blocks, remaining_scans = divmod(int(self.scans), max_scans)
+        return (max_scans,) * full_blocks + ((remaining_scans,) if remaining_scans else ())
+
+    def _tiepoint_row_chunks(self, num_rows):
+        """Get the row chunks of the tie-point arrays matching the expansion coefficients.
+
+        There are two tie-point rows per scan, any padding rows end up in the last chunk.
+        """
+        row_chunks = [nrows // self.scan_size * 2 for nrows in self.expansion_coefs.chunks[0]]
+        row_chunks[-1] += num_rows - sum(row_chunks)
+        return tuple(row_chunks)
+
     def navigate(self):
         """Generate the navigation datasets."""
         chunks = self._get_geographical_chunks()
@@ -379,10 +410,14 @@ def convert_to_angles(x, y, z):
     return azi, zen
 
 
-def get_coefs(c_align, c_exp, tpz_size, nb_tpz, v_track, scans, scan_size, scan_offset):
-    """Compute the coeffs in numpy domain."""
+def get_coefs(c_align, c_exp, tpz_size, nb_tpz, scans, track_offset, scan_size, scan_offset):
+    """Compute the coeffs in numpy domain for a block of *scans* scans."""
     nties = nb_tpz.item()
     tpz_size = tpz_size.item()
+    scans = scans.item()
+    c_align = c_align.ravel()
+    c_exp = c_exp.ravel()
+    v_track = (np.arange(scans * scan_size) % scan_size + track_offset) / scan_size
     v_scan = (np.arange(nties * tpz_size) % tpz_size + scan_offset) / tpz_size
     s_scan, s_track = np.meshgrid(v_scan, v_track)
     s_track = s_track.reshape(scans, scan_size, nties, tpz_size)
@@ -402,9 +437,10 @@ def get_coefs(c_align, c_exp, tpz_size, nb_tpz, v_track, scans, scan_size, scan_
     return res
 
 
-def expand(data, coefs, scans, scan_size):
+def expand(data, coefs, scan_size):
     """Perform the expansion in numpy domain."""
     data = data.reshape(data.shape[:-1])
+    scans = coefs.shape[0] // scan_size
 
     coefs = coefs.reshape(scans, scan_size, data.shape[1] - 1, -1, 4)
 
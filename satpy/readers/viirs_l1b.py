@@ -23,6 +23,7 @@ import logging
 import numpy as np
 
 from satpy.readers.core.netcdf import NetCDF4FileHandler
+from satpy.readers.core.utils import get_scan_aligned_chunks
 
 LOG = logging.getLogger(__name__)
 
@@ -30,6 +31,19 @@ LOG = logging.getLogger(__name__)
 class VIIRSL1BFileHandler(NetCDF4FileHandler):
     """VIIRS L1B File Reader."""
 
+    def __init__(self, filename, filename_info, filetype_info, xarray_kwargs=None, **kwargs):
+        """Initialize file handler and read variables in chunks of whole scans."""
+        super().__init__(filename, filename_info, filetype_info, xarray_kwargs=xarray_kwargs, **kwargs)
+        if "chunks" not in (xarray_kwargs or {}) and "/dimension/number_of_scans" in self:
+            self._xarray_kwargs["chunks"] = self._get_scan_aligned_chunks()
+
+    def _get_scan_aligned_chunks(self):
+        num_lines = self["/dimension/number_of_lines"]
+        num_pixels = self["/dimension/number_of_pixels"]
+        rows_per_scan = num_lines // self["/dimension/number_of_scans"]
+        row_chunks, _ = get_scan_aligned_chunks((num_lines, num_pixels), rows_per_scan)
+        return {"number_of_lines": row_chunks, "number_of_pixels": -1}
+
     def _parse_datetime(self, datestr):
         """Parse datetime."""
         return dt.datetime.strptime(datestr, "%Y-%m-%dT%H:%M:%S.000Z")
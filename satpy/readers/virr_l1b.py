@@ -48,6 +48,7 @@ import numpy as np
 from pyspectral.blackbody import blackbody_wn_rad2temp as rad2temp
 
 from satpy.readers.core.hdf5 import HDF5FileHandler
+from satpy.readers.core.utils import get_scan_aligned_chunks
 
 LOG = logging.getLogger(__name__)
 
@@ -87,6 +88,12 @@ class VIRR_L1B(HDF5FileHandler):
             self.l1b_prefix = ""
             self.wave_number = "Emmisive_Centroid_Wave_Number"
 
+    def _chunks_for_dataset(self, key, h5dset):
+        """Chunk swath data by whole scans, VIRR scans one line at a time."""
+        if h5dset.ndim < 2:
+            return None
+        return get_scan_aligned_chunks(h5dset.shape, self.filetype_info.get("rows_per_scan", 1))
+
     def get_dataset(self, dataset_id, ds_info):
         """Create DataArray from file content for `dataset_id`."""
         file_key = self.geolocation_prefix + ds_info.get("file_key", dataset_id["name"])
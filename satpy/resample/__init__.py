@@ -32,6 +32,10 @@ Resampling algorithms
 
     "Resampler", "Description", "Related"
     "nearest", "Nearest Neighbor", :class:`~satpy.resample.kdtree.KDTreeResampler`
+    "nearest_chunked", "Nearest Neighbor searched per output chunk", \
+    :class:`~satpy.resample.kdtree.ChunkedKDTreeResampler`
+    "geos_nearest", "Nearest Neighbor for geostationary data", \
+    :class:`~satpy.resample.geos.GeostationaryNearestResampler`
     "ewa", "Elliptical Weighted Averaging", :class:`~pyresample.ewa.dask_ewa.DaskEWAResampler`
     "ewa_legacy", "Elliptical Weighted Averaging (Legacy)", \
     :class:`~pyresample.ewa._legacy_dask_ewa.LegacyDaskEWAResampler`
@@ -98,6 +102,21 @@ target pixels don't change over time.
 See the documentation for specific algorithms to see availability and
 limitations of caching for that algorithm.
 
+Reusing the resampling setup for time series
+---------------------------------------------
+
+When many Scenes with the same source areas are resampled to the same target
+area, the data reductions, resamplers and resampling indices of the first
+Scene can be reused for the others with a
+:class:`~satpy.resample.plan.ResamplePlan`:
+
+    >>> from satpy.resample.plan import ResamplePlan
+    >>> plan = ResamplePlan.from_scene(scenes[0], 'euro4', resampler='nearest')
+    >>> euro_scenes = [plan.apply(scn) for scn in scenes if plan.is_compatible(scn)]
+
+:meth:`MultiScene.resample <satpy.multiscene.MultiScene.resample>` does this
+automatically.
+
 Create custom area definition
 -----------------------------
 
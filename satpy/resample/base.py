@@ -18,13 +18,18 @@
 import hashlib
 import json
 import warnings
+from collections import OrderedDict
 from contextlib import suppress
 from importlib import import_module
 from logging import getLogger
 from weakref import WeakValueDictionary
 
+import dask.array as da
 import numpy as np
+import xarray as xr
 
+import satpy
+from satpy.cache_manager import parse_size
 from satpy.utils import get_legacy_chunk_size
 
 LOG = getLogger(__name__)
@@ -32,6 +37,8 @@ LOG = getLogger(__name__)
 CHUNK_SIZE = get_legacy_chunk_size()
 
 resamplers_cache: "WeakValueDictionary[tuple, object]" = WeakValueDictionary()
+# strong references to the most recently used resamplers, see _keep_resampler
+_recent_resamplers: "OrderedDict[tuple, object]" = OrderedDict()
 
 
 def _hash_dict(the_dict, the_hash=None):
@@ -79,6 +86,7 @@ RESAMPLER_MODULES = [
     "satpy.resample.kdtree",
     "satpy.resample.bucket",
     "satpy.resample.ewa",
+    "satpy.resample.geos",
 ]
 
 def _get_resampler_classes_from_module(import_path):
@@ -131,9 +139,44 @@ def prepare_resampler(source_area, destination_area, resampler=None, **resample_
     except KeyError:
         resampler_instance = resampler_class(source_area, destination_area)
         resamplers_cache[key] = resampler_instance
+    _keep_resampler(key, resampler_instance)
     return key, resampler_instance
 
 
+def _keep_resampler(key, resampler):
+    """Keep a strong reference to *resampler* within the ``resampler_cache_size`` budget.
+
+    Only resamplers reporting the memory used by their precomputed indices
+    through a ``cache_nbytes`` attribute are kept. When the budget is exceeded
+    the least recently used resamplers are released first.
+
+    """
+    max_size = parse_size(satpy.config.get("resampler_cache_size", 0) or 0)
+    if max_size <= 0:
+        _recent_resamplers.clear()
+        return
+    if not hasattr(resampler, "cache_nbytes"):
+        return
+    _recent_resamplers[key] = resampler
+    _recent_resamplers.move_to_end(key)
+    # the resampler being requested is never released before it is used
+    _release_resamplers(max_size, num_kept=1)
+
+
+def _release_resamplers(max_size, num_kept=0):
+    """Release the least recently used resamplers until their indices fit in *max_size* bytes.
+
+    The *num_kept* most recently used resamplers are never released.
+
+    """
+    total_size = sum(res.cache_nbytes for res in _recent_resamplers.values())
+    for old_key in list(_recent_resamplers)[:len(_recent_resamplers) - num_kept]:
+        if total_size <= max_size:
+            break
+        LOG.debug("Releasing cached resampler %s", old_key[0].__name__)
+        total_size -= _recent_resamplers.pop(old_key).cache_nbytes
+
+
 def _check_resampler_class(resampler_class, resampler):
     if resampler_class is not None:
         return
@@ -164,6 +207,9 @@ def resample(source_area, data, destination_area,
     else:
         res = resampler_instance.resample(data, **kwargs)
 
+    if _recent_resamplers:
+        # the indices only count against the budget once they are precomputed
+        _release_resamplers(parse_size(satpy.config.get("resampler_cache_size", 0) or 0))
     return res
 
 
@@ -206,3 +252,82 @@ def resample_dataset(dataset, destination_area, **kwargs):
     new_data.attrs.update(area=destination_area)
 
     return new_data
+
+
+def _get_batch_resampler_classes():
+    """Get the resampler classes applying one precomputed index to all bands of a dataset.
+
+    The EWA resamplers aren't included, they split the bands of their input
+    and resample each of them separately.
+
+    """
+    from satpy.resample.geos import GeostationaryNearestResampler
+    from satpy.resample.kdtree import BilinearResampler, ChunkedKDTreeResampler, KDTreeResampler
+    return KDTreeResampler, BilinearResampler, ChunkedKDTreeResampler, GeostationaryNearestResampler
+
+
+def get_batch_key(dataset, resampler, **kwargs):
+    """Get a key identifying the datasets that can be resampled together with *dataset*.
+
+    Datasets with the same key can be resampled in one call with
+    :func:`resample_dataset_batch`.
+
+    Args:
+        dataset (xarray.DataArray): Dataset to be resampled.
+        resampler: Resampler instance that will be used for the dataset.
+        **kwargs: The extra parameters to pass to the resampler objects.
+
+    Returns:
+        A hashable key, or None if *dataset* has to be resampled on its own.
+
+    """
+    from pyresample.geometry import SwathDefinition
+
+    from satpy.resample.kdtree import KDTreeResampler
+
+    if dataset.dims != ("y", "x") or not isinstance(resampler, _get_batch_resampler_classes()):
+        return None
+    if (isinstance(resampler, KDTreeResampler) and isinstance(resampler.source_geo_def, SwathDefinition)
+            and kwargs.get("mask_area") is not False):
+        # the neighbours depend on the invalid pixels of each dataset
+        return None
+    fill_value = kwargs.get("fill_value", _get_fill_value(dataset))
+    return id(resampler), dataset.dtype, fill_value
+
+
+def resample_dataset_batch(datasets, destination_area, **kwargs):
+    """Resample several 2D datasets sharing a source area in a single call.
+
+    The datasets are stacked along a ``bands`` dimension so that the resampler
+    applies its precomputed index once for all of them. The result is split
+    back into one DataArray per dataset.
+
+    Args:
+        datasets (list): 2D datasets with the same area, dtype and fill value,
+          for example grouped by :func:`get_batch_key`.
+        destination_area: The destination onto which to project the data.
+        **kwargs: The extra parameters to pass to the resampler objects.
+
+    Returns:
+        List of resampled DataArrays like those returned by
+        :func:`resample_dataset`, in the order of *datasets*.
+
+    """
+    first = datasets[0]
+    kwargs.setdefault("fill_value", _get_fill_value(first))
+    coords = {"bands": np.arange(len(datasets))}
+    coords.update({cname: first.coords[cname] for cname in ("y", "x") if cname in first.coords})
+    stacked = xr.DataArray(da.stack([da.asarray(dataset.data) for dataset in datasets]),
+                           dims=("bands", "y", "x"), coords=coords,
+                           attrs={"area": first.attrs["area"]})
+    new_stacked = resample_dataset(stacked, destination_area, **kwargs)
+
+    results = []
+    for idx, dataset in enumerate(datasets):
+        new_data = new_stacked.isel(bands=idx).drop_vars("bands", errors="ignore").rename(dataset.name)
+        new_data = _update_resampled_coords(dataset, new_data, destination_area)
+        new_data.attrs = dataset.attrs.copy()
+        new_data.attrs.update(new_stacked.attrs)
+        new_data.attrs.update(area=destination_area)
+        results.append(new_data)
+    return results
@@ -1,5 +1,6 @@
 """Bucket resamplers."""
 
+from contextlib import nullcontext
 from logging import getLogger
 
 import dask.array as da
@@ -7,6 +8,12 @@ import numpy as np
 import xarray as xr
 from pyresample.resampler import BaseResampler as PRBaseResampler
 
+from satpy.cache_manager import (
+    atomic_cache_path,
+    cache_lock_if_missing,
+    enforce_cache_limits,
+    touch_cache_entry,
+)
 from satpy.resample.base import _update_resampled_coords
 from satpy.utils import get_legacy_chunk_size
 
@@ -16,38 +23,84 @@ CHUNK_SIZE = get_legacy_chunk_size()
 
 
 class BucketResamplerBase(PRBaseResampler):
-    """Base class for bucket resampling which implements averaging."""
+    """Base class for bucket resampling which implements averaging.
+
+    The bucket indices of the source pixels are computed once per resampler
+    instance and reused for every dataset resampled with it. If `cache_dir`
+    is given the indices are also stored on disk and loaded from there the
+    next time the same source and target areas are used.
+    """
 
     def __init__(self, source_geo_def, target_geo_def):
         """Initialize bucket resampler."""
         super(BucketResamplerBase, self).__init__(source_geo_def, target_geo_def)
         self.resampler = None
 
-    def precompute(self, **kwargs):
+    def precompute(self, cache_dir=None, **kwargs):
         """Create X and Y indices and store them for later use."""
         from pyresample import bucket
 
-        LOG.debug("Initializing bucket resampler.")
-        source_lons, source_lats = self.source_geo_def.get_lonlats(
-            chunks=CHUNK_SIZE)
-        self.resampler = bucket.BucketResampler(self.target_geo_def,
-                                                source_lons,
-                                                source_lats)
+        del kwargs
+        if self.resampler is None:
+            LOG.debug("Initializing bucket resampler.")
+            source_lons, source_lats = self.source_geo_def.get_lonlats(
+                chunks=CHUNK_SIZE)
+            self.resampler = bucket.BucketResampler(self.target_geo_def,
+                                                    source_lons,
+                                                    source_lats)
+            with self._cache_lock(cache_dir):
+                try:
+                    self.load_bucket_indices(cache_dir)
+                    LOG.debug("Read pre-computed bucket indices")
+                except IOError:
+                    self.save_bucket_indices(cache_dir)
+
+    def _cache_lock(self, cache_dir):
+        """Get a lock for creating the on-disk cache of the bucket indices."""
+        if not cache_dir:
+            return nullcontext()
+        return cache_lock_if_missing(self._create_cache_filename(cache_dir, prefix="bucket_lut-"))
+
+    def load_bucket_indices(self, cache_dir):
+        """Load the bucket indices from the cache directory."""
+        if not cache_dir:
+            raise IOError
+        filename = self._create_cache_filename(cache_dir, prefix="bucket_lut-")
+        try:
+            idxs = da.from_zarr(filename, component="idxs")
+        except (ValueError, OSError, KeyError):
+            raise IOError
+        touch_cache_entry(filename)
+        self.resampler.idxs = idxs.rechunk(self.resampler.idxs.chunks)
+
+    def save_bucket_indices(self, cache_dir):
+        """Save the bucket indices to the cache directory."""
+        if not cache_dir:
+            return
+        filename = self._create_cache_filename(cache_dir, prefix="bucket_lut-")
+        LOG.info("Saving bucket indices to %s", filename)
+        idxs = self.resampler.idxs.persist()
+        zarr_out = xr.Dataset({"idxs": (("x1",), idxs)})
+        with atomic_cache_path(filename) as tmp_filename:
+            zarr_out.to_zarr(tmp_filename)
+        enforce_cache_limits(cache_dir, keep=(filename,))
+        self.resampler.idxs = idxs
 
     def compute(self, data, **kwargs):
         """Call the resampling."""
         raise NotImplementedError("Use the sub-classes")
 
-    def resample(self, data, **kwargs):  # noqa: D417
+    def resample(self, data, cache_dir=None, **kwargs):  # noqa: D417
         """Resample `data` by calling `precompute` and `compute` methods.
 
         Args:
             data (xarray.DataArray): Data to be resampled
+            cache_dir (str): Directory where the bucket indices are cached
 
         Returns (xarray.DataArray): Data resampled to the target area
 
         """
-        self.precompute(**kwargs)
+        self.precompute(cache_dir=cache_dir, **kwargs)
         attrs = data.attrs.copy()
         data_arr = data.data
         dims = _get_dims(data)
@@ -0,0 +1,231 @@
+"""Nearest neighbour resampling of geostationary data without a KD-tree."""
+
+from contextlib import nullcontext
+from logging import getLogger
+
+import dask
+import dask.array as da
+import numpy as np
+import xarray as xr
+import zarr
+from pyproj import Transformer
+from pyresample.geometry import AreaDefinition
+from pyresample.resampler import BaseResampler as PRBaseResampler
+
+from satpy.cache_manager import (
+    atomic_cache_path,
+    cache_lock_if_missing,
+    enforce_cache_limits,
+    touch_cache_entry,
+)
+from satpy.resample.base import _update_resampled_coords
+from satpy.utils import get_legacy_chunk_size
+
+LOG = getLogger(__name__)
+
+CHUNK_SIZE = get_legacy_chunk_size()
+
+INDEX_NAMES = ("rows", "cols")
+
+
+class GeostationaryNearestResampler(PRBaseResampler):
+    """Resample geostationary data to an area using the nearest source pixel.
+
+    Instead of building a KD-tree over all source pixels, the centres of the
+    target pixels are projected into the geostationary projection of the
+    source area and rounded to the source pixel containing them. The indices
+    are computed independently for every chunk of the target area. Every
+    chunk of the result only reads the rows and columns of the source data
+    its indices refer to, so memory use follows the size of the target
+    chunks rather than the size of the full disk.
+
+    Each target pixel gets the value of the source pixel whose footprint in
+    the geostationary projection contains it. This is almost always the
+    pixel the ``nearest`` resampler picks, but can differ by one pixel close
+    to pixel boundaries, where the distance on the ground and in the
+    projection disagree. Near the limb of the earth disk, target pixels
+    falling in a source pixel centred in space get that (usually invalid)
+    pixel instead of the closest pixel on the disk.
+
+    The indices are computed when the resampler is prepared and kept in
+    memory (8 bytes per target pixel) as long as the resampler is used.
+    Like :class:`~satpy.resample.kdtree.KDTreeResampler`, this resampler
+    caches the indices on disk when the `cache_dir` argument is provided to
+    the `resample` method and is kept in memory within the
+    ``resampler_cache_size`` setting.
+
+    Args:
+        cache_dir (str): Long term storage directory for intermediate
+                         results.
+
+    """
+
+    def __init__(self, source_geo_def, target_geo_def):
+        """Init GeostationaryNearestResampler."""
+        super().__init__(source_geo_def, target_geo_def)
+        self._indices = None
+        self._windows = None
+
+    def precompute(self, cache_dir=None, **kwargs):
+        """Compute the source pixel indices of every target pixel and store them for later use."""
+        del kwargs
+        if self._indices is not None:
+            return
+        self._check_areas()
+        with self._cache_lock(cache_dir):
+            try:
+                self.load_indices(cache_dir)
+                LOG.debug("Read pre-computed geostationary indices")
+            except IOError:
+                LOG.debug("Computing geostationary indices")
+                indices = self._get_indices()
+                # the source window of every target chunk is needed to build the resampling graph
+                self._set_indices(dict(zip(indices.keys(), da.compute(*indices.values()))))
+                self.save_indices(cache_dir)
+
+    def _check_areas(self):
+        if not isinstance(self.source_geo_def, AreaDefinition) or self.source_geo_def.crs.to_dict().get(
+                "proj") != "geos":
+            raise ValueError("Source area must be an AreaDefinition in the geostationary projection.")
+        if not isinstance(self.target_geo_def, AreaDefinition):
+            raise ValueError("Target area must be an AreaDefinition.")
+
+    def _cache_lock(self, cache_dir):
+        """Get a lock for creating the on-disk cache of the indices."""
+        if not cache_dir:
+            return nullcontext()
+        return cache_lock_if_missing(self._create_cache_filename(cache_dir, prefix="geos_nn_lut-"))
+
+    def _get_indices(self):
+        """Get the dask arrays of the source rows and columns, -1 where there is no source pixel."""
+        target = self.target_geo_def
+        transformer = Transformer.from_crs(target.crs, self.source_geo_def.crs, always_xy=True)
+        blocks = []
+        for row_chunks in self._get_target_chunks():
+            row_blocks = []
+            for data_slice in row_chunks:
+                block = dask.delayed(_get_chunk_indices)(self.source_geo_def, target, transformer, data_slice)
+                shape = (2,) + tuple(dim_slice.stop - dim_slice.start for dim_slice in data_slice)
+                row_blocks.append(da.from_delayed(block, shape, dtype=np.int32))
+            blocks.append(row_blocks)
+        indices = da.concatenate([da.concatenate(row_blocks, axis=2) for row_blocks in blocks], axis=1)
+        return dict(zip(INDEX_NAMES, indices))
+
+    def _get_target_chunks(self):
+        """Get the slices of the target area chunks, one list per row of chunks."""
+        chunks = da.core.normalize_chunks(CHUNK_SIZE, self.target_geo_def.shape, dtype=np.float64)
+        y_offsets = np.cumsum((0,) + chunks[0])
+        x_offsets = np.cumsum((0,) + chunks[1])
+        return [[(slice(y_start, y_end), slice(x_start, x_end))
+                 for x_start, x_end in zip(x_offsets[:-1], x_offsets[1:])]
+                for y_start, y_end in zip(y_offsets[:-1], y_offsets[1:])]
+
+    def _set_indices(self, indices):
+        self._indices = indices
+        self._windows = [[(data_slice, _get_source_window(indices["rows"][data_slice], indices["cols"][data_slice]))
+                          for data_slice in row_chunks]
+                         for row_chunks in self._get_target_chunks()]
+
+    @property
+    def cache_nbytes(self):
+        """Get the number of bytes used by the indices kept in memory."""
+        if self._indices is None:
+            return 0
+        return sum(val.nbytes for val in self._indices.values())
+
+    def load_indices(self, cache_dir):
+        """Read the indices from the disk cache."""
+        if not cache_dir:
+            raise IOError
+        filename = self._create_cache_filename(cache_dir, prefix="geos_nn_lut-")
+        try:
+            fid = zarr.open(filename, mode="r")
+            indices = {name: np.array(fid[name]) for name in INDEX_NAMES}
+        except (ValueError, KeyError):
+            raise IOError
+        touch_cache_entry(filename)
+        self._set_indices(indices)
+
+    def save_indices(self, cache_dir):
+        """Cache the indices if there is a cache dir."""
+        if not cache_dir:
+            return
+        filename = self._create_cache_filename(cache_dir, prefix="geos_nn_lut-")
+        LOG.info("Saving geostationary indices to %s", filename)
+        zarr_out = xr.Dataset({name: (("y", "x"), val) for name, val in self._indices.items()})
+        with atomic_cache_path(filename) as tmp_filename:
+            zarr_out.to_zarr(tmp_filename)
+        enforce_cache_limits(cache_dir, keep=(filename,))
+
+    def compute(self, data, fill_value=np.nan, **kwargs):
+        """Resample data."""
+        del kwargs
+        LOG.debug("Resampling %s", str(data.name))
+        if data.dims[-2:] != ("y", "x"):
+            raise ValueError("Data to resample must have 'y' and 'x' as its last dimensions.")
+        if np.issubdtype(data.dtype, np.integer) and (fill_value is None or np.isnan(fill_value)):
+            fill_value = np.iinfo(data.dtype).max
+        elif fill_value is None:
+            fill_value = np.nan
+        src = data.data if isinstance(data.data, da.Array) else da.from_array(data.data, chunks=CHUNK_SIZE)
+        blocks = [[self._sample_source_window(src, data_slice, window, fill_value)
+                   for data_slice, window in row_windows]
+                  for row_windows in self._windows]
+        res = xr.DataArray(da.block(blocks), dims=data.dims, attrs=data.attrs.copy())
+        return _update_resampled_coords(data, res, self.target_geo_def)
+
+    def _sample_source_window(self, src, data_slice, window, fill_value):
+        """Resample one target chunk, reading only the source window its indices refer to."""
+        rows = self._indices["rows"][data_slice]
+        cols = self._indices["cols"][data_slice]
+        if window is None:
+            return da.full(src.shape[:-2] + rows.shape, fill_value, dtype=src.dtype,
+                           chunks=src.chunks[:-2] + rows.shape)
+        row_slice, col_slice = window
+        valid = rows >= 0
+        rows = da.from_array(np.where(valid, rows - row_slice.start, -1), chunks=-1)
+        cols = da.from_array(np.where(valid, cols - col_slice.start, -1), chunks=-1)
+        extra_dims = tuple(f"d{idx}" for idx in range(src.ndim - 2))
+        return da.blockwise(_sample_chunk, extra_dims + ("y2", "x2"),
+                            rows, ("y2", "x2"),
+                            cols, ("y2", "x2"),
+                            src[..., row_slice, col_slice], extra_dims + ("y1", "x1"),
+                            fill_value=fill_value, concatenate=True,
+                            dtype=src.dtype, meta=np.array((), dtype=src.dtype))
+
+
+def _get_source_window(rows, cols):
+    """Get the source rows and columns referred to by the indices of one target chunk, None if there are none."""
+    valid = rows >= 0
+    if not valid.any():
+        return None
+    rows = rows[valid]
+    cols = cols[valid]
+    return slice(int(rows.min()), int(rows.max()) + 1), slice(int(cols.min()), int(cols.max()) + 1)
+
+
+def _get_chunk_indices(source, target, transformer, data_slice):
+    """Get the source rows and columns for one chunk of the target area."""
+    x__, y__ = target.get_proj_coords(data_slice=data_slice, dtype=np.float64)
+    x__, y__ = transformer.transform(x__, y__)
+    cols, rows = source.get_array_coordinates_from_projection_coordinates(x__, y__)
+    with np.errstate(invalid="ignore"):
+        rows = np.round(rows)
+        cols = np.round(cols)
+        invalid = ~((rows >= 0) & (rows < source.height) & (cols >= 0) & (cols < source.width))
+    rows[invalid] = -1
+    cols[invalid] = -1
+    return np.stack((rows, cols)).astype(np.int32)
+
+
+def _sample_chunk(rows, cols, src, fill_value):
+    """Get the source pixels for one chunk of the target area."""
+    res = np.full(src.shape[:-2] + rows.shape, fill_value, dtype=src.dtype)
+    valid = rows >= 0
+    res[..., valid] = src[..., rows[valid], cols[valid]]
+    return res
+
+
+def get_resampler_classes():
+    """Get the geostationary resampler classes."""
+    return {"geos_nearest": GeostationaryNearestResampler}
@@ -2,14 +2,24 @@
 
 import os
 import warnings
+from contextlib import nullcontext
 from logging import getLogger
 
+import dask
 import dask.array as da
 import numpy as np
 import xarray as xr
 import zarr
+from pyresample.geometry import AreaDefinition
 from pyresample.resampler import BaseResampler as PRBaseResampler
 
+import satpy
+from satpy.cache_manager import (
+    atomic_cache_path,
+    cache_lock_if_missing,
+    enforce_cache_limits,
+    touch_cache_entry,
+)
 from satpy.resample.base import _update_resampled_coords
 from satpy.utils import get_legacy_chunk_size
 
@@ -56,6 +66,8 @@ class KDTreeResampler(PRBaseResampler):
         super(KDTreeResampler, self).__init__(source_geo_def, target_geo_def)
         self.resampler = None
         self._index_caches = {}
+        # keep computed indices in memory, see satpy.resample.plan.ResamplePlan
+        self.keep_precomputed = False
 
     def precompute(self, mask=None, radius_of_influence=None, epsilon=0,
                    cache_dir=None, **kwargs):
@@ -86,13 +98,40 @@ class KDTreeResampler(PRBaseResampler):
             # FIXME: We need to move all of this caching logic to pyresample
             self.resampler = XArrayResamplerNN(**kwargs)
 
-        try:
-            self.load_neighbour_info(cache_dir, mask=mask, **kwargs)
-            LOG.debug("Read pre-computed kd-tree parameters")
-        except IOError:
-            LOG.debug("Computing kd-tree parameters")
-            self.resampler.get_neighbour_info(mask=mask)
-            self.save_neighbour_info(cache_dir, mask=mask, **kwargs)
+        # only one process computes the parameters, the others wait and read them from the cache
+        with self._cache_lock(cache_dir, mask=mask, **kwargs):
+            try:
+                self.load_neighbour_info(cache_dir, mask=mask, **kwargs)
+                LOG.debug("Read pre-computed kd-tree parameters")
+            except IOError:
+                LOG.debug("Computing kd-tree parameters")
+                self.resampler.get_neighbour_info(mask=mask)
+                self.save_neighbour_info(cache_dir, mask=mask, **kwargs)
+                if not cache_dir and mask is None and (
+                        self.keep_precomputed or satpy.config.get("resampler_cache_size", 0)):
+                    self._keep_neighbour_info_in_memory()
+
+    def _keep_neighbour_info_in_memory(self):
+        """Compute the index arrays and keep them as numpy arrays for later use of this resampler."""
+        cache = self._read_resampler_attrs()
+        cache = dict(zip(cache.keys(), da.compute(*cache.values())))
+        for idx_name, val in cache.items():
+            self._apply_cached_index(val, idx_name)
+        self._index_caches[None] = cache
+        self.resampler.delayed_kdtree = None
+
+    @property
+    def cache_nbytes(self):
+        """Get the number of bytes used by the index arrays cached in memory."""
+        return sum(val.nbytes for cache in self._index_caches.values() for val in cache.values())
+
+    def _cache_lock(self, cache_dir, mask=None, **kwargs):
+        """Get a lock for creating the on-disk cache of the neighbour info."""
+        if not cache_dir:
+            return nullcontext()
+        filename = self._create_cache_filename(
+            cache_dir, prefix="nn_lut-", mask=getattr(mask, "name", None), **kwargs)
+        return cache_lock_if_missing(filename)
 
     def _adjust_radius_of_influence(self, radius_of_influence):
         """Adjust radius of influence."""
@@ -146,6 +185,7 @@ class KDTreeResampler(PRBaseResampler):
                 mask=mask_name, **kwargs)
             fid = zarr.open(filename, mode="r")
             cache = np.array(fid[idx_name])
+            touch_cache_entry(filename)
             if idx_name == "valid_input_index":
                 # valid input index array needs to be boolean
                 cache = cache.astype(bool)
@@ -170,7 +210,9 @@ class KDTreeResampler(PRBaseResampler):
                 zarr_out[idx_name] = (coord, cache[idx_name])
 
             # Write indices to Zarr file
-            zarr_out.to_zarr(filename)
+            with atomic_cache_path(filename) as tmp_filename:
+                zarr_out.to_zarr(tmp_filename)
+            enforce_cache_limits(cache_dir, keep=(filename,))
 
             self._index_caches[mask_name] = cache
             # Delete the kdtree, it's not needed anymore
@@ -232,14 +274,29 @@ class BilinearResampler(PRBaseResampler):
                           epsilon=epsilon)
 
             self.resampler = XArrayBilinearResampler(**kwargs)
-            try:
-                self.load_bil_info(cache_dir, **kwargs)
-                LOG.debug("Loaded bilinear parameters")
-            except IOError:
-                LOG.debug("Computing bilinear parameters")
-                self.resampler.get_bil_info()
-                LOG.debug("Saving bilinear parameters.")
-                self.save_bil_info(cache_dir, **kwargs)
+            # only one process computes the parameters, the others wait and read them from the cache
+            with self._cache_lock(cache_dir, **kwargs):
+                try:
+                    self.load_bil_info(cache_dir, **kwargs)
+                    LOG.debug("Loaded bilinear parameters")
+                except IOError:
+                    LOG.debug("Computing bilinear parameters")
+                    self.resampler.get_bil_info()
+                    LOG.debug("Saving bilinear parameters.")
+                    self.save_bil_info(cache_dir, **kwargs)
+
+    @property
+    def cache_nbytes(self):
+        """Get the number of bytes used by the bilinear parameters."""
+        return sum(getattr(getattr(self.resampler, attr_name, None), "nbytes", 0)
+                   for attr_name in BIL_COORDINATES)
+
+    def _cache_lock(self, cache_dir, **kwargs):
+        """Get a lock for creating the on-disk cache of the bilinear parameters."""
+        if not cache_dir:
+            return nullcontext()
+        filename = self._create_cache_filename(cache_dir, prefix="bil_lut-", **kwargs)
+        return cache_lock_if_missing(filename)
 
     def load_bil_info(self, cache_dir, **kwargs):
         """Load bilinear resampling info from cache directory."""
@@ -249,6 +306,7 @@ class BilinearResampler(PRBaseResampler):
                                                    **kwargs)
             try:
                 self.resampler.load_resampling_info(filename)
+                touch_cache_entry(filename)
             except AttributeError:
                 warnings.warn(
                     "Bilinear resampler can't handle caching, "
@@ -270,13 +328,16 @@ class BilinearResampler(PRBaseResampler):
                 _move_existing_caches(cache_dir, filename)
             LOG.info("Saving BIL neighbour info to %s", filename)
             try:
-                self.resampler.save_resampling_info(filename)
+                with atomic_cache_path(filename) as tmp_filename:
+                    self.resampler.save_resampling_info(tmp_filename)
             except AttributeError:
                 warnings.warn(
                     "Bilinear resampler can't handle caching, "
                     "please upgrade Pyresample to 0.17.0 or newer.",
                     stacklevel=2
                 )
+            else:
+                enforce_cache_limits(cache_dir, keep=(filename,))
 
     def compute(self, data, fill_value=None, **kwargs):
         """Resample the given data using bilinear interpolation."""
@@ -293,6 +354,233 @@ class BilinearResampler(PRBaseResampler):
         return _update_resampled_coords(data, res, self.target_geo_def)
 
 
+class ChunkedKDTreeResampler(PRBaseResampler):
+    """Resample area definitions with nearest neighbours searched per output chunk.
+
+    Instead of one KD-tree over the whole source area, every chunk of the
+    target area gets the source window covering it (see
+    :meth:`pyresample.geometry.AreaDefinition.get_area_slices`) and a KD-tree
+    over that window only. Memory use scales with the chunk size and the
+    chunks are independent dask tasks, so they can run in parallel on
+    different workers. During resampling every output chunk only reads its
+    source window.
+
+    Both the source and the target need to be
+    :class:`~pyresample.geometry.AreaDefinition` objects. Like
+    :class:`KDTreeResampler`, the neighbours are cached on disk when the
+    `cache_dir` argument is provided to the `resample` method and kept in
+    memory within the ``resampler_cache_size`` setting.
+
+    Args:
+        cache_dir (str): Long term storage directory for intermediate
+                         results.
+        radius_of_influence (float): Search radius cut off distance in meters
+        epsilon (float): Allowed uncertainty in meters. Increasing uncertainty
+                         reduces execution time.
+
+    """
+
+    # extra source pixels around each window for neighbours just outside of it
+    window_margin = 2
+
+    def __init__(self, source_geo_def, target_geo_def):
+        """Init ChunkedKDTreeResampler."""
+        super().__init__(source_geo_def, target_geo_def)
+        self._windows = None
+        self._index_array = None
+        self._cached_index_array = None
+        # keep computed indices in memory, see satpy.resample.plan.ResamplePlan
+        self.keep_precomputed = False
+
+    def precompute(self, mask=None, radius_of_influence=None, epsilon=0, cache_dir=None, **kwargs):
+        """Find the nearest source pixel of every target pixel chunk by chunk."""
+        del kwargs
+        if self._index_array is not None:
+            return
+        if not isinstance(self.source_geo_def, AreaDefinition) or not isinstance(self.target_geo_def,
+                                                                                 AreaDefinition):
+            raise ValueError("Chunked nearest neighbour resampling needs AreaDefinition source and target areas.")
+        if mask is not None:
+            LOG.warning("Mask provided to chunked nearest resampler. Invalid pixels are not excluded.")
+        if radius_of_influence is None:
+            radius_of_influence = self._get_default_radius_of_influence()
+
+        self._windows = self._get_source_windows()
+        with self._cache_lock(cache_dir, radius_of_influence=radius_of_influence, epsilon=epsilon):
+            try:
+                self.load_index_array(cache_dir, radius_of_influence=radius_of_influence, epsilon=epsilon)
+                LOG.debug("Read pre-computed chunked kd-tree parameters")
+            except IOError:
+                LOG.debug("Computing chunked kd-tree parameters")
+                index_array = self._get_index_array(radius_of_influence, epsilon)
+                if cache_dir or self.keep_precomputed or satpy.config.get("resampler_cache_size", 0):
+                    index_array = index_array.compute()
+                self._set_index_array(index_array)
+                self.save_index_array(cache_dir, radius_of_influence=radius_of_influence, epsilon=epsilon)
+
+    def _get_default_radius_of_influence(self):
+        resolutions = []
+        for area in (self.source_geo_def, self.target_geo_def):
+            try:
+                resolutions.append(area.geocentric_resolution())
+            except RuntimeError:
+                LOG.warning("Could not calculate resolution of %s", area.area_id)
+        if not resolutions:
+            return 10000
+        return max(resolutions)
+
+    def _get_target_chunk_sizes(self):
+        return da.core.normalize_chunks(CHUNK_SIZE, self.target_geo_def.shape, dtype=np.float64)
+
+    def _get_target_chunks(self):
+        chunks = self._get_target_chunk_sizes()
+        y_offsets = np.cumsum((0,) + chunks[0])
+        x_offsets = np.cumsum((0,) + chunks[1])
+        return [[(slice(y_start, y_end), slice(x_start, x_end))
+                 for x_start, x_end in zip(x_offsets[:-1], x_offsets[1:])]
+                for y_start, y_end in zip(y_offsets[:-1], y_offsets[1:])]
+
+    def _get_source_windows(self):
+        """Get the source slices covering every target chunk, None where nothing is covered."""
+        return [[self._get_source_window(chunk) for chunk in row_chunks]
+                for row_chunks in self._get_target_chunks()]
+
+    def _get_source_window(self, chunk):
+        try:
+            x_slice, y_slice = self.source_geo_def.get_area_slices(self.target_geo_def[chunk])
+        except NotImplementedError:
+            # the areas don't overlap
+            return None
+        y_slice = _expand_slice(y_slice, self.source_geo_def.height, self.window_margin)
+        x_slice = _expand_slice(x_slice, self.source_geo_def.width, self.window_margin)
+        if y_slice is None or x_slice is None:
+            return None
+        return y_slice, x_slice
+
+    def _iter_chunks(self):
+        """Iterate over the rows of target chunks, pairing every chunk with its source window."""
+        for row_chunks, row_windows in zip(self._get_target_chunks(), self._windows):
+            yield list(zip(row_chunks, row_windows))
+
+    def _get_index_array(self, radius_of_influence, epsilon):
+        """Get the index of the nearest pixel in the source window of every target pixel, -1 if none."""
+        blocks = []
+        for row_chunks in self._iter_chunks():
+            row_blocks = []
+            for chunk, window in row_chunks:
+                target = self.target_geo_def[chunk]
+                if window is None:
+                    row_blocks.append(da.full(target.shape, -1, dtype=np.int32))
+                    continue
+                block = dask.delayed(_get_window_neighbours)(
+                    self.source_geo_def[window], target, radius_of_influence, epsilon)
+                row_blocks.append(da.from_delayed(block, target.shape, dtype=np.int32))
+            blocks.append(row_blocks)
+        return da.block(blocks)
+
+    def _set_index_array(self, index_array):
+        self._cached_index_array = index_array
+        if isinstance(index_array, np.ndarray):
+            index_array = da.from_array(index_array, chunks=self._get_target_chunk_sizes())
+        self._index_array = index_array
+
+    @property
+    def cache_nbytes(self):
+        """Get the number of bytes used by the neighbours kept in memory."""
+        if isinstance(self._cached_index_array, np.ndarray):
+            return self._cached_index_array.nbytes
+        return 0
+
+    def _cache_lock(self, cache_dir, **kwargs):
+        """Get a lock for creating the on-disk cache of the neighbours."""
+        if not cache_dir:
+            return nullcontext()
+        return cache_lock_if_missing(self._create_cache_filename(cache_dir, prefix="nn_chunked_lut-", **kwargs))
+
+    def load_index_array(self, cache_dir, **kwargs):
+        """Read the neighbours from the disk cache."""
+        if not cache_dir:
+            raise IOError
+        filename = self._create_cache_filename(cache_dir, prefix="nn_chunked_lut-", **kwargs)
+        try:
+            index_array = np.array(zarr.open(filename, mode="r")["index_array"])
+        except (ValueError, KeyError):
+            raise IOError
+        touch_cache_entry(filename)
+        self._set_index_array(index_array)
+
+    def save_index_array(self, cache_dir, **kwargs):
+        """Cache the neighbours if there is a cache dir."""
+        if not cache_dir:
+            return
+        filename = self._create_cache_filename(cache_dir, prefix="nn_chunked_lut-", **kwargs)
+        LOG.info("Saving chunked kd_tree neighbour info to %s", filename)
+        zarr_out = xr.Dataset({"index_array": (("y", "x"), self._cached_index_array)})
+        with atomic_cache_path(filename) as tmp_filename:
+            zarr_out.to_zarr(tmp_filename)
+        enforce_cache_limits(cache_dir, keep=(filename,))
+
+    def compute(self, data, fill_value=np.nan, **kwargs):
+        """Resample data."""
+        del kwargs
+        LOG.debug("Resampling %s", str(data.name))
+        if data.dims[-2:] != ("y", "x"):
+            raise ValueError("Data to resample must have 'y' and 'x' as its last dimensions.")
+        if np.issubdtype(data.dtype, np.integer) and (fill_value is None or np.isnan(fill_value)):
+            fill_value = np.iinfo(data.dtype).max
+        elif fill_value is None:
+            fill_value = np.nan
+        src = data.data if isinstance(data.data, da.Array) else da.from_array(data.data, chunks=CHUNK_SIZE)
+        blocks = []
+        for row_chunks in self._iter_chunks():
+            row_blocks = []
+            for chunk, window in row_chunks:
+                shape = src.shape[:-2] + tuple(slc.stop - slc.start for slc in chunk)
+                if window is None:
+                    row_blocks.append(da.full(shape, fill_value, dtype=src.dtype))
+                    continue
+                block = dask.delayed(_sample_window)(self._index_array[chunk], src[(Ellipsis,) + window],
+                                                     fill_value)
+                row_blocks.append(da.from_delayed(block, shape, dtype=src.dtype))
+            blocks.append(row_blocks)
+        res = xr.DataArray(da.block(blocks), dims=data.dims, attrs=data.attrs.copy())
+        return _update_resampled_coords(data, res, self.target_geo_def)
+
+
+def _expand_slice(slc, size, margin):
+    """Add *margin* pixels to both sides of a slice, None if it doesn't select anything."""
+    if slc.step not in (None, 1):
+        return None
+    start = max(slc.start - margin, 0)
+    stop = min(slc.stop + margin, size)
+    if start >= stop:
+        return None
+    return slice(start, stop)
+
+
+def _get_window_neighbours(source, target, radius_of_influence, epsilon):
+    """Get the flat index of the nearest pixel of *source* for every pixel of *target*."""
+    from pyresample.kd_tree import get_neighbour_info
+    valid_input_index, valid_output_index, index_array, _ = get_neighbour_info(
+        source, target, radius_of_influence, neighbours=1, epsilon=epsilon)
+    input_index = np.flatnonzero(valid_input_index)
+    found = index_array < input_index.size
+    output_index = np.full(valid_output_index.sum(), -1, dtype=np.int32)
+    output_index[found] = input_index[index_array[found]]
+    res = np.full(target.size, -1, dtype=np.int32)
+    res[valid_output_index.ravel()] = output_index
+    return res.reshape(target.shape)
+
+
+def _sample_window(index_array, src, fill_value):
+    """Get the source pixels of one target chunk from its source window."""
+    src = src.reshape(src.shape[:-2] + (-1,))
+    res = np.full(src.shape[:-1] + index_array.shape, fill_value, dtype=src.dtype)
+    valid = index_array >= 0
+    res[..., valid] = src[..., index_array[valid]]
+    return res
+
+
 def _move_existing_caches(cache_dir, filename):
     """Move existing cache files out of the way."""
     import os
@@ -316,5 +604,6 @@ def get_resampler_classes():
     return {
         "kd_tree": KDTreeResampler,
         "nearest": KDTreeResampler,
-        "bilinear": BilinearResampler
+        "bilinear": BilinearResampler,
+        "nearest_chunked": ChunkedKDTreeResampler,
     }
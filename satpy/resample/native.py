@@ -1,7 +1,6 @@
 """Native resampler."""
 
 import warnings
-from math import lcm  # type: ignore
 
 import dask.array as da
 import numpy as np
@@ -9,7 +8,7 @@ import xarray as xr
 from pyresample.resampler import BaseResampler as PRBaseResampler
 
 from satpy.resample.base import _update_resampled_coords
-from satpy.utils import PerformanceWarning, get_legacy_chunk_size
+from satpy.utils import get_legacy_chunk_size
 
 CHUNK_SIZE = get_legacy_chunk_size()
 
@@ -18,7 +17,18 @@ class NativeResampler(PRBaseResampler):
     """Expand or reduce input datasets to be the same shape.
 
     If data is higher resolution (more pixels) than the destination area
-    then data is averaged to match the destination resolution.
+    then data is aggregated to match the destination resolution. By default
+    the NaN-aware mean of the pixels is used, computed in 32-bit floats for
+    integer data. The ``aggregation`` keyword argument selects another
+    reduction, which is useful for integer and category products:
+
+    * ``"mean"``: Mean ignoring NaNs (default).
+    * ``"min"``/``"max"``: Minimum/maximum ignoring NaNs.
+    * ``"mode"``: Most frequent value (majority). On ties the smallest value
+      is used.
+    * ``"first"``: Upper left pixel of every aggregated block.
+
+    All reductions except ``"mean"`` keep the data type of the input.
 
     If data is lower resolution (less pixels) than the destination area
     then data is repeated to match the destination resolution.
@@ -37,22 +47,21 @@ class NativeResampler(PRBaseResampler):
                                                      **kwargs)
 
     @classmethod
-    def _expand_reduce(cls, d_arr, repeats):
+    def _expand_reduce(cls, d_arr, repeats, aggregation="mean"):
         """Expand reduce."""
-        d_arr = _ensure_dask_array(d_arr)
         if all(x == 1 for x in repeats.values()):
-            return d_arr
+            return _ensure_dask_array(d_arr)
         if all(x >= 1 for x in repeats.values()):
-            return _replicate(d_arr, repeats)
+            return _replicate(_ensure_dask_array(d_arr), repeats)
         if all(x <= 1 for x in repeats.values()):
             # reduce
             y_size = 1. / repeats[0]
             x_size = 1. / repeats[1]
-            return _aggregate(d_arr, y_size, x_size)
+            return _aggregate(d_arr, y_size, x_size, aggregation=aggregation)
         raise ValueError("Must either expand or reduce in both "
                          "directions")
 
-    def compute(self, data, expand=True, **kwargs):
+    def compute(self, data, expand=True, aggregation="mean", **kwargs):
         """Resample data with NativeResampler."""
         if isinstance(self.target_geo_def, (list, tuple)):
             # find the highest/lowest area among the provided
@@ -65,7 +74,7 @@ class NativeResampler(PRBaseResampler):
         # convert xarray backed with numpy array to dask array
         repeats = _get_repeats(target_geo_def, data)
 
-        d_arr = self._expand_reduce(data.data, repeats)
+        d_arr = self._expand_reduce(data.data, repeats, aggregation=aggregation)
         new_data = xr.DataArray(d_arr, dims=data.dims)
         return _update_resampled_coords(data, new_data, target_geo_def)
 
@@ -103,8 +112,8 @@ def _get_axes(data):
     return y_axis, x_axis
 
 
-def _aggregate(d, y_size, x_size):
-    """Average every 4 elements (2x2) in a 2D array."""
+def _aggregate(d, y_size, x_size, aggregation="mean"):
+    """Reduce every block of y_size x x_size elements in a 2D array to one element."""
     if d.ndim != 2:
         # we can't guarantee what blocks we are getting and how
         # it should be reshaped to do the averaging.
@@ -112,22 +121,79 @@ def _aggregate(d, y_size, x_size):
                          "more than 2 dimensions.")
     if not (x_size.is_integer() and y_size.is_integer()):
         raise ValueError("Aggregation factors are not integers")
+    try:
+        reduce_func = _AGGREGATIONS[aggregation]
+    except KeyError:
+        raise ValueError(f"Unknown aggregation '{aggregation}', use one of {', '.join(_AGGREGATIONS)}.")
     y_size = int(y_size)
     x_size = int(x_size)
-    d = _rechunk_if_nonfactor_chunks(d, y_size, x_size)
+    d = _to_aligned_dask_array(d, y_size, x_size)
     new_chunks = (tuple(int(x / y_size) for x in d.chunks[0]),
                   tuple(int(x / x_size) for x in d.chunks[1]))
-    return da.core.map_blocks(_mean, d, y_size, x_size,
-                              meta=np.array((), dtype=d.dtype),
-                              dtype=d.dtype, chunks=new_chunks)
+    dtype = np.float32 if aggregation == "mean" and not np.issubdtype(d.dtype, np.floating) else d.dtype
+    return da.core.map_blocks(reduce_func, d, y_size, x_size,
+                              meta=np.array((), dtype=dtype),
+                              dtype=dtype, chunks=new_chunks)
 
 
-def _mean(data, y_size, x_size):
+def _get_blocks(data, y_size, x_size):
+    """Reshape a 2D array so that axes 1 and 3 run over the elements of every block."""
     rows, cols = data.shape
-    new_shape = (int(rows / y_size), int(y_size),
-                 int(cols / x_size), int(x_size))
-    data_mean = np.nanmean(data.reshape(new_shape), axis=(1, 3))
-    return data_mean
+    return data.reshape(rows // y_size, y_size, cols // x_size, x_size)
+
+
+def _mean(data, y_size, x_size):
+    blocks = _get_blocks(data, y_size, x_size)
+    if not np.issubdtype(data.dtype, np.floating):
+        return blocks.mean(axis=(1, 3), dtype=np.float32)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(blocks, axis=(1, 3))
+
+
+def _min(data, y_size, x_size):
+    return _nan_reduce(np.nanmin, np.min, data, y_size, x_size)
+
+
+def _max(data, y_size, x_size):
+    return _nan_reduce(np.nanmax, np.max, data, y_size, x_size)
+
+
+def _nan_reduce(nan_func, func, data, y_size, x_size):
+    blocks = _get_blocks(data, y_size, x_size)
+    if not np.issubdtype(data.dtype, np.floating):
+        return func(blocks, axis=(1, 3))
+    with warnings.catch_warnings():
+        # all-NaN blocks
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return nan_func(blocks, axis=(1, 3))
+
+
+def _mode(data, y_size, x_size):
+    blocks = _get_blocks(data, y_size, x_size)
+    blocks = np.sort(blocks.transpose(0, 2, 1, 3).reshape(blocks.shape[0], blocks.shape[2], -1), axis=-1)
+    # count the occurrences of every value as the position in its run of equal
+    # sorted values, NaNs are never equal so they are only counted once
+    positions = np.arange(blocks.shape[-1])
+    run_start = np.ones(blocks.shape, dtype=bool)
+    run_start[..., 1:] = blocks[..., 1:] != blocks[..., :-1]
+    run_start_positions = np.maximum.accumulate(np.where(run_start, positions, 0), axis=-1)
+    # the first longest run is the one with the smallest value
+    most_frequent = (positions - run_start_positions).argmax(axis=-1)
+    return np.take_along_axis(blocks, most_frequent[..., None], axis=-1)[..., 0]
+
+
+def _first(data, y_size, x_size):
+    return data[::y_size, ::x_size]
+
+
+_AGGREGATIONS = {
+    "mean": _mean,
+    "min": _min,
+    "max": _max,
+    "mode": _mode,
+    "first": _first,
+}
 
 
 def _replicate(d_arr, repeats):
@@ -161,31 +227,48 @@ def _repeat_by_factor(data, block_info=None):
     return out_data
 
 
-def _rechunk_if_nonfactor_chunks(dask_arr, y_size, x_size):
-    new_chunks = list(dask_arr.chunks)
+def _to_aligned_dask_array(d_arr, y_size, x_size):
+    """Get *d_arr* as a dask array with chunks divisible by the aggregation factors.
+
+    The aligned chunks are planned once from the chunks of the input: numpy
+    arrays are chunked with them directly and dask arrays, usually chunked
+    following the structure of the input files, are only rechunked if one of
+    their chunk boundaries isn't a multiple of the factor.
+
+    """
+    if isinstance(d_arr, da.Array):
+        chunks = d_arr.chunks
+    else:
+        chunks = da.core.normalize_chunks(CHUNK_SIZE, d_arr.shape, dtype=d_arr.dtype)
+    aligned_chunks = []
     for dim_idx, agg_size in enumerate([y_size, x_size]):
-        if dask_arr.shape[dim_idx] % agg_size != 0:
+        if d_arr.shape[dim_idx] % agg_size != 0:
             raise ValueError("Aggregation requires arrays with shapes divisible by the factor.")
-        need_rechunk = _check_chunking(new_chunks, dask_arr, dim_idx, agg_size)
-    if need_rechunk:
-        warnings.warn(
-            "Array chunk size is not divisible by aggregation factor. "
-            "Re-chunking to continue native resampling.",
-            PerformanceWarning,
-            stacklevel=5
-        )
-        dask_arr = dask_arr.rechunk(tuple(new_chunks))
-    return dask_arr
-
-
-def _check_chunking(new_chunks, dask_arr, dim_idx, agg_size):
-    need_rechunk = False
-    for chunk_size in dask_arr.chunks[dim_idx]:
-        if chunk_size % agg_size != 0:
-            need_rechunk = True
-            new_dim_chunk = lcm(chunk_size, agg_size)
-            new_chunks[dim_idx] = new_dim_chunk
-    return need_rechunk
+        aligned_chunks.append(_get_aligned_chunks(chunks[dim_idx], agg_size))
+    aligned_chunks = tuple(aligned_chunks)
+    if not isinstance(d_arr, da.Array):
+        return da.from_array(d_arr, chunks=aligned_chunks)
+    if aligned_chunks != d_arr.chunks:
+        d_arr = d_arr.rechunk(aligned_chunks)
+    return d_arr
+
+
+def _get_aligned_chunks(chunks, agg_size):
+    """Get chunk sizes divisible by *agg_size* that are as close as possible to *chunks*.
+
+    Every chunk boundary is moved to the nearest multiple of the aggregation
+    factor, so rechunking only moves the pixels next to the boundaries between
+    neighbouring chunks.
+
+    """
+    if all(chunk_size % agg_size == 0 for chunk_size in chunks):
+        return chunks
+    boundaries = [0]
+    for boundary in np.cumsum(chunks):
+        aligned = max(int(round(boundary / agg_size)) * agg_size, agg_size)
+        if aligned > boundaries[-1]:
+            boundaries.append(aligned)
+    return tuple(np.diff(boundaries).tolist())
 
 
 def get_resampler_classes():
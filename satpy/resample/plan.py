@@ -0,0 +1,160 @@
+"""Plans for resampling several Scenes with the same geometry."""
+
+from logging import getLogger
+
+from satpy.area import get_area_slices
+
+LOG = getLogger(__name__)
+
+
+class ResamplePlan:
+    """Resampling setup reusable for Scenes with the same source and target geometry.
+
+    Resampling a :class:`~satpy.scene.Scene` finds the source data slices
+    covering the target area, creates a resampler for every source area and
+    lets the resamplers compute their indices. A plan keeps all of these, so
+    that the Scenes of a time series only pay for them once:
+
+    .. code-block:: python
+
+        >>> plan = ResamplePlan.from_scene(scenes[0], "euro4", resampler="nearest")
+        >>> resampled = [plan.apply(scn) for scn in scenes]
+
+    Resamplers supporting it keep their computed indices in memory for the
+    lifetime of the plan. :meth:`~satpy.multiscene.MultiScene.resample` uses a
+    plan automatically for all Scenes with the same areas as the first one.
+
+    """
+
+    def __init__(self, destination_area, resampler=None, reduce_data=True, **resample_kwargs):
+        """Create an empty plan, see :meth:`from_scene` to create one from a Scene.
+
+        Args:
+            destination_area: Area definition to resample to. Dynamic areas
+                must already be frozen.
+            resampler: Name of the resampling method to use.
+            reduce_data: Reduce data by matching the input and output areas
+                and slicing the data arrays.
+            resample_kwargs: Remaining keyword arguments to pass to the
+                resampler classes.
+
+        """
+        self.destination_area = destination_area
+        self.reduce_data = reduce_data
+        self.resample_kwargs = dict(resample_kwargs, resampler=resampler)
+        # source area -> ((slice_x, slice_y), reduced source area)
+        self.reductions = {}
+        # (reduced) source area -> (resampler cache key, resampler instance)
+        self.resamplers = {}
+        self._source_areas = set()
+        self.keep_precomputed = False
+
+    @classmethod
+    def from_scene(cls, scn, destination=None, datasets=None, resampler=None, reduce_data=True,
+                   **resample_kwargs):
+        """Create a plan for resampling *scn* and Scenes with the same geometry.
+
+        The arguments are the same as for :meth:`satpy.scene.Scene.resample`.
+        Resamplers supporting it keep their computed indices in memory, so
+        they are only computed for the first Scene resampled with the plan.
+
+        """
+        new_scn = scn.copy(datasets=datasets)
+        if destination is None:
+            destination = new_scn.finest_area()
+        destination_area = new_scn._get_finalized_destination_area(destination, new_scn)
+        plan = cls(destination_area, resampler=resampler, reduce_data=reduce_data, **resample_kwargs)
+        plan.keep_precomputed = True
+        for source_area in _get_source_areas(new_scn.values()):
+            plan.add_source_area(source_area)
+        return plan
+
+    @property
+    def source_areas(self):
+        """Get the source areas this plan was prepared for."""
+        return frozenset(self._source_areas)
+
+    def add_source_area(self, source_area):
+        """Register *source_area* as part of the plan and prepare its resampler.
+
+        Returns:
+            The source area to resample from after data reduction.
+
+        """
+        from satpy.resample.base import prepare_resampler
+
+        self._source_areas.add(source_area)
+        reduced_area = self._reduce_area(source_area)
+        if reduced_area not in self.resamplers:
+            key, resampler = prepare_resampler(reduced_area, self.destination_area, **self.resample_kwargs)
+            if self.keep_precomputed and hasattr(resampler, "keep_precomputed"):
+                resampler.keep_precomputed = True
+            self.resamplers[reduced_area] = key, resampler
+        return reduced_area
+
+    def _reduce_area(self, source_area):
+        if not self.reduce_data:
+            LOG.debug("Data reduction disabled by the user")
+            return source_area
+        try:
+            return self.reductions[source_area][1]
+        except KeyError:
+            pass
+        if self.resample_kwargs.get("resampler") == "gradient_search":
+            factor = self.resample_kwargs.get("shape_divisible_by", 2)
+        else:
+            factor = None
+        try:
+            slice_x, slice_y = get_area_slices(source_area, self.destination_area, shape_divisible_by=factor)
+        except NotImplementedError:
+            LOG.info("Not reducing data before resampling.")
+            return source_area
+        reduced_area = source_area[slice_y, slice_x]
+        self.reductions[source_area] = (slice_x, slice_y), reduced_area
+        return reduced_area
+
+    def is_compatible(self, scn, datasets=None):
+        """Check if all areas of the datasets in *scn* are part of this plan.
+
+        Areas are compared with their hash first, so this is cheap for area
+        definitions.
+
+        """
+        if datasets is None:
+            datasets = scn.keys()
+        areas = _get_source_areas(scn[ds_id] for ds_id in datasets if ds_id in scn)
+        return bool(areas) and areas <= self._source_areas
+
+    def apply(self, scn, datasets=None, generate=True, unload=True):
+        """Resample *scn* with this plan and return a new Scene.
+
+        Args:
+            scn: Scene whose datasets have the areas of this plan.
+            datasets: Limit datasets to resample to these specified data
+                arrays. By default all currently loaded datasets are
+                resampled.
+            generate: Generate any requested composites that could not be
+                previously due to incompatible areas (default: True).
+            unload: Remove any datasets no longer needed after requested
+                composites have been generated (default: True).
+
+        Raises:
+            ValueError: If the Scene has areas this plan wasn't prepared for.
+
+        """
+        if not self.is_compatible(scn, datasets=datasets):
+            raise ValueError("Scene has areas that are not part of the resample plan.")
+        new_scn = scn.copy(datasets=datasets)
+        scn._resample_with_plan(new_scn, self)
+        if generate:
+            new_scn.generate_possible_composites(unload)
+        return new_scn
+
+
+def _get_source_areas(datasets):
+    """Get the areas of *datasets* and their ancillary variables."""
+    from satpy.dataset import dataset_walker
+
+    areas = {dataset.attrs.get("area") for dataset, _ in dataset_walker(list(datasets))}
+    areas.discard(None)
+    return areas
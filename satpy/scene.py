@@ -29,7 +29,7 @@ import xarray as xr
 from pyresample.geometry import AreaDefinition, BaseDefinition, CoordinateDefinition, SwathDefinition
 from xarray import DataArray
 
-from satpy.area import get_area_def
+from satpy.area import get_area_def, get_area_slices
 from satpy.composites.config_loader import load_compositor_configs_for_sensors
 from satpy.composites.core import IncompatibleAreas
 from satpy.dataset import DataID, DataQuery, DatasetDict, combine_metadata, dataset_walker, replace_anc
@@ -624,7 +624,7 @@ class Scene:
                 "crop_area", "crop_area", "crop_xy",
                 src_area.crs, src_area.width, src_area.height,
                 xy_bbox)
-        x_slice, y_slice = src_area.get_area_slices(dst_area)
+        x_slice, y_slice = get_area_slices(src_area, dst_area)
         return src_area[y_slice, x_slice], y_slice, x_slice
 
     def _slice_datasets(self, dataset_ids, slice_key, new_area, area_only=True):
@@ -868,14 +868,20 @@ class Scene:
         If data reduction is enabled, some local caching is perfomed in order to
         avoid recomputation of area intersections.
         """
+        from satpy.resample.plan import ResamplePlan
+
+        destination_area = self._get_finalized_destination_area(destination_area, new_scn)
+        plan = ResamplePlan(destination_area, reduce_data=reduce_data, **resample_kwargs)
+        self._resample_with_plan(new_scn, plan)
+
+    def _resample_with_plan(self, new_scn, plan):
+        """Resample the datasets of `new_scn` in place with the reductions and resamplers of `plan`."""
         from satpy.resample.base import resample_dataset
 
         new_datasets = {}
         datasets = list(new_scn._datasets.values())
-        destination_area = self._get_finalized_destination_area(destination_area, new_scn)
-
-        resamplers = {}
-        reductions = {}
+        prepared = self._prepare_datasets_for_resampling(datasets, plan)
+        batched = self._resample_batches(prepared, plan.destination_area)
         for dataset, parent_dataset in dataset_walker(datasets):
             ds_id = DataID.from_dataarray(dataset)
             pres = None
@@ -892,20 +898,72 @@ class Scene:
                 else:
                     replace_anc(dataset, pres)
                 continue
-            LOG.debug("Resampling %s", ds_id)
-            source_area = dataset.attrs["area"]
-            dataset, source_area = self._reduce_data(dataset, source_area, destination_area,
-                                                     reduce_data, reductions, resample_kwargs)
-            self._prepare_resampler(source_area, destination_area, resamplers, resample_kwargs)
-            kwargs = resample_kwargs.copy()
-            kwargs["resampler"] = resamplers[source_area]
-            res = resample_dataset(dataset, destination_area, **kwargs)
+            if ds_id in batched:
+                res = batched[ds_id]
+            else:
+                LOG.debug("Resampling %s", ds_id)
+                dataset, kwargs = prepared[ds_id]
+                res = resample_dataset(dataset, plan.destination_area, **kwargs)
             new_datasets[ds_id] = res
             if ds_id in new_scn._datasets:
                 new_scn._datasets[ds_id] = res
             if parent_dataset is not None:
                 replace_anc(res, pres)
 
+    def _prepare_datasets_for_resampling(self, datasets, plan):
+        """Reduce the datasets and get the resampling keyword arguments for each of them.
+
+        Returns:
+            Dictionary of ``(dataset, kwargs)`` tuples by DataID for all
+            datasets with an area.
+
+        """
+        prepared = {}
+        for dataset, _ in dataset_walker(datasets):
+            ds_id = DataID.from_dataarray(dataset)
+            source_area = dataset.attrs.get("area")
+            if source_area is None or ds_id in prepared:
+                continue
+            reduced_area = plan.add_source_area(source_area)
+            if reduced_area is not source_area:
+                dataset = self._slice_data(reduced_area, plan.reductions[source_area][0], dataset)
+            key, resampler = plan.resamplers[reduced_area]
+            self._resamplers[key] = resampler
+            kwargs = plan.resample_kwargs.copy()
+            kwargs["resampler"] = resampler
+            prepared[ds_id] = (dataset, kwargs)
+        return prepared
+
+    @staticmethod
+    def _resample_batches(prepared, destination_area):
+        """Resample 2D datasets sharing a source area, dtype and fill value together.
+
+        Stacking the datasets lets the resampler apply its precomputed index
+        once for all of them instead of once per dataset.
+
+        Returns:
+            Dictionary of the resampled datasets by DataID. Datasets that can't
+            be batched with any other dataset are not included.
+
+        """
+        from satpy.resample.base import get_batch_key, resample_dataset_batch
+
+        groups = {}
+        for ds_id, (dataset, kwargs) in prepared.items():
+            key = get_batch_key(dataset, **kwargs)
+            if key is not None:
+                groups.setdefault(key, []).append(ds_id)
+
+        batched = {}
+        for ds_ids in groups.values():
+            if len(ds_ids) < 2:
+                continue
+            LOG.debug("Resampling %s together", ", ".join(str(ds_id) for ds_id in ds_ids))
+            group_datasets = [prepared[ds_id][0] for ds_id in ds_ids]
+            kwargs = prepared[ds_ids[0]][1]
+            batched.update(zip(ds_ids, resample_dataset_batch(group_datasets, destination_area, **kwargs)))
+        return batched
+
     def _get_finalized_destination_area(self, destination_area, new_scn):
         if isinstance(destination_area, str):
             destination_area = get_area_def(destination_area)
@@ -918,41 +976,6 @@ class Scene:
                                  "DynamicAreaDefinition.")
         return destination_area
 
-    def _prepare_resampler(self, source_area, destination_area, resamplers, resample_kwargs):
-        from satpy.resample.base import prepare_resampler
-
-        if source_area not in resamplers:
-            key, resampler = prepare_resampler(
-                source_area, destination_area, **resample_kwargs)
-            resamplers[source_area] = resampler
-            self._resamplers[key] = resampler
-
-    def _reduce_data(self, dataset, source_area, destination_area, reduce_data, reductions, resample_kwargs):
-        try:
-            if reduce_data:
-                key = source_area
-                try:
-                    (slice_x, slice_y), source_area = reductions[key]
-                except KeyError:
-                    if resample_kwargs.get("resampler") == "gradient_search":
-                        factor = resample_kwargs.get("shape_divisible_by", 2)
-                    else:
-                        factor = None
-                    try:
-                        slice_x, slice_y = source_area.get_area_slices(
-                            destination_area, shape_divisible_by=factor)
-                    except TypeError:
-                        slice_x, slice_y = source_area.get_area_slices(
-                            destination_area)
-                    source_area = source_area[slice_y, slice_x]
-                    reductions[key] = (slice_x, slice_y), source_area
-                dataset = self._slice_data(source_area, (slice_x, slice_y), dataset)
-            else:
-                LOG.debug("Data reduction disabled by the user")
-        except NotImplementedError:
-            LOG.info("Not reducing data before resampling.")
-        return dataset, source_area
-
     def resample(
             self,
             destination: AreaDefinition | CoordinateDefinition | str | None = None,
@@ -46,8 +46,21 @@ def _reset_satpy_config(tmpdir):
 @pytest.fixture(autouse=True)
 def _clear_function_caches():
     """Clear out global function-level caches that may cause conflicts between tests."""
+    from satpy.area import _area_slices_cache
     from satpy.composites.config_loader import load_compositor_configs_for_sensor
+    from satpy.modifiers._crefl import _load_average_elevation
+    from satpy.modifiers.angles import clear_angle_cache
+    from satpy.modifiers.atmosphere import _get_atmospherical_corrector, _get_rayleigh_corrector
+    from satpy.modifiers.parallax import _corrected_geolocation_cache
+    from satpy.modifiers.spectral import _get_reflectance_calculator
     load_compositor_configs_for_sensor.cache_clear()
+    _get_rayleigh_corrector.cache_clear()
+    _get_atmospherical_corrector.cache_clear()
+    _load_average_elevation.cache_clear()
+    _get_reflectance_calculator.cache_clear()
+    _area_slices_cache.clear()
+    _corrected_geolocation_cache.clear()
+    clear_angle_cache()
 
 
 @pytest.fixture
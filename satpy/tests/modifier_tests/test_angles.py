@@ -17,6 +17,9 @@
 
 import contextlib
 import datetime as dt
+import shutil
+import threading
+import time
 import warnings
 from copy import deepcopy
 from glob import glob
@@ -130,7 +133,7 @@ def _glob_reversed(pat):
 @contextlib.contextmanager
 def _mock_glob_if(mock_glob):
     if mock_glob:
-        with mock.patch("satpy.modifiers.angles.glob", _glob_reversed):
+        with mock.patch("satpy._cache.glob", _glob_reversed):
             yield
     else:
         yield
@@ -201,8 +204,10 @@ class TestAngleGeneration:
             angles2 = get_angles(input_data2)
             da.compute(*tuple(x.data for x in angles2))
 
-        # get_observer_look should have been called once per array chunk
-        assert gol.call_count == input_data1.data.blocks.size * 2
+        # get_observer_look should have been called once per array chunk and computation, the sun angles of the
+        # second nadir position are shared with the first one and computed again with its sensor angles
+        num_computations = 2 if forced_preference == "actual" else 3
+        assert gol.call_count == input_data1.data.blocks.size * num_computations
         if forced_preference == "actual":
             exp_call = mock.call(9.5, 0.005, 12345.679, input_data1.attrs["start_time"], mock.ANY, mock.ANY, 0)
             all_same_calls = [exp_call] * gol.call_count
@@ -298,9 +303,76 @@ class TestAngleGeneration:
         zarr_dirs = glob(str(tmp_path / "*.zarr"))
         assert len(zarr_dirs) == 0
 
+    def test_cache_computed_once_by_concurrent_calls(self, tmp_path):
+        """Test that concurrent calls compute a missing cache entry only once."""
+        from satpy._cache import cache_to_zarr_if
+
+        calls = []
+
+        @cache_to_zarr_if("cache_lonlats")
+        def _fake_func(shape, chunks):
+            calls.append(shape)
+            time.sleep(0.2)
+            return (da.ones(shape, chunks=chunks),)
+
+        results = []
+
+        def _call():
+            results.append(_fake_func((10, 10), ((5, 5), (5, 5)))[0])
+
+        with satpy.config.set(cache_lonlats=True, cache_dir=str(tmp_path)):
+            threads = [threading.Thread(target=_call) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert len(calls) == 1
+        assert len(results) == 3
+        for res in results:
+            np.testing.assert_array_equal(res, 1)
+
+    def test_incomplete_cache_recomputed(self, tmp_path):
+        """Test that the results are computed again when part of a cached group is missing."""
+        from satpy._cache import cache_to_zarr_if
+
+        calls = []
+
+        @cache_to_zarr_if("cache_lonlats")
+        def _fake_func(shape, chunks):
+            calls.append(shape)
+            return da.zeros(shape, chunks=chunks), da.ones(shape, chunks=chunks)
+
+        with satpy.config.set(cache_lonlats=True, cache_dir=str(tmp_path)):
+            _fake_func((10, 10), ((5, 5), (5, 5)))
+            shutil.rmtree(glob(str(tmp_path / "_fake_func_*_1_*.zarr"))[0])
+            res = _fake_func((10, 10), ((5, 5), (5, 5)))
+        assert len(calls) == 2
+        assert len(res) == 2
+        np.testing.assert_array_equal(res[1], 1)
+        assert len(glob(str(tmp_path / "*.zarr"))) == 2
+
+    def test_cache_limits_keep_new_results(self, tmp_path):
+        """Test that enforcing the cache size limit evicts whole groups but never the results just written."""
+        from satpy._cache import cache_to_zarr_if
+
+        @cache_to_zarr_if("cache_lonlats")
+        def _fake_func(shape, chunks):
+            return da.zeros(shape, chunks=chunks), da.ones(shape, chunks=chunks)
+
+        with satpy.config.set(cache_lonlats=True, cache_dir=str(tmp_path), cache_max_size=1):
+            first = _fake_func((10, 10), ((5, 5), (5, 5)))
+            first_paths = glob(str(tmp_path / "*.zarr"))
+            assert len(first_paths) == 2
+            second = _fake_func((10, 5), ((5, 5), (5,)))
+        assert len(first) == len(second) == 2
+        np.testing.assert_array_equal(second[1], 1)
+        zarr_paths = glob(str(tmp_path / "*.zarr"))
+        assert len(zarr_paths) == 2
+        assert not set(first_paths) & set(zarr_paths)
+
     def test_cached_no_chunks_fails(self, tmp_path):
         """Test that trying to pass non-dask arrays and no chunks fails."""
-        from satpy.modifiers.angles import _sanitize_args_with_chunks, cache_to_zarr_if
+        from satpy._cache import _sanitize_args_with_chunks, cache_to_zarr_if
 
         @cache_to_zarr_if("cache_lonlats", sanitize_args_func=_sanitize_args_with_chunks)
         def _fake_func(data, tuple_arg, chunks):
@@ -313,7 +385,7 @@ class TestAngleGeneration:
 
     def test_cached_result_numpy_fails(self, tmp_path):
         """Test that trying to cache with non-dask arrays fails."""
-        from satpy.modifiers.angles import _sanitize_args_with_chunks, cache_to_zarr_if
+        from satpy._cache import _sanitize_args_with_chunks, cache_to_zarr_if
 
         @cache_to_zarr_if("cache_lonlats", sanitize_args_func=_sanitize_args_with_chunks)
         def _fake_func(shape, chunks):
@@ -325,7 +397,7 @@ class TestAngleGeneration:
 
     def test_caching_with_array_in_args_warns(self, tmp_path):
         """Test that trying to cache with non-dask arrays fails."""
-        from satpy.modifiers.angles import cache_to_zarr_if
+        from satpy._cache import cache_to_zarr_if
 
         @cache_to_zarr_if("cache_lonlats")
         def _fake_func(array):
@@ -337,7 +409,7 @@ class TestAngleGeneration:
 
     def test_caching_with_array_in_args_does_not_warn_when_caching_is_not_enabled(self, tmp_path, recwarn):
         """Test that trying to cache with non-dask arrays fails."""
-        from satpy.modifiers.angles import cache_to_zarr_if
+        from satpy._cache import cache_to_zarr_if
 
         @cache_to_zarr_if("cache_lonlats")
         def _fake_func(array):
@@ -396,3 +468,279 @@ class TestAngleGeneration:
 
         assert np.all(azi > 0)
         assert azi.dtype == dtype
+
+
+class TestAngleMemoryCache:
+    """Test keeping generated lon/lats and angles in memory."""
+
+    def test_get_angles_shares_arrays(self):
+        """Test that repeated calls return the same dask arrays."""
+        from satpy.modifiers.angles import get_angle_cache_info, get_angles
+
+        data = _get_angle_test_data()
+        new_data = data.copy()
+        new_data.attrs = deepcopy(data.attrs)
+        new_data.attrs["start_time"] += dt.timedelta(milliseconds=200)
+        angles1 = get_angles(data)
+        angles2 = get_angles(new_data)
+        for angle_arr1, angle_arr2 in zip(angles1, angles2):
+            assert angle_arr1.data is angle_arr2.data
+        # lon/lats and angles are generated once each
+        info = get_angle_cache_info()
+        assert info.misses == 2
+        assert info.hits == 1
+
+    def test_different_satellite_position(self):
+        """Test that sensor angles are regenerated for a different satellite position."""
+        from satpy.modifiers.angles import get_angles
+
+        data = _get_angle_test_data()
+        new_data = _similar_sat_pos_datetime(data)
+        new_data.attrs["start_time"] = data.attrs["start_time"]
+        angles1 = get_angles(data)
+        angles2 = get_angles(new_data)
+        assert angles1[1].data.name != angles2[1].data.name
+        assert angles1[3].data is angles2[3].data
+
+    def test_get_cos_sza_dtype(self):
+        """Test that the cosine of the SZA is cached per data type."""
+        from satpy.modifiers.angles import get_angle_cache_info, get_cos_sza
+
+        data = _get_angle_test_data()
+        cos_sza64 = get_cos_sza(data)
+        cos_sza32 = get_cos_sza(data.astype(np.float32))
+        assert cos_sza64.dtype == np.float64
+        assert cos_sza32.dtype == np.float32
+        assert get_cos_sza(data).data is cos_sza64.data
+        assert get_angle_cache_info().hits == 2  # lon/lats and the second float64 cos(SZA)
+
+    def test_swath_not_cached(self):
+        """Test that angles of swaths are not kept in memory."""
+        from pyresample.geometry import SwathDefinition
+
+        from satpy.modifiers.angles import get_angle_cache_info, get_cos_sza
+
+        lons = xr.DataArray(da.from_array(np.linspace(0, 10, 25).reshape(5, 5), chunks=2), dims=("y", "x"))
+        lats = xr.DataArray(da.from_array(np.linspace(40, 50, 25).reshape(5, 5), chunks=2), dims=("y", "x"))
+        data = _get_angle_test_data(area_def=SwathDefinition(lons, lats))
+        get_cos_sza(data)
+        get_cos_sza(data)
+        assert get_angle_cache_info().currsize == 0
+
+    def test_cache_size(self):
+        """Test that least recently used arrays are removed."""
+        from satpy.modifiers.angles import clear_angle_cache, get_angle_cache_info, get_cos_sza
+
+        data = _get_angle_test_data()
+        with satpy.config.set(angle_memory_cache_size=2):
+            for hours in range(3):
+                new_data = data.copy()
+                new_data.attrs = dict(data.attrs, start_time=data.attrs["start_time"] + dt.timedelta(hours=hours))
+                get_cos_sza(new_data)
+            info = get_angle_cache_info()
+        assert info.maxsize == 2
+        assert info.currsize == 2
+        clear_angle_cache()
+        assert get_angle_cache_info() == (0, 0, 32, 0)
+
+
+def _get_full_disk_test_data(size=200, chunks=60):
+    area = AreaDefinition(
+        "fd", "", "",
+        {"proj": "geos", "lon_0": 0.0, "h": 35785831.0, "a": 6378169.0, "b": 6356583.8},
+        size, size,
+        (-5570248.5, -5567248.1, 5567248.1, 5570248.5),
+    )
+    return _get_angle_test_data(area_def=area, chunks=chunks, shape=area.shape)
+
+
+class TestAngleInterpolation:
+    """Test computing angles on a coarse grid."""
+
+    @pytest.mark.parametrize("stride", [4, 16])
+    def test_angles_within_tolerance(self, stride):
+        """Test that interpolated angles are close to the exact angles."""
+        from satpy.modifiers.angles import clear_angle_cache, get_angles, get_cos_sza
+
+        data = _get_full_disk_test_data()
+        exact = da.compute(*[angle.data for angle in get_angles(data)], get_cos_sza(data).data)
+        clear_angle_cache()
+        with satpy.config.set(angle_computation_stride=stride, angle_interpolation_tolerance=0.05), \
+                mock.patch("satpy.modifiers.angles._get_valid_lonlats") as get_lonlats:
+            interpolated = get_angles(data) + (get_cos_sza(data),)
+            for angle in interpolated:
+                assert angle.chunks == data.chunks
+            interpolated = da.compute(*[angle.data for angle in interpolated])
+        get_lonlats.assert_not_called()
+
+        for angle_idx, (exact_angle, interp_angle) in enumerate(zip(exact, interpolated)):
+            np.testing.assert_array_equal(np.isnan(exact_angle), np.isnan(interp_angle))
+            diff = np.abs(exact_angle - interp_angle)
+            if angle_idx in (0, 2):
+                diff = np.minimum(diff, 360. - diff)
+            # angles are only checked at some points, so allow for some error elsewhere
+            max_diff = 0.002 if angle_idx == 4 else 0.1
+            assert np.nanmax(diff) < max_diff
+
+    def test_cells_computed_exactly(self):
+        """Test that angles are computed exactly where interpolation is too inaccurate."""
+        from satpy.modifiers.angles import get_satellite_zenith_angle
+
+        data = _get_full_disk_test_data()
+        exact = get_satellite_zenith_angle(data).values
+        with satpy.config.set(angle_computation_stride=16, angle_interpolation_tolerance=0.0):
+            interpolated = get_satellite_zenith_angle(data).values
+        np.testing.assert_allclose(interpolated, exact)
+
+    @pytest.mark.parametrize("input_func", [_get_stacked_angle_test_data, _get_angle_test_data])
+    def test_small_chunks_and_other_areas(self, input_func):
+        """Test stacked areas and chunks smaller than the stride."""
+        from satpy.modifiers.angles import get_angles
+
+        data = input_func()
+        exact = da.compute(*[angle.data for angle in get_angles(data)])
+        with satpy.config.set(angle_computation_stride=4):
+            interpolated = da.compute(*[angle.data for angle in get_angles(data)])
+        for exact_angle, interp_angle in zip(exact, interpolated):
+            np.testing.assert_allclose(interp_angle, exact_angle, atol=1e-6)
+
+    def test_cached_sensor_angles(self, tmp_path):
+        """Test that sensor angles computed on a coarse grid are cached separately."""
+        from satpy.modifiers.angles import clear_angle_cache, get_satellite_zenith_angle
+
+        data = _get_full_disk_test_data()
+        with satpy.config.set(cache_sensor_angles=True, cache_dir=str(tmp_path)):
+            exact = get_satellite_zenith_angle(data).values
+            clear_angle_cache()
+            with satpy.config.set(angle_computation_stride=8):
+                interpolated = get_satellite_zenith_angle(data).values
+        assert len(glob(str(tmp_path / "*.zarr"))) == 4
+        assert not np.array_equal(exact, interpolated, equal_nan=True)
+        np.testing.assert_allclose(interpolated, exact, atol=0.05)
+
+    def test_cached_cos_sza(self, tmp_path):
+        """Test that cos(SZA) grids are cached on disk per area and time slot."""
+        from satpy.modifiers.angles import clear_angle_cache, get_cos_sza
+
+        data = _get_angle_test_data()
+        with satpy.config.set(cache_cos_sza=True, cache_dir=str(tmp_path)):
+            cos_sza = get_cos_sza(data).values
+            assert len(glob(str(tmp_path / "_get_cos_sza_for_area*.zarr"))) == 1
+            clear_angle_cache()
+            cached = get_cos_sza(data)
+            assert cached.dtype == data.dtype
+            np.testing.assert_allclose(cached.values, cos_sza)
+            later = data.copy()
+            later.attrs["start_time"] = data.attrs["start_time"] + dt.timedelta(minutes=10)
+            get_cos_sza(later)
+        assert len(glob(str(tmp_path / "_get_cos_sza_for_area*.zarr"))) == 2
+
+
+class TestAngleDataType:
+    """Test generating lon/lats and angles as 32-bit floats."""
+
+    @pytest.mark.parametrize("stride", [None, 8])
+    def test_float32_angles(self, stride):
+        """Test that 32-bit angles are close to the 64-bit angles."""
+        from satpy.modifiers.angles import clear_angle_cache, get_angles, get_cos_sza
+
+        data = _get_full_disk_test_data()
+        with satpy.config.set(angle_computation_stride=stride):
+            exact = da.compute(*[angle.data for angle in get_angles(data)])
+            clear_angle_cache()
+            with satpy.config.set(angle_dtype="float32"):
+                angles = get_angles(data)
+                cos_sza32 = get_cos_sza(data.astype(np.float32))
+                cos_sza64 = get_cos_sza(data)
+        assert all(angle.dtype == np.float32 for angle in angles)
+        assert cos_sza32.dtype == np.float32
+        assert cos_sza64.dtype == np.float64
+
+        angles = da.compute(*[angle.data for angle in angles])
+        for angle_idx, (exact_angle, angle) in enumerate(zip(exact, angles)):
+            assert angle.dtype == np.float32
+            np.testing.assert_array_equal(np.isnan(exact_angle), np.isnan(angle))
+            diff = np.abs(exact_angle - angle)
+            if angle_idx in (0, 2):
+                diff = np.minimum(diff, 360. - diff)
+            max_diff = 0.01 if angle_idx in (0, 2) else 0.0001
+            assert np.nanmax(diff) < max_diff
+
+    def test_float32_lonlats(self):
+        """Test that lon/lats are generated in 64-bit precision before conversion."""
+        from satpy.modifiers.angles import _get_valid_lonlats
+
+        area = _get_full_disk_test_data().attrs["area"]
+        lons64, lats64 = area.get_lonlats()
+        lons, lats = _get_valid_lonlats(area, ((100, 100), (100, 100)), "float32")
+        assert lons.dtype == np.float32
+        assert lats.dtype == np.float32
+        valid = lons64 < 1e30
+        np.testing.assert_array_equal(lons64[valid].astype(np.float32), lons.compute()[valid])
+        np.testing.assert_array_equal(lats64[valid].astype(np.float32), lats.compute()[valid])
+
+    def test_float32_cached_sensor_angles(self, tmp_path):
+        """Test that cached sensor angles have the configured data type."""
+        from satpy.modifiers.angles import clear_angle_cache, get_satellite_zenith_angle
+
+        data = _get_angle_test_data()
+        with satpy.config.set(cache_sensor_angles=True, cache_lonlats=True, cache_dir=str(tmp_path)):
+            satz64 = get_satellite_zenith_angle(data)
+            clear_angle_cache()
+            with satpy.config.set(angle_dtype="float32"):
+                satz32 = get_satellite_zenith_angle(data)
+            assert satz64.dtype == satz64.compute().dtype == np.float64
+            assert satz32.dtype == satz32.compute().dtype == np.float32
+        assert len(glob(str(tmp_path / "*.zarr"))) == 8
+
+
+def test_fused_angles_match_separate_angles():
+    """Test that the angles computed in one task match the separately computed angles."""
+    from satpy.modifiers.angles import (
+        _cos_zen_ndarray,
+        _get_all_angles_ndarray,
+        _get_sensor_angles_ndarray,
+        _get_sun_azimuth_ndarray,
+        _sun_zenith_ndarray,
+    )
+
+    rng = np.random.default_rng(42)
+    lons = rng.uniform(-180, 180, (50, 40))
+    lats = rng.uniform(-90, 90, (50, 40))
+    lons[0, 0] = lats[0, 0] = np.nan
+    args = (dt.datetime(2023, 6, 1, 10, 17, 3), 10.0, 0.5, 35786000.0)
+
+    angles = _get_all_angles_ndarray(lons, lats, *args)
+    sata, satz = _get_sensor_angles_ndarray(lons, lats, *args)
+    expected = [sata, satz,
+                _get_sun_azimuth_ndarray(lons, lats, args[0]),
+                _sun_zenith_ndarray(lons, lats, args[0]),
+                _cos_zen_ndarray(lons, lats, args[0])]
+    assert angles.shape == (5, 50, 40)
+    for angle, exp_angle in zip(angles, expected):
+        np.testing.assert_allclose(angle, exp_angle, atol=1e-9)
+    assert _get_all_angles_ndarray(lons, lats, *args, include_cos_sza=False).shape == (4, 50, 40)
+
+
+def test_get_angles_shares_cos_sza():
+    """Test that get_cos_sza reuses the cosine of the SZA computed by get_angles."""
+    from satpy.modifiers.angles import get_angle_cache_info, get_angles, get_cos_sza
+
+    data = _get_angle_test_data()
+    sunz = get_angles(data)[3]
+    cos_sza = get_cos_sza(data)
+    assert get_angle_cache_info().hits == 1
+    np.testing.assert_allclose(np.cos(np.deg2rad(sunz)), cos_sza)
+
+
+def test_get_angles_uses_rounded_start_time():
+    """Test that the angles are computed for the start time rounded to the second."""
+    from satpy.modifiers.angles import clear_angle_cache, get_angles, get_cos_sza
+
+    data = _get_angle_test_data()
+    new_data = data.copy()
+    new_data.attrs = deepcopy(data.attrs)
+    new_data.attrs["start_time"] += dt.timedelta(milliseconds=900)
+    sunz = get_angles(new_data)[3]
+    clear_angle_cache()
+    np.testing.assert_allclose(np.cos(np.deg2rad(sunz)), get_cos_sza(data), rtol=0, atol=1e-9)
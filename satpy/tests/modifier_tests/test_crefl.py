@@ -14,6 +14,7 @@
 # A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
 """Tests for the CREFL ReflectanceCorrector modifier."""
 import datetime as dt
+import os
 from contextlib import contextmanager
 from unittest import mock
 
@@ -395,3 +396,131 @@ class TestReflectanceCorrectorModifier:
 
         # make sure it can actually compute
         res.compute()
+
+    def _get_viirs_corrector_and_inputs(self, url):
+        from satpy.modifiers._crefl import ReflectanceCorrector
+        ref_cor = ReflectanceCorrector(name="I01", prerequisites=[], wavelength=(0.6, 0.64, 0.68),
+                                       resolution=371, calibration="reflectance", sensor="viirs", url=url)
+        area, data = self.data_area_ref_corrector()
+        c01 = _make_viirs_xarray(data, area, "I01", "toa_bidirectional_reflectance",
+                                 wavelength=(0.6, 0.64, 0.68), units="%", calibration="reflectance")
+        angles = [_make_viirs_xarray(data, area, name, name) for name in
+                  ["satellite_azimuth_angle", "satellite_zenith_angle", "solar_azimuth_angle", "solar_zenith_angle"]]
+        return ref_cor, [c01], angles
+
+    def test_dem_converted_once(self, tmpdir):
+        """Test that the DEM is converted to a memory-mapped file used by later processes."""
+        import satpy
+        from satpy.modifiers._crefl import ReflectanceCorrector, _load_average_elevation
+        ref_cor, datasets, angles = self._get_viirs_corrector_and_inputs("CMGDEM.hdf")
+        with mock_cmgdem(tmpdir, "CMGDEM.hdf"), \
+                mock.patch.object(ReflectanceCorrector, "_read_var_from_hdf4_file",
+                                  wraps=ReflectanceCorrector._read_var_from_hdf4_file) as read_var:
+            exp = ref_cor(datasets, angles).values
+            # simulate a new process
+            _load_average_elevation.cache_clear()
+            res = ref_cor(datasets, angles).values
+            avg_elevation = _load_average_elevation(str(tmpdir.join("CMGDEM.hdf")), ref_cor.dem_sds)
+        read_var.assert_called_once()
+        assert isinstance(avg_elevation, np.memmap)
+        cache_dir = satpy.config.get("cache_dir")
+        assert [fn for fn in os.listdir(cache_dir) if fn.startswith("crefl_dem_")] == [
+            os.path.basename(avg_elevation.filename)]
+        np.testing.assert_allclose(res, exp)
+
+    def test_dem_not_cacheable(self, tmpdir):
+        """Test that the DEM is kept in memory when it can't be written to the cache directory."""
+        from satpy.modifiers._crefl import _load_average_elevation
+        ref_cor, datasets, angles = self._get_viirs_corrector_and_inputs("CMGDEM.hdf")
+        with mock_cmgdem(tmpdir, "CMGDEM.hdf"), \
+                mock.patch("satpy.modifiers._crefl._convert_dem_to_npy", side_effect=PermissionError), \
+                assert_maximum_dask_computes(0):
+            res = ref_cor(datasets, angles)
+            avg_elevation = _load_average_elevation(str(tmpdir.join("CMGDEM.hdf")), ref_cor.dem_sds)
+        assert not isinstance(avg_elevation, np.memmap)
+        assert avg_elevation.dtype == np.float32
+        assert res.shape == (3, 5)
+
+    def test_area_height_cached(self, tmpdir):
+        """Test that the heights of an area are only looked up once with 'cache_crefl_elevation'."""
+        import satpy
+        from satpy.modifiers import _crefl_utils
+        ref_cor, datasets, angles = self._get_viirs_corrector_and_inputs("CMGDEM.hdf")
+        with mock_cmgdem(tmpdir, "CMGDEM.hdf"):
+            exp = ref_cor(datasets, angles).values
+            with satpy.config.set(cache_crefl_elevation=True), \
+                    mock.patch.object(_crefl_utils, "_space_mask_height",
+                                      wraps=_crefl_utils._space_mask_height) as space_mask_height:
+                res1 = ref_cor(datasets, angles).values
+                num_lookups = space_mask_height.call_count
+                res2 = ref_cor(datasets, angles).values
+        assert num_lookups > 0
+        assert space_mask_height.call_count == num_lookups
+        cache_files = os.listdir(satpy.config.get("cache_dir"))
+        assert any(fn.startswith("_get_area_height") and fn.endswith(".zarr") for fn in cache_files)
+        np.testing.assert_allclose(res1, exp)
+        np.testing.assert_allclose(res2, exp)
+
+
+class TestCREFLKernels:
+    """Test that the numba and NumPy implementations of CREFL give the same results."""
+
+    @pytest.fixture
+    def crefl_inputs(self):
+        """Create random reflectances, angles and heights including NaNs and night time pixels."""
+        from satpy.tests.utils import RANDOM_GEN
+        shape = (40, 50)
+        refl = RANDOM_GEN.uniform(0., 1.2, shape)
+        refl[0, 0] = np.nan
+        solar_zenith = RANDOM_GEN.uniform(0., 95., shape)
+        sensor_zenith = RANDOM_GEN.uniform(0., 70., shape)
+        mus = np.cos(np.deg2rad(solar_zenith))
+        mus[mus < 0] = np.nan
+        muv = np.cos(np.deg2rad(sensor_zenith))
+        phi = RANDOM_GEN.uniform(-360., 360., shape)
+        height = RANDOM_GEN.uniform(0., 3000., shape)
+        return refl, mus, muv, phi, solar_zenith, sensor_zenith, height
+
+    @pytest.mark.parametrize("sensor", ["viirs", "modis"])
+    @pytest.mark.parametrize("with_height", [False, True])
+    def test_viirs_modis_kernel(self, crefl_inputs, sensor, with_height):
+        """Test the VIIRS and MODIS kernels for all bands."""
+        pytest.importorskip("numba")
+        from satpy.modifiers._crefl_numba import run_crefl as run_crefl_numba
+        from satpy.modifiers._crefl_utils import _MODISCoefficients, _run_crefl, _VIIRSCoefficients
+        refl, mus, muv, phi, _, _, height = crefl_inputs
+        height = height if with_height else 0.
+        luts = _VIIRSCoefficients.LUTS if sensor == "viirs" else _MODISCoefficients.LUTS
+        for coeffs in zip(*luts):
+            exp = _run_crefl(refl, mus, muv, phi, height, sensor, *coeffs)
+            res = run_crefl_numba(refl, mus, muv, phi, height, sensor, *coeffs)
+            np.testing.assert_allclose(res, exp, rtol=1e-10, atol=1e-14)
+
+    def test_abi_kernel(self, crefl_inputs):
+        """Test the ABI kernel for all bands."""
+        pytest.importorskip("numba")
+        from satpy.modifiers._crefl_numba import run_crefl_abi as run_crefl_abi_numba
+        from satpy.modifiers._crefl_utils import _ABICoefficients, _run_crefl_abi
+        for coeffs in zip(*_ABICoefficients.LUTS):
+            exp = _run_crefl_abi(*crefl_inputs, *coeffs)
+            res = run_crefl_abi_numba(*crefl_inputs, *coeffs)
+            np.testing.assert_allclose(res, exp, rtol=1e-10, atol=1e-14)
+
+    def test_numpy_fallback(self):
+        """Test that the modifier gives the same results without numba."""
+        pytest.importorskip("numba")
+        from satpy.modifiers._crefl import ReflectanceCorrector
+        area, data = TestReflectanceCorrectorModifier.data_area_ref_corrector()
+        ref_cor = ReflectanceCorrector(name="I01", prerequisites=[], wavelength=(0.6, 0.64, 0.68),
+                                       resolution=371, calibration="reflectance", sensor="viirs")
+        c01 = _make_viirs_xarray(data, area, "I01", "toa_bidirectional_reflectance",
+                                 wavelength=(0.6, 0.64, 0.68), units="%", calibration="reflectance")
+        angles = [_make_viirs_xarray(data * 0.5 + idx, area, name, name) for idx, name in enumerate(
+            ["satellite_azimuth_angle", "satellite_zenith_angle", "solar_azimuth_angle", "solar_zenith_angle"])]
+
+        exp = ref_cor([c01], angles).values
+        with mock.patch("satpy.modifiers._crefl_utils._get_numba_kernels", return_value=None), \
+                mock.patch("satpy.modifiers._crefl_numba.run_crefl") as run_crefl_numba:
+            res = ref_cor([c01], angles).values
+        run_crefl_numba.assert_not_called()
+        np.testing.assert_allclose(res, exp, rtol=1e-10)
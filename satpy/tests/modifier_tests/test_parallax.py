@@ -480,7 +480,7 @@ class TestParallaxCorrectionModifier:
 
     def test_parallax_modifier_interface(self):
         """Test the modifier interface."""
-        from satpy.modifiers.parallax import ParallaxCorrectionModifier
+        from satpy.modifiers.parallax import ParallaxCorrectionModifier, _corrected_geolocation_cache
         (area_small, area_large) = _get_fake_areas((0, 0), [5, 9], 0.1)
         fake_bt = xr.DataArray(
                 np.linspace(220, 230, 25).reshape(5, 5),
@@ -498,6 +498,8 @@ class TestParallaxCorrectionModifier:
                 dataset_radius_of_influence=49_000)
         res = modif([fake_bt, cth_clear], optional_datasets=[])
         np.testing.assert_allclose(res, fake_bt)
+        # clear the cache so the cth resample runs again and its radius of influence can be checked
+        _corrected_geolocation_cache.clear()
         with unittest.mock.patch("satpy.modifiers.parallax.resample_dataset") as smp:
             smp.side_effect = satpy.resample.base.resample_dataset
             modif([fake_bt, cth_clear], optional_datasets=[])
@@ -693,6 +695,59 @@ class TestParallaxCorrectionModifier:
         # surface pixels nearby a non-square cloud could be included in the square dest_mask
         assert res.data[dest_mask].mean() < 210
 
+    @pytest.mark.parametrize("cth", [7500, 15000])
+    @pytest.mark.parametrize("test_area", ["foroyar", "ouagadougou"], indirect=["test_area"])
+    def test_modifier_interface_performance_mode(self, cth, test_area):
+        """Test that the performance mode gives the same result as the default mode.
+
+        Use chunks smaller than the largest parallax shift, such that clouds
+        move between chunks.
+        """
+        from satpy.modifiers.parallax import ParallaxCorrectionModifier
+
+        (fake_bt, fake_cth, _) = self._get_fake_cloud_datasets(test_area, cth, use_dask=True)
+        fake_bt = fake_bt.chunk(64)
+        fake_cth = fake_cth.chunk(64)
+        results = []
+        for performance_mode in (False, True):
+            modif = ParallaxCorrectionModifier(
+                    name="parallax_corrected_dataset",
+                    prerequisites=[fake_bt, fake_cth],
+                    optional_prerequisites=[],
+                    lonlat_chunks=64,
+                    performance_mode=performance_mode)
+            results.append(modif([fake_bt, fake_cth], optional_datasets=[]))
+
+        (res_default, res_performance) = results
+        assert res_performance.attrs["area"] == fake_bt.attrs["area"]
+        np.testing.assert_array_equal(res_performance.data, res_default.data)
+
+    @pytest.mark.parametrize("performance_mode", [False, True])
+    def test_corrected_geolocation_reused(self, performance_mode):
+        """Test that the corrected geolocation is computed once for all datasets with the same heights."""
+        from satpy.modifiers.parallax import ParallaxCorrection, ParallaxCorrectionModifier
+
+        test_area = pyresample.create_area_def("ouagadougou", 4087, resolution=500, area_extent=[
+            -232482.90622750926, 1328206.360136668, -114074.70310250926, 1422810.852324168])
+        (fake_bt, fake_cth, _) = self._get_fake_cloud_datasets(test_area, 7500, use_dask=True)
+        fake_bt2 = fake_bt + 1
+        other_cth = fake_cth + 1000
+        modif = ParallaxCorrectionModifier(
+                name="parallax_corrected_dataset",
+                prerequisites=[fake_bt, fake_cth],
+                optional_prerequisites=[],
+                performance_mode=performance_mode)
+
+        method = "corrected_indices" if performance_mode else "corrected_area"
+        with unittest.mock.patch.object(ParallaxCorrection, method, autospec=True,
+                                        side_effect=getattr(ParallaxCorrection, method)) as correct:
+            res = modif([fake_bt, fake_cth], optional_datasets=[])
+            res2 = modif([fake_bt2, fake_cth], optional_datasets=[])
+            assert correct.call_count == 1
+            modif([fake_bt, other_cth], optional_datasets=[])
+            assert correct.call_count == 2
+        np.testing.assert_allclose(res2, res + 1)
+
 
 _test_yaml_code = """
 sensor_name: visir
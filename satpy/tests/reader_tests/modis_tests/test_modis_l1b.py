@@ -170,6 +170,22 @@ class TestModisL1b:
             _load_and_check_geolocation(scene, 500, 500, shape_500m, has_500)
             _load_and_check_geolocation(scene, 250, 250, shape_250m, has_250)
 
+    def test_load_interpolated_lonlat_cached(self, modis_l1b_nasa_1km_mod03_files, tmp_path):
+        """Test that interpolated longitude and latitude are cached on disk."""
+        import satpy
+
+        scene = Scene(reader="modis_l1b", filenames=modis_l1b_nasa_1km_mod03_files)
+        scene.load(["longitude", "latitude"], resolution=250)
+        exp_lons = scene["longitude"]
+        with satpy.config.set(cache_dir=str(tmp_path), readers={"cache_interpolated_navigation": True}):
+            for _ in range(2):
+                scene = Scene(reader="modis_l1b", filenames=modis_l1b_nasa_1km_mod03_files)
+                scene.load(["longitude", "latitude"], resolution=250)
+        assert len(list(tmp_path.glob("interpolated_navigation_*.zarr"))) == 2
+        assert scene["longitude"].data.name.startswith("from-zarr")
+        assert scene["longitude"].chunks == exp_lons.chunks
+        np.testing.assert_allclose(scene["longitude"].values, exp_lons.values)
+
     def test_load_sat_zenith_angle(self, modis_l1b_nasa_mod021km_file):
         """Test loading satellite zenith angle band."""
         scene = Scene(reader="modis_l1b", filenames=modis_l1b_nasa_mod021km_file)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Module for testing the satpy.readers.core.bufr module."""
+
+import importlib
+import sys
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("eccodes")
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="'eccodes' not supported on Windows")
+@pytest.mark.parametrize(
+    ("reader", "test_module", "dataset_name", "exp_keys"),
+    [
+        ("ascat_l2_soilmoisture_bufr", "test_ascat_l2_soilmoisture_bufr", "surface_soil_moisture",
+         {"surfaceSoilMoisture", "latitude", "longitude", "numberOfSubsets"}),
+        ("iasi_l2_so2_bufr", "test_iasi_l2_so2_bufr", "year", {"#1#year", "#1#latitude", "#1#longitude"}),
+    ]
+)
+def test_scene_load_reads_file_once(tmp_path, reader, test_module, dataset_name, exp_keys):
+    """Test that only the keys of the loaded datasets are decoded, in a single pass per load."""
+    from satpy import Scene
+    from satpy.readers.core import bufr
+
+    test_data = importlib.import_module(f"satpy.tests.reader_tests.{test_module}")
+    test_data.save_test_data(str(tmp_path))
+    scn = Scene(reader=reader, filenames=[str(tmp_path / test_data.FILENAME)])
+    with mock.patch("satpy.readers.core.bufr.decode_bufr_messages",
+                    wraps=bufr.decode_bufr_messages) as decode:
+        scn.load([dataset_name])
+        assert decode.call_count == 1
+        assert set(decode.call_args.args[1]) == exp_keys
+
+        scn.load(scn.available_dataset_names())
+        scn.load(scn.available_dataset_names())
+    assert decode.call_count == 2
+    assert exp_keys.isdisjoint(decode.call_args.args[1])
+    assert sorted(dataset.name for dataset in scn) == sorted(scn.available_dataset_names())
@@ -29,6 +29,7 @@ import xarray as xr
 import satpy
 from satpy._config import get_config_path
 from satpy.readers import eps_l1b as eps
+from satpy.readers.core.xmlformat import get_xml_format
 from satpy.tests.utils import make_dataid
 
 # NOTE:
@@ -48,7 +49,7 @@ def create_sections(structure):
     """Create file sections."""
     sections = {}
     format_fn = get_config_path("eps_avhrrl1b_6.5.xml")
-    form = eps.XMLFormat(format_fn)
+    form = get_xml_format(format_fn)
     for count, (rec_class, sub_class) in structure:
         try:
             the_dtype = form.dtype((rec_class, sub_class))
@@ -172,6 +173,49 @@ class TestEPSL1B(BaseTestCaseEPSL1B):
         assert res.attrs["sensor"] == "avhrr-3"
         assert res.attrs["name"] == "cloud_flags"
 
+    def test_index_records(self):
+        """Test that consecutive records of the same class are grouped in the record index."""
+        form = get_xml_format(get_config_path("eps_avhrrl1b_6.5.xml"))
+        with open(self.filename, "rb") as fdes:
+            index = eps.index_records(fdes, form)
+        classes = [(rec_class, count) for rec_class, _, _, count in index]
+        assert classes[0] == (("mphr", 0), 1)
+        assert classes[-1] == (("mdr", 2), self.scan_lines)
+        assert ("ipr", 0) not in [rec_class for rec_class, _ in classes]
+        mdr_offset = index[-1][2]
+        assert mdr_offset == os.path.getsize(self.filename) - self.scan_lines * index[-1][1].itemsize
+
+    def test_index_records_reads_headers_up_to_next_group(self):
+        """Test that only the headers up to the first record of another group are read."""
+        form = get_xml_format(get_config_path("eps_avhrrl1b_6.5.xml"))
+        with open(self.filename, "rb") as fdes, \
+                mock.patch("satpy.readers.eps_l1b.np.memmap", wraps=np.memmap) as memmap:
+            eps.index_records(fdes, form)
+        # the single mphr and sphr records only need the header of the next record
+        assert memmap.call_args_list[0].kwargs["shape"] == (1,)
+        assert memmap.call_args_list[1].kwargs["shape"] == (1,)
+        num_read = sum(call.kwargs["shape"][0] for call in memmap.call_args_list)
+        assert num_read < 2 * (self.scan_lines + 20)
+
+    def test_xml_format_is_parsed_once(self):
+        """Test that the format description is shared between files."""
+        other_fh = eps.EPSAVHRRFile(self.filename, {"start_time": "now", "end_time": "later"}, {})
+        self.fh._read_all()
+        other_fh._read_all()
+        assert self.fh.form is other_fh.form
+
+    def test_scanline_blocks(self):
+        """Test that data and navigation are chunked by blocks of scanlines."""
+        import dask.config
+        with dask.config.set({"array.chunk-size": "1MiB"}):
+            self.fh._read_all()
+        lons = self.fh.get_dataset(make_dataid(name="longitude"), {})
+        refl = self.fh.get_dataset(make_dataid(name="1", calibration="reflectance"), {})
+        assert len(lons.chunks[0]) > 1
+        assert lons.chunks[1] == (self.earth_views,)
+        assert refl.chunks[0] == lons.chunks[0]
+        assert lons[:10].compute().shape == (10, self.earth_views)
+
     @mock.patch("satpy.readers.eps_l1b.EPSAVHRRFile.__getitem__")
     def test_get_full_angles_twice(self, mock__getitem__):
         """Test get full angles twice."""
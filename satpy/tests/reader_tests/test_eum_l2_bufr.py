@@ -378,3 +378,24 @@ class TestL2BufrReader:
         z = bufr_obj.get_data(dataset_name="TestData", key=test_data["key"], coordinates=True)
 
         assert len(z.dims) == 1
+
+    def test_keys_decoded_in_single_pass(self, input_file):
+        """Test that the keys of the datasets to load are decoded in one pass over the file."""
+        from satpy.readers.core import bufr
+
+        test_data = TEST_DATA[input_file]
+        bufr_obj = L2BufrData(input_file, test_data)
+        bufr_obj.fh.prepare_datasets([{"name": name, "key": key, "file_type": test_data["file_type"]}
+                                      for name, key in (("latitude", "#1#latitude"), ("longitude", "#1#longitude"),
+                                                        ("TestData", test_data["key"]))])
+
+        with mock.patch("satpy.readers.core.bufr.decode_bufr_messages",
+                        wraps=bufr.decode_bufr_messages) as decode:
+            zlat = bufr_obj.get_data("latitude", "#1#latitude", coordinates=False)
+            zlon = bufr_obj.get_data("longitude", "#1#longitude", coordinates=False)
+            z = bufr_obj.get_data(dataset_name="TestData", key=test_data["key"], coordinates=True)
+        assert decode.call_count == 1
+        assert set(decode.call_args.args[1]) == {"#1#latitude", "#1#longitude", test_data["key"]}
+        np.testing.assert_array_equal(zlat.values, np.concatenate((LAT, LAT), axis=0))
+        np.testing.assert_array_equal(zlon.values, np.concatenate((LON, LON), axis=0))
+        np.testing.assert_array_equal(z.values, np.concatenate((DATA, DATA), axis=0))
@@ -19,6 +19,7 @@
 """EUM L2 GRIB-reader test package."""
 
 import datetime
+import itertools
 import sys
 from unittest import mock
 
@@ -40,6 +41,7 @@ FAKE_SEVIRI_MESSAGE = {
     "XpInGridLengths": 500,
     "parameterNumber": 30,
     "missingValue": 9999,
+    "offset": 0,
 }
 
 FAKE_FCI_MESSAGE = {
@@ -54,6 +56,7 @@ FAKE_FCI_MESSAGE = {
     "XpInGridLengths": 2784.0,
     "parameterNumber": 30,
     "missingValue": 9999,
+    "offset": 0,
 }
 
 # List to be used as fake GID source
@@ -69,16 +72,20 @@ def setup_reader(ec_):
     return ec_
 
 
+def _reset_fake_gids(ec_):
+    """Restart the fake GID source and clear the call history."""
+    fake_gid_generator = itertools.cycle(FAKE_GID)
+    ec_.codes_grib_new_from_file.side_effect = lambda fh: next(fake_gid_generator)
+    ec_.codes_grib_new_from_file.reset_mock()
+    ec_.codes_release.reset_mock()
+
+
 def common_checks(ec_, reader, mock_file, dataset_id):
     """Commmon checks for fci and seviri data."""
     # Checks that the codes_grib_multi_support_on function has been called
     ec_.codes_grib_multi_support_on.assert_called()
 
-    # Restarts the id generator and clears the call history
-    fake_gid_generator = (i for i in FAKE_GID)
-    ec_.codes_grib_new_from_file.side_effect = lambda fh: next(fake_gid_generator)
-    ec_.codes_grib_new_from_file.reset_mock()
-    ec_.codes_release.reset_mock()
+    _reset_fake_gids(ec_)
 
     # Checks the correct execution of the get_dataset function with a valid parameter_number
     valid_dataset = reader.get_dataset(dataset_id, {"parameter_number": 30})
@@ -87,22 +94,21 @@ def common_checks(ec_, reader, mock_file, dataset_id):
     # Checks that the dataset has been created as a DataArray object
     assert valid_dataset._extract_mock_name() == "xr.DataArray()"
     # Checks that codes_release has been called after each codes_grib_new_from_file call
-    # (except after the last one which has returned a None)
+    # (except after the last one of the index scan which has returned a None)
     assert ec_.codes_grib_new_from_file.call_count == ec_.codes_release.call_count + 1
+    # All fake fields share the same offset, so the last one is read after skipping the first three
+    ec_.codes_grib_multi_support_reset_file.assert_called()
+    assert ec_.codes_grib_new_from_file.call_count == len(FAKE_GID) + len(FAKE_GID) - 1
 
-    # Restarts the id generator and clears the call history
-    fake_gid_generator = (i for i in FAKE_GID)
-    ec_.codes_grib_new_from_file.side_effect = lambda fh: next(fake_gid_generator)
-    ec_.codes_grib_new_from_file.reset_mock()
-    ec_.codes_release.reset_mock()
+    _reset_fake_gids(ec_)
 
     # Checks the correct execution of the get_dataset function with an invalid parameter_number
     invalid_dataset = reader.get_dataset(dataset_id, {"parameter_number": 50})
     # Checks that the function returns None
     assert invalid_dataset is None
-    # Checks that codes_release has been called after each codes_grib_new_from_file call
-    # (except after the last one which has returned a None)
-    assert ec_.codes_grib_new_from_file.call_count == ec_.codes_release.call_count + 1
+    # Checks that the message index has been reused instead of reading the file again
+    ec_.codes_grib_new_from_file.assert_not_called()
+    ec_.codes_release.assert_not_called()
 
 
 @pytest.mark.skipif(sys.platform.startswith("win"), reason="'eccodes' not supported on Windows")
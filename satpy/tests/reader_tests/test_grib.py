@@ -341,3 +341,80 @@ class TestGRIBReader:
 
         np.testing.assert_allclose(fake_gribdata(), dataset[query_not_contains].values)
         np.testing.assert_allclose(fake_gribdata(), dataset[query_contains].values[::-1])
+
+    def test_load_from_message_offsets(self, tmp_path):
+        """Check that messages are read directly from their offset in the file."""
+        from satpy.readers.core.loading import load_reader
+        fake_pygrib = FakeGRIB()
+        filename = tmp_path / "gfs.t18z.sfluxgrbf106.grib2"
+        filename.write_bytes(_fake_grib_file_content([b"msg0", b"message1", b"m2"]))
+        messages_by_payload = dict(zip([b"msg0", b"message1", b"m2"], fake_pygrib._messages))
+
+        with mock.patch("satpy.readers.grib.pygrib") as pg:
+            pg.open.return_value = fake_pygrib
+            pg.fromstring.side_effect = lambda buf: messages_by_payload[buf[16:-4]]
+            r = load_reader(self.reader_configs)
+            loadables = r.select_files_from_pathnames([str(filename)])
+            r.create_filehandlers(loadables)
+            datasets = r.load([DataQuery(name="t", level=200, modifiers=tuple())])
+
+        assert pg.fromstring.call_count > 0
+        assert all(call.args[0][16:-4] == b"message1" for call in pg.fromstring.call_args_list)
+        np.testing.assert_allclose(fake_gribdata(), datasets["t"].values[::-1])
+
+    def test_cached_message_index(self, tmp_path):
+        """Check that the message index is stored in the cache directory and reused."""
+        import satpy
+        from satpy.readers.grib import GRIBFileHandler
+        filename = tmp_path / "gfs.t18z.sfluxgrbf106.grib2"
+        filename.write_bytes(_fake_grib_file_content([b"msg0", b"message1", b"m2"]))
+        cache_dir = tmp_path / "cache"
+
+        with mock.patch("satpy.readers.grib.pygrib") as pg, \
+                satpy.config.set(cache_dir=str(cache_dir), readers={"cache_grib_index": True}):
+            pg.open.return_value = FakeGRIB()
+            fh1 = GRIBFileHandler(str(filename), {}, {"file_type": "grib"})
+            pg.open.reset_mock()
+            fh2 = GRIBFileHandler(str(filename), {}, {"file_type": "grib"})
+
+        pg.open.assert_not_called()
+        assert len(list((cache_dir / "grib_index").glob("*.json"))) == 1
+        assert fh1._index == fh2._index
+        assert [msg_info["offset"] for msg_info in fh2._index] == [0, 24, 52]
+        assert fh2.start_time == fh1.start_time
+
+
+def _fake_grib_file_content(payloads):
+    """Create fake GRIB edition 2 messages, only the indicator section and end marker are valid."""
+    content = b""
+    for payload in payloads:
+        length = 16 + len(payload) + 4
+        content += b"GRIB\x00\x00\x00\x02" + length.to_bytes(8, "big") + payload + b"7777"
+    return content
+
+
+@pytest.mark.parametrize(
+    ("content", "exp_messages"),
+    [
+        (_fake_grib_file_content([b"abc", b"defgh"]), [(0, 23), (23, 25)]),
+        (b"junk" + _fake_grib_file_content([b"abc"]) + b"\x00\x00" + _fake_grib_file_content([b"x"]),
+         [(4, 23), (29, 21)]),
+        (b"", []),
+    ],
+)
+def test_scan_grib_messages(tmp_path, content, exp_messages):
+    """Test finding the offsets and lengths of GRIB messages."""
+    from satpy.readers.core.grib import scan_grib_messages
+    filename = tmp_path / "test.grib"
+    filename.write_bytes(content)
+    with open(filename, "rb") as fh:
+        assert scan_grib_messages(fh) == exp_messages
+
+
+def test_scan_grib_messages_bad_length(tmp_path):
+    """Test that messages with an inconsistent length are not indexed."""
+    from satpy.readers.core.grib import scan_grib_messages
+    filename = tmp_path / "test.grib"
+    filename.write_bytes(_fake_grib_file_content([b"abc"])[:-1])
+    with open(filename, "rb") as fh, pytest.raises(ValueError, match="Unexpected end"):
+        scan_grib_messages(fh)
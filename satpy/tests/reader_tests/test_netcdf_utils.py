@@ -33,11 +33,10 @@ class FakeNetCDF4FileHandler(NetCDF4FileHandler):
                  cache_var_size=0, cache_handle=False, extra_file_content=None):
         """Get fake file content from 'get_test_content'."""
         # unused kwargs from the real file handler
-        del auto_maskandscale
-        del xarray_kwargs
         del cache_var_size
         del cache_handle
         super(NetCDF4FileHandler, self).__init__(filename, filename_info, filetype_info)
+        self._set_xarray_kwargs(xarray_kwargs, auto_maskandscale)
         self.file_content = self.get_test_content(filename, filename_info, filetype_info)
         if extra_file_content:
             self.file_content.update(extra_file_content)
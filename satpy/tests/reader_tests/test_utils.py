@@ -431,6 +431,25 @@ class TestHelpers:
         with pytest.raises(KeyError):
             hf.get_user_calibration_factors("IR108", radcor_dict)
 
+    @pytest.mark.parametrize(
+        ("shape", "rows_per_scan", "low_res_multiplier", "chunk_size", "exp_chunks"),
+        [
+            ((768, 3200), 16, 1, 16 * 3200 * 4 * 3, (48, 3200)),
+            ((768, 3200), 16, 1, 1, (16, 3200)),
+            ((40, 3200), 16, 1, 2 ** 30, (40, 3200)),
+            ((12000, 409), 1, 1, 409 * 4 * 100, (100, 409)),
+            ((2, 2030, 1354), 10, 1, 10 * 1354 * 4 * 4, (1, 40, 1354)),
+            ((2030, 1354), 10, 4, 40 * 5416 * 4 * 2, (20, 1354)),
+        ],
+    )
+    def test_get_scan_aligned_chunks(self, shape, rows_per_scan, low_res_multiplier, chunk_size, exp_chunks):
+        """Test that chunks only ever contain whole scans."""
+        import dask.config
+        with dask.config.set({"array.chunk-size": chunk_size}):
+            chunks = hf.get_scan_aligned_chunks(shape, rows_per_scan, np.float32,
+                                                low_res_multiplier=low_res_multiplier)
+        assert chunks == exp_chunks
+
 
 class TestSunEarthDistanceCorrection:
     """Tests for applying Sun-Earth distance correction to reflectance."""
@@ -2469,6 +2469,38 @@ class TestCompact:
             assert ds.compute().shape == (752, 4064)
             assert ds.attrs["rows_per_scan"] == 16
 
+    def _load_lons(self):
+        from satpy.readers.viirs_compact import VIIRSCompactFileHandler
+        from satpy.tests.utils import make_dataid
+
+        test = VIIRSCompactFileHandler(self.filename, {}, {"file_type": "compact_dnb"})
+        dsid = make_dataid(name="longitude_dnb")
+        lons = test.get_dataset(dsid, {"standard_name": "longitude"})
+        return lons.data, lons.compute()
+
+    def test_get_dataset_scan_chunks(self):
+        """Check that the expanded datasets are chunked by whole scans."""
+        import dask
+
+        _, exp_lons = self._load_lons()
+        with dask.config.set({"array.chunk-size": "4MiB"}):
+            lons_arr, lons = self._load_lons()
+        assert len(lons_arr.chunks[0]) > 1
+        assert all(row_chunk % 16 == 0 for row_chunk in lons_arr.chunks[0])
+        np.testing.assert_allclose(lons, exp_lons)
+
+    def test_cached_navigation(self, tmp_path):
+        """Check that the expanded navigation can be cached on disk."""
+        import satpy
+
+        _, exp_lons = self._load_lons()
+        with satpy.config.set(cache_dir=str(tmp_path), readers={"cache_interpolated_navigation": True}):
+            self._load_lons()
+            lons_arr, lons = self._load_lons()
+        assert len(list(tmp_path.glob("interpolated_navigation_*.zarr"))) == 2
+        assert lons_arr.name.startswith("from-zarr")
+        np.testing.assert_allclose(lons, exp_lons)
+
     def test_distributed(self):
         """Check that distributed computations work."""
         from dask.distributed import Client
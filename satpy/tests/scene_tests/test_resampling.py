@@ -331,9 +331,9 @@ class TestSceneResampling:
             # once for default (reduce_data=True)
             # once for kwarg forced to `True`
             assert slice_data.call_count == 2 * 3
-            # get area slices is called again, once per area
-            assert get_area_slices.call_count == 2
-            assert get_area_slices_big.call_count == 2
+            # get area slices are reused from the first call
+            assert get_area_slices.call_count == 1
+            assert get_area_slices_big.call_count == 1
 
     def test_resample_ancillary(self):
         """Test that the Scene reducing data does not affect final output."""
@@ -393,6 +393,34 @@ class TestSceneResampling:
         assert ([av.attrs["name"] for av in sc["test"].attrs["ancillary_variables"]] ==
                 [av.attrs["name"] for av in ls["test"].attrs["ancillary_variables"]])
 
+    @pytest.mark.parametrize("resampler", ["nearest", "bilinear"])
+    def test_resample_batches_datasets(self, resampler):
+        """Test that datasets sharing an area and dtype are resampled in one call."""
+        from pyresample import create_area_def
+
+        from satpy.resample.base import resample_dataset, resample_dataset_batch
+        sc = Scene()
+        n = 10
+        ar = create_area_def("a", 4087, resolution=1000, center=(0, 0), shape=(n, n))
+        for i, dtype in enumerate((np.float32, np.float32, np.float64)):
+            data = da.from_array(np.arange(n * n, dtype=dtype).reshape(n, n) * (i + 1), chunks=5)
+            sc[f"ds{i:d}"] = xr.DataArray(data, dims=("y", "x"), coords={"time": 42 + i},
+                                          attrs={"area": ar, "name": f"ds{i:d}", "units": f"K{i:d}"})
+        dst_area = create_area_def("b", 4087, resolution=800, center=(0, 0), shape=(n - 1, n - 1))
+
+        with mock.patch("satpy.resample.base.resample_dataset_batch", wraps=resample_dataset_batch) as batch:
+            new_sc = sc.resample(dst_area, resampler=resampler)
+        batch.assert_called_once()
+        assert [ds.attrs["name"] for ds in batch.call_args[0][0]] == ["ds0", "ds1"]
+        for i in range(3):
+            expected = resample_dataset(sc[f"ds{i:d}"], dst_area, resampler=resampler)
+            res = new_sc[f"ds{i:d}"]
+            xr.testing.assert_allclose(res, expected)
+            assert res.dtype == expected.dtype
+            assert res.attrs["units"] == f"K{i:d}"
+            assert res.attrs["area"] is dst_area
+            assert res.coords["time"] == 42 + i
+
     def test_resample_reduce_data(self):
         """Test that the Scene reducing data does not affect final output."""
         from pyresample.geometry import AreaDefinition
@@ -558,6 +586,67 @@ class TestSceneResampling:
         assert "ds13" in new_scene
 
 
+class TestResamplePlan:
+    """Test reusing the resampling setup of one Scene for other Scenes."""
+
+    @staticmethod
+    def _create_scene(value, shape=(20, 20)):
+        from pyresample import create_area_def
+        area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=shape)
+        scn = Scene()
+        for name in ("ds1", "ds2"):
+            data = da.full(shape, value, dtype=np.float32, chunks=10)
+            scn[name] = xr.DataArray(data, dims=("y", "x"), attrs={"area": area, "name": name})
+        return scn
+
+    @staticmethod
+    def _dst_area():
+        from pyresample import create_area_def
+        return create_area_def("dst", 4087, resolution=2000, center=(0, 0), shape=(5, 5))
+
+    def test_plan_reused_for_scenes(self):
+        """Test that reductions and neighbours are computed once for all Scenes."""
+        from pyresample.geometry import AreaDefinition
+        from pyresample.kd_tree import XArrayResamplerNN
+
+        from satpy.resample.plan import ResamplePlan
+        scenes = [self._create_scene(value) for value in (1.0, 2.0, 3.0)]
+        with mock.patch.object(AreaDefinition, "get_area_slices", autospec=True,
+                               side_effect=AreaDefinition.get_area_slices) as get_area_slices, \
+                mock.patch.object(XArrayResamplerNN, "get_neighbour_info", autospec=True,
+                                  side_effect=XArrayResamplerNN.get_neighbour_info) as get_neighbour_info:
+            plan = ResamplePlan.from_scene(scenes[0], self._dst_area(), resampler="nearest")
+            resampled = [plan.apply(scn) for scn in scenes]
+            for value, new_scn in zip((1.0, 2.0, 3.0), resampled):
+                assert new_scn["ds1"].attrs["area"] is plan.destination_area
+                np.testing.assert_array_equal(new_scn["ds2"].values, value)
+        assert get_area_slices.call_count == 1
+        assert get_neighbour_info.call_count == 1
+        assert plan.source_areas == {scenes[0]["ds1"].attrs["area"]}
+
+    def test_incompatible_scene(self):
+        """Test that Scenes with other areas are detected."""
+        from satpy.resample.plan import ResamplePlan
+        plan = ResamplePlan.from_scene(self._create_scene(1.0), self._dst_area())
+        other = self._create_scene(1.0, shape=(30, 30))
+        assert plan.is_compatible(self._create_scene(2.0))
+        assert not plan.is_compatible(other)
+        with pytest.raises(ValueError, match="not part of the resample plan"):
+            plan.apply(other)
+
+    def test_multiscene_uses_plan(self):
+        """Test that a MultiScene resamples Scenes with the same areas with one plan."""
+        from satpy import MultiScene
+        from satpy.resample.plan import ResamplePlan
+        scenes = [self._create_scene(1.0), self._create_scene(2.0), self._create_scene(3.0, shape=(30, 30))]
+        with mock.patch.object(ResamplePlan, "apply", autospec=True, side_effect=ResamplePlan.apply) as apply:
+            new_scenes = MultiScene(scenes).resample(self._dst_area()).scenes
+        assert apply.call_count == 2
+        for value, new_scn in zip((1.0, 2.0, 3.0), new_scenes):
+            assert new_scn["ds1"].shape == (5, 5)
+            np.testing.assert_array_equal(new_scn["ds1"].values, value)
+
+
 class TestSceneAggregation:
     """Test the scene's aggregate method."""
 
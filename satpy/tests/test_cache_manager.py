@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Satpy developers
+#
+# This file is part of satpy.
+#
+# satpy is free software: you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# satpy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+# A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# satpy.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the on-disk cache management."""
+
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+import satpy
+from satpy.cache_manager import (
+    STALE_TMP_AGE,
+    atomic_cache_path,
+    cache_cmd,
+    cache_lock,
+    cache_lock_if_missing,
+    enforce_cache_limits,
+    list_cache_entries,
+    parse_size,
+    prune_cache,
+)
+
+
+def _create_entry(cache_dir, name, size, age):
+    """Create a zarr-like cache directory entry last used *age* seconds ago."""
+    path = cache_dir / name
+    path.mkdir()
+    (path / "0").write_bytes(b"x" * size)
+    last_access = time.time() - age
+    os.utime(path, (last_access, last_access))
+    return str(path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Create a cache directory with three entries and an unmanaged file."""
+    _create_entry(tmp_path, "nn_lut-old.zarr", 100, 300)
+    _create_entry(tmp_path, "bil_lut-mid.zarr", 200, 200)
+    _create_entry(tmp_path, "nn_lut-new.zarr", 300, 100)
+    (tmp_path / "other.json").write_text("{}")
+    return tmp_path
+
+
+def test_list_cache_entries(cache_dir):
+    """Test that entries are listed from least to most recently used."""
+    entries = list_cache_entries(cache_dir)
+    assert [os.path.basename(entry.path) for entry in entries] == [
+        "nn_lut-old.zarr", "bil_lut-mid.zarr", "nn_lut-new.zarr"]
+    assert [entry.size for entry in entries] == [100, 200, 300]
+
+
+@pytest.mark.parametrize(
+    ("max_size", "max_age", "remaining"),
+    [
+        (None, None, ["nn_lut-old.zarr", "bil_lut-mid.zarr", "nn_lut-new.zarr"]),
+        (500, None, ["bil_lut-mid.zarr", "nn_lut-new.zarr"]),
+        ("0.4K", None, ["nn_lut-new.zarr"]),
+        (None, 250, ["bil_lut-mid.zarr", "nn_lut-new.zarr"]),
+        (200, 250, []),
+    ]
+)
+def test_prune_cache(cache_dir, max_size, max_age, remaining):
+    """Test removing entries by size and age."""
+    prune_cache(cache_dir, max_size=max_size, max_age=max_age)
+    assert [os.path.basename(entry.path) for entry in list_cache_entries(cache_dir)] == remaining
+    assert (cache_dir / "other.json").exists()
+
+
+def test_prune_cache_groups(cache_dir):
+    """Test that the results of one cached function are listed and removed as one entry."""
+    group = [_create_entry(cache_dir, f"_get_valid_lonlats_v1_{idx}_0a1b.zarr", 100, 400) for idx in range(2)]
+    entries = list_cache_entries(cache_dir)
+    assert entries[0].paths == tuple(group)
+    assert entries[0].size == 200
+    prune_cache(cache_dir, max_size=600)
+    assert not any(os.path.exists(path) for path in group)
+    assert len(list_cache_entries(cache_dir)) == 3
+
+
+def test_prune_cache_keep(cache_dir):
+    """Test that entries to keep are not removed, but still count towards the size limit."""
+    old_entry = str(cache_dir / "nn_lut-old.zarr")
+    removed = prune_cache(cache_dir, max_size=300, max_age=250, keep=[old_entry])
+    assert [os.path.basename(entry.path) for entry in removed] == ["bil_lut-mid.zarr", "nn_lut-new.zarr"]
+    assert os.path.exists(old_entry)
+
+
+def test_prune_cache_dry_run(cache_dir):
+    """Test that a dry run doesn't remove anything."""
+    removed = prune_cache(cache_dir, max_size=0, dry_run=True)
+    assert len(removed) == 3
+    assert len(list_cache_entries(cache_dir)) == 3
+
+
+def test_prune_removes_stale_tmp_entries(cache_dir):
+    """Test that temporary entries of interrupted writes are removed once stale."""
+    stale = _create_entry(cache_dir, ".nn_lut-a.zarr.tmp-1", 10, STALE_TMP_AGE + 10)
+    recent = _create_entry(cache_dir, ".nn_lut-b.zarr.tmp-2", 10, 10)
+    prune_cache(cache_dir)
+    assert not os.path.exists(stale)
+    assert os.path.exists(recent)
+
+
+def test_enforce_cache_limits(cache_dir):
+    """Test that limits are taken from the configuration."""
+    assert enforce_cache_limits(cache_dir) == []
+    with satpy.config.set(cache_max_size=300):
+        removed = enforce_cache_limits(cache_dir)
+    assert len(removed) == 2
+
+
+def test_atomic_cache_path(tmp_path):
+    """Test that entries are only visible once completely written."""
+    path = str(tmp_path / "entry.zarr")
+    with atomic_cache_path(path) as tmp_entry:
+        os.mkdir(tmp_entry)
+        assert not os.path.exists(path)
+        assert list_cache_entries(tmp_path) == []
+    assert os.path.isdir(path)
+    assert os.listdir(tmp_path) == ["entry.zarr"]
+
+
+def test_atomic_cache_path_existing_entry(tmp_path):
+    """Test that an entry published by another process is kept."""
+    path = tmp_path / "entry.zarr"
+    path.mkdir()
+    (path / "0").write_text("first")
+    with atomic_cache_path(str(path)) as tmp_entry:
+        os.mkdir(tmp_entry)
+        with open(os.path.join(tmp_entry, "0"), "w") as fid:
+            fid.write("second")
+    assert (path / "0").read_text() == "first"
+    assert os.listdir(tmp_path) == ["entry.zarr"]
+
+
+def test_atomic_cache_path_error(tmp_path):
+    """Test that nothing is left behind when writing fails."""
+    path = str(tmp_path / "entry.zarr")
+
+    def _failing_write():
+        with atomic_cache_path(path) as tmp_entry:
+            os.mkdir(tmp_entry)
+            raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        _failing_write()
+    assert os.listdir(tmp_path) == []
+
+
+def test_cache_lock(tmp_path):
+    """Test that only one holder of a cache lock runs at a time."""
+    path = str(tmp_path / "entry.zarr")
+    events = []
+
+    def _hold_lock(name):
+        with cache_lock(path):
+            events.append(f"{name} start")
+            time.sleep(0.1)
+            events.append(f"{name} end")
+
+    threads = [threading.Thread(target=_hold_lock, args=(name,)) for name in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [event.split()[1] for event in events] == ["start", "end", "start", "end"]
+    assert os.listdir(tmp_path) == [".entry.zarr.lock"]
+
+
+def test_cache_lock_if_missing(tmp_path):
+    """Test that the lock is only taken for entries that don't exist yet."""
+    (tmp_path / "existing.zarr").mkdir()
+    with cache_lock_if_missing(str(tmp_path / "existing.zarr")):
+        pass
+    with cache_lock_if_missing(str(tmp_path / "missing.zarr")):
+        pass
+    assert sorted(os.listdir(tmp_path)) == [".missing.zarr.lock", "existing.zarr"]
+
+
+def test_prune_removes_stale_lock_files(cache_dir):
+    """Test that old lock files are removed unless their lock is held."""
+    lock_file = cache_dir / ".nn_lut-a.zarr.lock"
+    with cache_lock(str(cache_dir / "nn_lut-a.zarr")):
+        os.utime(lock_file, (time.time() - STALE_TMP_AGE - 10,) * 2)
+        prune_cache(cache_dir)
+        assert lock_file.exists()
+    prune_cache(cache_dir)
+    assert not lock_file.exists()
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [(1024, 1024), ("10", 10), ("2K", 2048), ("1.5M", 1572864), ("10GB", 10 * 1024 ** 3), ("1GiB", 1024 ** 3)]
+)
+def test_parse_size(size, expected):
+    """Test converting sizes to bytes."""
+    assert parse_size(size) == expected
+
+
+def test_cache_cmd(cache_dir, caplog):
+    """Test the command line interface."""
+    with caplog.at_level(logging.INFO):
+        cache_cmd(["--cache-dir", str(cache_dir), "list"])
+    assert "3 entries, 600B in total" in caplog.text
+
+    with caplog.at_level(logging.INFO):
+        cache_cmd(["--cache-dir", str(cache_dir), "prune", "--max-size", "300", "--dry-run"])
+    assert "Would remove 2 entries" in caplog.text
+    assert len(list_cache_entries(cache_dir)) == 3
+
+    with caplog.at_level(logging.INFO):
+        cache_cmd(["--cache-dir", str(cache_dir), "prune", "--max-age", "150"])
+    assert "Removed 2 entries" in caplog.text
+    assert len(list_cache_entries(cache_dir)) == 1
@@ -138,6 +138,27 @@ class TestSunZenithCorrector:
         if as_32bit:
             assert res.dtype == np.float32
 
+    def test_cos_sza_shared_between_bands(self, sunz_ds1):
+        """Test that bands of the same area and time share cos(SZA) and the correction factor."""
+        from satpy.composites.fill import DayNightCompositor
+        from satpy.modifiers.angles import get_angle_cache_info
+        from satpy.modifiers.geometry import SunZenithCorrector, SunZenithReducer
+
+        band2 = sunz_ds1.copy(data=sunz_ds1.data * 2)
+        comp = SunZenithCorrector(name="sza_test", modifiers=tuple())
+        res1 = comp((sunz_ds1,), test_attr="test")
+        res2 = comp((band2,), test_attr="test")
+        SunZenithReducer(name="sza_reduction_test", modifiers=tuple())((sunz_ds1,))
+        DayNightCompositor(name="dn_test")._get_coszen_blending_weights([sunz_ds1, band2])
+        # one miss for the lon/lats and one for cos(SZA)
+        assert get_angle_cache_info().misses == 2
+
+        factor_layers = [{name for name in res.data.dask.layers if name.startswith("_sunzen_corr_cos_factor")}
+                         for res in (res1, res2)]
+        assert len(factor_layers[0]) == 1
+        assert factor_layers[0] == factor_layers[1]
+        np.testing.assert_allclose(res2.values, 2 * res1.values)
+
     @pytest.mark.parametrize("dtype", [np.float32, np.float64])
     def test_basic_lims_not_provided(self, sunz_ds1, dtype):
         """Test custom limits when SZA isn't provided."""
@@ -354,6 +375,32 @@ class TestNIRReflectance:
         with pytest.raises(IncompatibleAreas):
             comp([self.nir, self.ir_], optional_datasets=[sunz], **info)
 
+    def test_calculator_reused_and_chunked(self, tmp_path):
+        """Test that the calculator is created once and the reflectance derived chunk by chunk."""
+        from satpy.modifiers.spectral import Calculator, NIRReflectance
+
+        wavelength = np.linspace(3.5, 4.3, 41)
+        response = np.exp(-((wavelength - 3.9) / 0.15) ** 2)
+        rsr = mock.MagicMock(
+            rsr={"IR3.9": {"det-1": {"wavelength": wavelength, "response": response, "central_wavelength": 3.92}}},
+            unit="micrometer", si_scale=1e-6)
+        nir = self.nir.copy(data=self.nir.data.rechunk(1))
+        comp = NIRReflectance(name="test")
+        with mock.patch("pyspectral.radiance_tb_conversion.RelativeSpectralResponse", return_value=rsr), \
+                mock.patch("pyspectral.near_infrared_reflectance.get_config",
+                           return_value={"tb2rad_dir": str(tmp_path)}), \
+                mock.patch("satpy.modifiers.spectral.Calculator", wraps=Calculator) as calculator:
+            res = comp([self.nir, self.ir_], optional_datasets=[self.sunz])
+            res_chunked = comp([nir, self.ir_], optional_datasets=[self.sunz])
+            exp_res = Calculator("Meteosat-11", "seviri", "IR_039", masking_limit=88.0).reflectance_from_tbs(
+                self.sunz_arr, self.nir_arr, self.ir_.values) * 100
+
+        calculator.assert_called_once()
+        assert res_chunked.data.numblocks == (2, 2)
+        assert res_chunked.dtype == np.float32
+        np.testing.assert_allclose(res_chunked.values, res.values)
+        np.testing.assert_allclose(res.values, exp_res, rtol=1e-6)
+
 
 class TestNIREmissivePartFromReflectance(unittest.TestCase):
     """Test the NIR Emissive part from reflectance compositor."""
@@ -419,6 +466,31 @@ class TestNIREmissivePartFromReflectance(unittest.TestCase):
                                       masking_limit=NIRReflectance.MASKING_LIMIT)
 
 
+@pytest.fixture
+def fake_rayleigh_lut(tmp_path):
+    """Create a small Rayleigh LUT file and spectral response for pyspectral to use.
+
+    Yields the effective wavelength of the fake "B01" band in micrometers.
+
+    """
+    import h5py
+    from pyspectral.utils import get_central_wave
+
+    with h5py.File(tmp_path / "rayleigh_lut_us-standard.h5", "w") as h5f:
+        h5f["wavelengths"] = np.linspace(400., 800., 5)
+        h5f["sun_zenith_secant"] = np.linspace(1., 25., 13)
+        h5f["azimuth_difference"] = np.linspace(0., 180., 7)
+        h5f["satellite_zenith_secant"] = np.linspace(1., 3., 5)
+        h5f["reflectance"] = RANDOM_GEN.uniform(0., 0.5, (5, 13, 7, 5))
+    wavelength = np.linspace(0.45, 0.49, 5)
+    response = np.array([0.2, 1., 1., 1., 0.2])
+    rsr = mock.MagicMock(rsr={"B01": {"det-1": {"wavelength": wavelength, "response": response}}})
+    with mock.patch("pyspectral.rayleigh.get_rayleigh_lut_dir", return_value=tmp_path), \
+            mock.patch("pyspectral.rayleigh.download_luts"), \
+            mock.patch("pyspectral.rayleigh.RelativeSpectralResponse", return_value=rsr):
+        yield get_central_wave(wavelength, response, weight=1. / wavelength ** 4)
+
+
 class TestPSPRayleighReflectance:
     """Test the pyspectral-based Rayleigh correction modifier."""
 
@@ -567,6 +639,65 @@ class TestPSPRayleighReflectance:
             prereqs += angles
         return prereqs, opt_prereqs
 
+    def _get_varying_angles_prereqs(self, name, wavelength, dtype):
+        vis, red, *_ = self._create_test_data(name, wavelength, 1000)
+        angles = []
+        for low, high in ((0., 360.), (0., 80.), (0., 360.), (0., 100.)):
+            angle = RANDOM_GEN.uniform(low, high, vis.shape)
+            angle[0, 0] = np.nan
+            angles.append(vis.copy(data=da.from_array(angle, chunks=2)))
+        return [arr.astype(dtype) for arr in [vis, red] + angles]
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_rayleigh_matches_pyspectral(self, fake_rayleigh_lut, dtype):
+        """Test that the cached corrector gives the same result as pyspectral."""
+        from pyspectral.rayleigh import Rayleigh
+
+        from satpy.modifiers.angles import compute_relative_azimuth
+        from satpy.modifiers.atmosphere import PSPRayleighReflectance
+        ray_cor = PSPRayleighReflectance(name="B01", atmosphere="us-standard", aerosol_type="rayleigh_only")
+        vis, red, sata, satz, suna, sunz = self._get_varying_angles_prereqs("B01", (0.45, 0.47, 0.49), dtype)
+        res = ray_cor([vis, red, sata, satz, suna, sunz])
+
+        corrector = Rayleigh("Himawari-8", "ahi", atmosphere="us-standard", aerosol_type="rayleigh_only")
+        ssadiff = compute_relative_azimuth(sata.data, suna.data)
+        exp = vis.data - corrector.get_reflectance(sunz.data, satz.data, ssadiff, fake_rayleigh_lut, red.data)
+        assert res.dtype == dtype
+        np.testing.assert_allclose(res.values, exp.compute(), rtol=1e-5)
+
+    def test_rayleigh_corrector_created_once(self, fake_rayleigh_lut):
+        """Test that the pyspectral corrector is only created once for several calls."""
+        from satpy.modifiers.atmosphere import PSPRayleighReflectance, _get_rayleigh_corrector
+        ray_cor = PSPRayleighReflectance(name="B01", atmosphere="us-standard", aerosol_type="rayleigh_only")
+        prereqs = self._get_varying_angles_prereqs("B01", (0.45, 0.47, 0.49), np.float32)
+        results = [ray_cor(prereqs).compute() for _ in range(3)]
+        cache_info = _get_rayleigh_corrector.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+        np.testing.assert_array_equal(results[0].values, results[2].values)
+
+    def test_rayleigh_sensor_set(self, fake_rayleigh_lut):
+        """Test that a sensor given as a set shares the corrector of the sensor name."""
+        from satpy.modifiers.atmosphere import PSPRayleighReflectance, _get_rayleigh_corrector
+        ray_cor = PSPRayleighReflectance(name="B01", atmosphere="us-standard", aerosol_type="rayleigh_only")
+        prereqs = self._get_varying_angles_prereqs("B01", (0.45, 0.47, 0.49), np.float32)
+        exp = ray_cor(prereqs).compute()
+        prereqs[0] = prereqs[0].copy()
+        prereqs[0].attrs["sensor"] = {"ahi"}
+        res = ray_cor(prereqs).compute()
+        cache_info = _get_rayleigh_corrector.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+        np.testing.assert_array_equal(res.values, exp.values)
+
+    def test_rayleigh_wavelength_outside_lut(self, fake_rayleigh_lut):
+        """Test that bands unknown to pyspectral and outside the LUT range aren't corrected."""
+        from satpy.modifiers.atmosphere import PSPRayleighReflectance
+        ray_cor = PSPRayleighReflectance(name="B04", atmosphere="us-standard", aerosol_type="rayleigh_only")
+        prereqs = self._get_varying_angles_prereqs("B04", (0.85, 0.86, 0.87), np.float64)
+        res = ray_cor(prereqs)
+        np.testing.assert_array_equal(res.values, prereqs[0].values)
+
 
 class TestPSPAtmosphericalCorrection(unittest.TestCase):
     """Test the pyspectral-based atmospheric correction modifier."""
@@ -604,3 +735,47 @@ class TestPSPAtmosphericalCorrection(unittest.TestCase):
         psp = PSPAtmosphericalCorrection(name="dummy")
         res = psp(projectables=[band])
         res.compute()
+
+    def test_matches_masked_correction(self):
+        """Test that the correction on dask arrays matches pyspectral's masked array correction."""
+        from pyspectral.atm_correction_ir import viewzen_corr
+
+        from satpy.modifiers import PSPAtmosphericalCorrection
+        tbs = RANDOM_GEN.uniform(200., 300., (4, 6)).astype(np.float32)
+        tbs[1, 2] = np.nan
+        satz = np.linspace(0., 95., tbs.size).reshape(tbs.shape)
+        band = xr.DataArray(da.from_array(tbs, chunks=2), dims=("y", "x"),
+                            attrs={"name": "IR_108", "platform_name": "Meteosat-11", "sensor": "seviri"})
+        satz_arr = band.copy(data=da.from_array(satz, chunks=3))
+        psp = PSPAtmosphericalCorrection(name="dummy")
+        res = psp([band], optional_datasets=[satz_arr])
+
+        exp = viewzen_corr(np.ma.masked_invalid(tbs), satz).filled(np.nan)
+        assert res.dtype == np.float32
+        np.testing.assert_allclose(res.values, exp, rtol=1e-6)
+
+    def test_sensor_set(self):
+        """Test that a sensor given as a set is corrected like the sensor name, with one corrector."""
+        from pyspectral.atm_correction_ir import viewzen_corr
+
+        from satpy.modifiers import PSPAtmosphericalCorrection
+        from satpy.modifiers.atmosphere import _get_atmospherical_corrector
+        tbs = RANDOM_GEN.uniform(200., 300., (4, 6))
+        tbs[0, :] = np.nan
+        satz = np.linspace(0., 95., tbs.size).reshape(tbs.shape)
+        psp = PSPAtmosphericalCorrection(name="dummy")
+        results = []
+        for sensor in ("seviri", {"seviri"}):
+            band = xr.DataArray(da.from_array(tbs, chunks=3), dims=("y", "x"),
+                                attrs={"name": "IR_108", "platform_name": "Meteosat-11", "sensor": sensor})
+            satz_arr = band.copy(data=da.from_array(satz, chunks=3))
+            res = psp([band], optional_datasets=[satz_arr])
+            assert isinstance(res.data, da.Array)
+            results.append(res.values)
+
+        cache_info = _get_atmospherical_corrector.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+        exp = viewzen_corr(np.ma.masked_invalid(tbs), satz).filled(np.nan)
+        np.testing.assert_allclose(results[0], exp)
+        np.testing.assert_array_equal(results[1], results[0])
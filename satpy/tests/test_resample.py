@@ -20,6 +20,7 @@ import os
 import shutil
 import tempfile
 import unittest
+import warnings
 from unittest import mock
 
 import dask.array as da
@@ -28,6 +29,7 @@ import pytest
 import xarray as xr
 from pyproj import CRS
 
+import satpy
 from satpy.resample.native import NativeResampler
 
 
@@ -247,13 +249,61 @@ class TestNativeResampler:
         into that chunk size.
 
         """
-        from satpy.utils import PerformanceWarning
-
         d_arr = da.zeros((6, 20), chunks=3)
-        text = "Array chunk size is not divisible by aggregation factor. Re-chunking to continue native resampling."
-        with pytest.warns(PerformanceWarning, match=text):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
             new_data = NativeResampler._expand_reduce(d_arr, {0: 0.5, 1: 0.5})
         assert new_data.shape == (3, 10)
+        np.testing.assert_array_equal(new_data.compute(), 0)
+
+    def test_expand_reduce_agg_aligned_chunks(self):
+        """Test that rechunking only moves the chunk boundaries to multiples of the factor."""
+        d_arr = da.zeros((4, 3000), chunks=(4, 1001))
+        new_data = NativeResampler._expand_reduce(d_arr, {0: 0.25, 1: 0.25})
+        assert new_data.chunks == ((1,), (250, 250, 250))
+
+    def test_expand_reduce_agg_numpy_aligned_chunks(self):
+        """Test that numpy arrays are chunked aligned to the factor without rechunking."""
+        with mock.patch("satpy.resample.native.CHUNK_SIZE", 3):
+            new_data = NativeResampler._expand_reduce(np.zeros((6, 20)), {0: 0.5, 1: 0.5})
+        assert new_data.chunks == ((2, 1), (2, 1, 1, 2, 2, 1, 1))
+        assert not any(layer.startswith("rechunk") for layer in new_data.dask.layers)
+
+    @pytest.mark.parametrize(
+        ("aggregation", "expected"),
+        [
+            ("mean", [[2.5, 1.5]]),
+            ("min", [[1, 0]]),
+            ("max", [[4, 3]]),
+            ("mode", [[1, 0]]),
+            ("first", [[1, 3]]),
+        ]
+    )
+    def test_expand_reduce_aggregation_integer(self, aggregation, expected):
+        """Test the reductions of integer data."""
+        d_arr = da.from_array(np.array([[1, 1, 3, 0], [4, 4, 3, 0]], dtype=np.uint8), chunks=2)
+        new_data = NativeResampler._expand_reduce(d_arr, {0: .5, 1: .5}, aggregation=aggregation)
+        res = new_data.compute()
+        assert res.dtype == new_data.dtype
+        assert res.dtype == (np.float32 if aggregation == "mean" else np.uint8)
+        np.testing.assert_array_equal(res, expected)
+
+    @pytest.mark.parametrize(
+        ("aggregation", "expected"),
+        [("mean", [7 / 3, np.nan]), ("min", [1.0, np.nan]), ("max", [3.0, np.nan]), ("mode", [3.0, np.nan])]
+    )
+    def test_expand_reduce_aggregation_nan(self, aggregation, expected):
+        """Test that NaNs are ignored by the reductions of float data."""
+        d_arr = da.from_array(np.array([[1, 3, np.nan, np.nan], [np.nan, 3, np.nan, np.nan]], dtype=np.float32))
+        new_data = NativeResampler._expand_reduce(d_arr, {0: .5, 1: .5}, aggregation=aggregation)
+        res = new_data.compute()
+        assert res.dtype == np.float32
+        np.testing.assert_allclose(res[0], expected)
+
+    def test_expand_reduce_unknown_aggregation(self):
+        """Test that unknown aggregations are refused."""
+        with pytest.raises(ValueError, match="Unknown aggregation"):
+            NativeResampler._expand_reduce(self.d_arr, {0: .5, 1: .5}, aggregation="median")
 
     def test_expand_reduce_numpy(self):
         """Test classmethod 'expand_reduce' converts numpy arrays to dask arrays."""
@@ -324,14 +374,239 @@ class TestNativeResampler:
             resampler.resample(ds1)
 
 
-class TestBilinearResampler(unittest.TestCase):
+@pytest.fixture
+def _clear_recent_resamplers():
+    """Release the resamplers kept in memory after the test."""
+    from satpy.resample.base import _recent_resamplers
+    yield
+    _recent_resamplers.clear()
+
+
+@pytest.mark.usefixtures("_clear_recent_resamplers")
+class TestResamplerMemoryCache:
+    """Test keeping resamplers in memory across Scenes."""
+
+    @staticmethod
+    def _get_areas(target_width=10):
+        from pyresample import create_area_def
+        source_area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=(20, 20))
+        target_area = create_area_def("dst", 4087, resolution=2000, center=(0, 0), shape=(10, target_width))
+        return source_area, target_area
+
+    def test_resampler_kept_across_scenes(self):
+        """Test that the indices are computed once and reused by new area instances."""
+        import gc
+
+        from satpy.resample.base import prepare_resampler
+        with satpy.config.set(resampler_cache_size="1M"):
+            _, resampler = prepare_resampler(*self._get_areas())
+            resampler.precompute()
+            cache = resampler._index_caches[None]
+            assert all(isinstance(val, np.ndarray) for val in cache.values())
+            assert resampler.cache_nbytes == sum(val.nbytes for val in cache.values())
+            resampler_id = id(resampler)
+            del resampler
+            gc.collect()
+
+            _, resampler = prepare_resampler(*self._get_areas())
+            assert id(resampler) == resampler_id
+            with mock.patch.object(resampler.resampler, "get_neighbour_info") as get_neighbour_info:
+                resampler.precompute()
+            get_neighbour_info.assert_not_called()
+
+    def test_least_recently_used_released(self):
+        """Test that resamplers are released when the byte budget is exceeded."""
+        from satpy.resample.base import _recent_resamplers, prepare_resampler
+        with satpy.config.set(resampler_cache_size=2000):
+            for width in (10, 11, 12):
+                _, resampler = prepare_resampler(*self._get_areas(width))
+                resampler.precompute()
+            assert 1000 < resampler.cache_nbytes < 2000
+            assert len(_recent_resamplers) == 2
+            assert [key[2].width for key in _recent_resamplers] == [11, 12]
+
+    def test_budget_applied_after_precompute(self):
+        """Test that a resampler is released as soon as its precomputed indices exceed the budget."""
+        from satpy.resample.base import _recent_resamplers, resample
+        source_area, target_area = self._get_areas()
+        data = xr.DataArray(da.zeros(source_area.shape), dims=("y", "x"), attrs={"area": source_area})
+        with satpy.config.set(resampler_cache_size=1000):
+            resample(source_area, data, target_area)
+        assert len(_recent_resamplers) == 0
+
+    def test_disabled_by_default(self):
+        """Test that no resamplers are kept by default."""
+        from satpy.resample.base import _recent_resamplers, prepare_resampler
+        _, resampler = prepare_resampler(*self._get_areas())
+        resampler.precompute()
+        assert len(_recent_resamplers) == 0
+        assert resampler._index_caches == {}
+
+
+class TestChunkedKDTreeResampler:
+    """Test the nearest neighbour resampler searching neighbours per output chunk."""
+
+    @staticmethod
+    def _get_data():
+        from pyresample import create_area_def
+        source_area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=(300, 300))
+        target_area = create_area_def("dst", 4326, resolution=0.015, center=(0.5, 0.2), shape=(150, 170))
+        data = xr.DataArray(da.from_array(np.arange(2 * 300 * 300, dtype=np.float32).reshape(2, 300, 300),
+                                          chunks=(1, 100, 100)),
+                            dims=("bands", "y", "x"), attrs={"area": source_area})
+        return data, source_area, target_area
+
+    @mock.patch("satpy.resample.kdtree.CHUNK_SIZE", 64)
+    def test_matches_kdtree(self):
+        """Test that the result is the same as with one KD-tree for the whole source."""
+        from satpy.resample.kdtree import ChunkedKDTreeResampler, KDTreeResampler
+        data, source_area, target_area = self._get_data()
+        resampler = ChunkedKDTreeResampler(source_area, target_area)
+        res = resampler.resample(data)
+        expected = KDTreeResampler(source_area, target_area).resample(data)
+        assert res.data.chunks == ((2,), (64, 64, 22), (64, 64, 42))
+        # every output chunk only uses a part of the source
+        assert all(window[0].stop - window[0].start < 150 for row_windows in resampler._windows
+                   for window in row_windows)
+        np.testing.assert_array_equal(res.values, expected.values)
+
+    def test_no_overlap(self):
+        """Test that chunks outside of the source area are filled."""
+        from satpy.resample.kdtree import ChunkedKDTreeResampler
+        data, source_area, target_area = self._get_data()
+        target_area = target_area.copy(area_extent=(40.0, 40.0, 50.0, 50.0))
+        with mock.patch("satpy.resample.kdtree._get_window_neighbours") as get_window_neighbours:
+            res = ChunkedKDTreeResampler(source_area, target_area).resample(data.astype(np.uint8))
+        get_window_neighbours.assert_not_called()
+        assert (res.values == 255).all()
+
+    def test_cache_dir(self, tmp_path):
+        """Test that the neighbours are cached on disk and reused."""
+        from satpy.resample.kdtree import ChunkedKDTreeResampler
+        data, source_area, target_area = self._get_data()
+        expected = ChunkedKDTreeResampler(source_area, target_area).resample(data).values
+        ChunkedKDTreeResampler(source_area, target_area).resample(data, cache_dir=str(tmp_path))
+        assert len(list(tmp_path.glob("nn_chunked_lut-*.zarr"))) == 1
+
+        resampler = ChunkedKDTreeResampler(source_area, target_area)
+        with mock.patch("satpy.resample.kdtree._get_window_neighbours") as get_window_neighbours:
+            res = resampler.resample(data, cache_dir=str(tmp_path))
+        get_window_neighbours.assert_not_called()
+        np.testing.assert_array_equal(res.values, expected)
+        assert resampler.cache_nbytes == 4 * 150 * 170
+
+    def test_swath_source(self):
+        """Test that swath sources are refused."""
+        from pyresample.geometry import SwathDefinition
+
+        from satpy.resample.kdtree import ChunkedKDTreeResampler
+        _, _, target_area = self._get_data()
+        lons, lats = target_area.get_lonlats()
+        with pytest.raises(ValueError, match="AreaDefinition"):
+            ChunkedKDTreeResampler(SwathDefinition(lons, lats), target_area).precompute()
+
+
+class TestGeostationaryNearestResampler:
+    """Test the nearest neighbour resampler for geostationary data."""
+
+    @staticmethod
+    def _get_data():
+        from pyresample import create_area_def
+        source_area = create_area_def(
+            "geos", {"proj": "geos", "lon_0": 0.0, "h": 35785831.0, "ellps": "WGS84"},
+            area_extent=(-5570248.0, -5567248.0, 5567248.0, 5570248.0), shape=(100, 100))
+        target_area = create_area_def("eur", 4326, area_extent=(-30.0, 10.0, 40.0, 80.0), shape=(60, 80))
+        data = xr.DataArray(da.from_array(np.arange(2 * 100 * 100, dtype=np.float32).reshape(2, 100, 100),
+                                          chunks=(1, 50, 50)),
+                            dims=("bands", "y", "x"), coords={"bands": ["R", "G"]}, attrs={"area": source_area})
+        return data, source_area, target_area
+
+    def test_matches_kdtree(self):
+        """Test that the result is almost the same as with the KD-tree resampler."""
+        from satpy.resample.geos import GeostationaryNearestResampler
+        from satpy.resample.kdtree import KDTreeResampler
+        data, source_area, target_area = self._get_data()
+        target_area = target_area.copy(area_extent=(-20.0, -20.0, 20.0, 20.0))
+        res = GeostationaryNearestResampler(source_area, target_area).resample(data)
+        expected = KDTreeResampler(source_area, target_area).resample(data)
+        assert res.dims == ("bands", "y", "x")
+        assert res.dtype == np.float32
+        np.testing.assert_array_equal(res.coords["bands"], ["R", "G"])
+        assert not np.isnan(res.values).any()
+        # only pixels close to the boundaries of source pixels may differ
+        assert (res.values != expected.values).mean() < 0.05
+
+    def test_tasks_read_source_windows(self):
+        """Test that every target chunk only gets the source pixels its indices refer to."""
+        from satpy.resample import geos
+        data, source_area, target_area = self._get_data()
+        target_area = target_area.copy(area_extent=(-20.0, -20.0, 20.0, 20.0))
+        expected = geos.GeostationaryNearestResampler(source_area, target_area).resample(data).values
+
+        source_shapes = []
+        sample_chunk = geos._sample_chunk
+
+        def _sample_chunk(rows, cols, src, fill_value):
+            source_shapes.append(src.shape)
+            return sample_chunk(rows, cols, src, fill_value)
+
+        with mock.patch("satpy.resample.geos.CHUNK_SIZE", 20), \
+                mock.patch("satpy.resample.geos._sample_chunk", _sample_chunk):
+            res = geos.GeostationaryNearestResampler(source_area, target_area).resample(data)
+            assert res.chunks[1:] == ((20, 20, 20), (20, 20, 20, 20))
+            np.testing.assert_array_equal(res.values, expected)
+        # one task per band and target chunk, each reading a small part of the 100x100 disk
+        assert len(source_shapes) == 2 * 3 * 4
+        assert max(shape[-2] * shape[-1] for shape in source_shapes) < 100 * 100 / 20
+
+    def test_integer_fill_value(self):
+        """Test that integer data is filled with the maximum value of its type."""
+        from satpy.resample.geos import GeostationaryNearestResampler
+        data, source_area, target_area = self._get_data()
+        target_area = target_area.copy(area_extent=(-170.0, 10.0, -100.0, 80.0))
+        res = GeostationaryNearestResampler(source_area, target_area).resample(data.astype(np.uint16))
+        assert res.dtype == np.uint16
+        assert (res.values == np.iinfo(np.uint16).max).all()
+
+    def test_non_geos_source(self):
+        """Test that other source projections are refused."""
+        from satpy.resample.geos import GeostationaryNearestResampler
+        data, _, target_area = self._get_data()
+        with pytest.raises(ValueError, match="geostationary"):
+            GeostationaryNearestResampler(target_area, data.attrs["area"]).precompute()
+
+    def test_cache_dir(self, tmp_path):
+        """Test that the indices are cached on disk and reused."""
+        from satpy.resample.geos import GeostationaryNearestResampler
+        data, source_area, target_area = self._get_data()
+        expected = GeostationaryNearestResampler(source_area, target_area).resample(data).values
+
+        res = GeostationaryNearestResampler(source_area, target_area).resample(data, cache_dir=str(tmp_path))
+        np.testing.assert_array_equal(res.values, expected)
+        assert len(list(tmp_path.glob("geos_nn_lut-*.zarr"))) == 1
+
+        resampler = GeostationaryNearestResampler(source_area, target_area)
+        with mock.patch("satpy.resample.geos._get_chunk_indices") as get_chunk_indices:
+            res = resampler.resample(data, cache_dir=str(tmp_path))
+        get_chunk_indices.assert_not_called()
+        np.testing.assert_array_equal(res.values, expected)
+        assert resampler.cache_nbytes == 2 * 4 * 60 * 80
+
+    def test_registered(self):
+        """Test that the resampler can be used by name."""
+        from satpy.resample.base import get_all_resampler_classes
+        from satpy.resample.geos import GeostationaryNearestResampler
+        assert get_all_resampler_classes()["geos_nearest"] is GeostationaryNearestResampler
+
+
+class TestBilinearResampler:
     """Test the bilinear resampler."""
 
     @mock.patch("satpy.resample.kdtree._move_existing_caches")
     @mock.patch("satpy.resample.kdtree.BilinearResampler._create_cache_filename")
     @mock.patch("pyresample.bilinear.XArrayBilinearResampler")
     def test_bil_resampling(self, xr_resampler, create_filename,
-                            move_existing_caches):
+                            move_existing_caches, tmp_path):
         """Test the bilinear resampler."""
         from satpy.resample.kdtree import BilinearResampler
         data, source_area, swath_data, source_swath, target_area = get_test_data()
@@ -361,49 +636,45 @@ class TestBilinearResampler(unittest.TestCase):
         assert target_area.crs == new_data.coords["crs"].item()
 
         # Test that the resampling info is tried to read from the disk
+        the_dir = str(tmp_path)
+        zarr_file = os.path.join(the_dir, "test_cache.zarr")
+        create_filename.return_value = zarr_file
         resampler = BilinearResampler(source_swath, target_area)
-        resampler.precompute(cache_dir=".")
+        resampler.precompute(cache_dir=the_dir)
         resampler.resampler.load_resampling_info.assert_called()
 
         # Test caching the resampling info
-        try:
-            the_dir = tempfile.mkdtemp()
-            resampler = BilinearResampler(source_area, target_area)
-            create_filename.return_value = os.path.join(the_dir, "test_cache.zarr")
-            xr_resampler.return_value.load_resampling_info.side_effect = IOError
-
-            resampler.precompute(cache_dir=the_dir)
-            resampler.resampler.save_resampling_info.assert_called()
-            # assert data was saved to the on-disk cache
-            resampler.resampler.save_resampling_info.assert_called_once()
-
-            nbcalls = resampler.resampler.get_bil_info.call_count
-            resampler.resampler.load_resampling_info.side_effect = None
-
-            resampler.precompute(cache_dir=the_dir)
-            # we already have things cached in-memory, no need to save again
-            resampler.resampler.save_resampling_info.assert_called_once()
-            # we already have things cached in-memory, don't need to load
-            assert resampler.resampler.get_bil_info.call_count == nbcalls
-
-            # test loading saved resampler
-            resampler = BilinearResampler(source_area, target_area)
-            resampler.precompute(cache_dir=the_dir)
-            assert resampler.resampler.load_resampling_info.call_count == 3
-            assert resampler.resampler.get_bil_info.call_count == nbcalls
-
-            resampler = BilinearResampler(source_area, target_area)
-            resampler.precompute(cache_dir=the_dir)
+        resampler = BilinearResampler(source_area, target_area)
+        xr_resampler.return_value.load_resampling_info.side_effect = IOError
+
+        resampler.precompute(cache_dir=the_dir)
+        resampler.resampler.save_resampling_info.assert_called()
+        # assert data was saved to the on-disk cache
+        resampler.resampler.save_resampling_info.assert_called_once()
+
+        nbcalls = resampler.resampler.get_bil_info.call_count
+        resampler.resampler.load_resampling_info.side_effect = None
+
+        resampler.precompute(cache_dir=the_dir)
+        # we already have things cached in-memory, no need to save again
+        resampler.resampler.save_resampling_info.assert_called_once()
+        # we already have things cached in-memory, don't need to load
+        assert resampler.resampler.get_bil_info.call_count == nbcalls
+
+        # test loading saved resampler
+        resampler = BilinearResampler(source_area, target_area)
+        resampler.precompute(cache_dir=the_dir)
+        assert resampler.resampler.load_resampling_info.call_count == 3
+        assert resampler.resampler.get_bil_info.call_count == nbcalls
+
+        resampler = BilinearResampler(source_area, target_area)
+        resampler.precompute(cache_dir=the_dir)
+        resampler.save_bil_info(cache_dir=the_dir)
+        # Save again faking the cache file already exists
+        with mock.patch("os.path.exists") as exists:
+            exists.return_value = True
             resampler.save_bil_info(cache_dir=the_dir)
-            zarr_file = os.path.join(the_dir, "test_cache.zarr")
-            # Save again faking the cache file already exists
-            with mock.patch("os.path.exists") as exists:
-                exists.return_value = True
-                resampler.save_bil_info(cache_dir=the_dir)
-            move_existing_caches.assert_called_once_with(the_dir, zarr_file)
-
-        finally:
-            shutil.rmtree(the_dir)
+        move_existing_caches.assert_called_once_with(the_dir, zarr_file)
 
     def test_move_existing_caches(self):
         """Test that existing caches are moved to a subdirectory."""
@@ -683,6 +954,76 @@ class TestBucketFraction(unittest.TestCase):
         assert np.all(res.coords["categories"] == np.array([0, 1, 2]))
 
 
+@pytest.mark.parametrize(("mask_area", "dims", "batched"),
+                         [(None, ("y", "x"), False),
+                          (False, ("y", "x"), True),
+                          (False, ("x", "y"), False)])
+def test_get_batch_key_swath_nearest(mask_area, dims, batched):
+    """Test that swath data is only batched for nearest neighbour when the area isn't masked."""
+    from satpy.resample.base import get_batch_key
+    from satpy.resample.kdtree import KDTreeResampler
+    source_area, target_area, data = _get_bucket_test_data()
+    dataset = xr.DataArray(data[0], dims=dims)
+    key = get_batch_key(dataset, KDTreeResampler(source_area, target_area), mask_area=mask_area)
+    assert (key is not None) == batched
+
+
+def test_get_batch_key_ewa():
+    """Test that datasets resampled with EWA aren't batched, EWA splits the bands again."""
+    from pyresample.ewa import DaskEWAResampler
+
+    from satpy.resample.base import get_batch_key
+    source_area, target_area, data = _get_bucket_test_data()
+    dataset = xr.DataArray(data[0], dims=("y", "x"))
+    assert get_batch_key(dataset, DaskEWAResampler(source_area, target_area)) is None
+
+
+def _get_bucket_test_data():
+    """Get a swath, a target area and 3D data with missing values for bucket resampling."""
+    from pyresample.geometry import AreaDefinition, SwathDefinition
+    lons, lats = np.meshgrid(np.linspace(-2.0, 2.0, 40), np.linspace(48.0, 52.0, 30))
+    source_area = SwathDefinition(xr.DataArray(da.from_array(lons, chunks=10), dims=("y", "x")),
+                                  xr.DataArray(da.from_array(lats, chunks=10), dims=("y", "x")))
+    target_area = AreaDefinition("test", "test", "test", "EPSG:4326", 8, 6, (-1.5, 48.5, 1.5, 51.5))
+    rng = np.random.default_rng(42)
+    data = rng.random((3,) + lons.shape)
+    data[0, :5, :5] = np.nan
+    data[2, ::7, ::3] = np.nan
+    return source_area, target_area, da.from_array(data, chunks=(1, 10, 10))
+
+
+def test_bucket_indices_are_reused():
+    """Test that the bucket indices are computed once per resampler."""
+    from pyresample.bucket import BucketResampler
+
+    from satpy.resample.bucket import BucketAvg
+    source_area, target_area, data = _get_bucket_test_data()
+    bucket = BucketAvg(source_area, target_area)
+    with mock.patch("pyresample.bucket.BucketResampler", wraps=BucketResampler) as bucket_cls:
+        for i in range(data.shape[0]):
+            bucket.resample(xr.DataArray(data[i], dims=("y", "x")))
+    bucket_cls.assert_called_once()
+
+
+def test_bucket_indices_cache_dir(tmp_path):
+    """Test that the bucket indices are stored in and loaded from the cache directory."""
+    from satpy.resample.bucket import BucketAvg
+    source_area, target_area, data = _get_bucket_test_data()
+    data_arr = xr.DataArray(data[0], dims=("y", "x"))
+    expected = BucketAvg(source_area, target_area).resample(data_arr)
+
+    first = BucketAvg(source_area, target_area).resample(data_arr, cache_dir=str(tmp_path))
+    cache_files = list(tmp_path.glob("bucket_lut-*.zarr"))
+    assert len(cache_files) == 1
+
+    bucket = BucketAvg(source_area, target_area)
+    with mock.patch.object(bucket, "save_bucket_indices") as save:
+        second = bucket.resample(data_arr, cache_dir=str(tmp_path))
+    save.assert_not_called()
+    np.testing.assert_allclose(first, expected)
+    np.testing.assert_allclose(second, expected)
+
+
 @pytest.mark.parametrize("name",
                          ["KDTreeResampler",
                           "BilinearResampler",
@@ -706,3 +1047,55 @@ def test_moved_import_warns(name):
     import satpy.resample
     with pytest.warns(UserWarning, match=".*has been moved.*"):
         _ = getattr(satpy.resample, name)
+
+
+def test_get_area_slices_cached():
+    """Test that area slices are reused for equal areas."""
+    from pyresample import create_area_def
+    from pyresample.geometry import AreaDefinition
+
+    from satpy.area import get_area_slices
+
+    def _create_areas():
+        source_area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=(20, 20))
+        return source_area, source_area.copy(area_extent=(-5000.0, -5000.0, 5000.0, 5000.0), width=10, height=10)
+
+    with mock.patch.object(AreaDefinition, "get_area_slices", autospec=True,
+                           side_effect=AreaDefinition.get_area_slices) as area_slices:
+        slices = get_area_slices(*_create_areas())
+        assert get_area_slices(*_create_areas()) == slices
+        get_area_slices(*_create_areas(), shape_divisible_by=2)
+    assert slices == (slice(4, 15), slice(4, 15))
+    assert area_slices.call_count == 2
+
+
+def test_get_area_slices_no_overlap_cached():
+    """Test that areas without overlap are remembered too."""
+    from pyresample import create_area_def
+    from pyresample.geometry import AreaDefinition
+
+    from satpy.area import get_area_slices
+    source_area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=(20, 20))
+    other_area = create_area_def("dst", 4326, resolution=1, center=(100, 40), shape=(10, 10))
+    with mock.patch.object(AreaDefinition, "get_area_slices", autospec=True,
+                           side_effect=AreaDefinition.get_area_slices) as area_slices:
+        errors = []
+        for _ in range(2):
+            with pytest.raises(NotImplementedError) as err:
+                get_area_slices(source_area, other_area)
+            errors.append(err.value)
+    assert area_slices.call_count == 1
+    # the cache doesn't keep the raised error and its traceback alive
+    assert errors[0] is not errors[1]
+
+
+def test_get_area_slices_cache_size():
+    """Test that the least recently used slices are dropped."""
+    from pyresample import create_area_def
+
+    from satpy.area import _area_slices_cache, get_area_slices
+    source_area = create_area_def("src", 4087, resolution=1000, center=(0, 0), shape=(20, 20))
+    with mock.patch("satpy.area.AREA_SLICES_CACHE_SIZE", 2):
+        for width in (4, 6, 8):
+            get_area_slices(source_area, source_area.copy(width=width))
+    assert [key[1].width for key in _area_slices_cache] == [6, 8]